@@ -0,0 +1,3 @@
+"""
+    C extensions to provide the sas_gen computations.
+"""
\ No newline at end of file
@@ -0,0 +1,3 @@
+from data_info import *
+from manipulations import *
+from readers import *
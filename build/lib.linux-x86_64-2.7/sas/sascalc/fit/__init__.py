@@ -0,0 +1 @@
+from .AbstractFitEngine import FitHandler
\ No newline at end of file
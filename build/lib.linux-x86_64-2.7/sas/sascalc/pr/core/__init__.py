@@ -0,0 +1,3 @@
+"""
+    C extensions to provide the P(r) inversion computations.
+"""
@@ -0,0 +1,2 @@
+PLUGIN_ID = "DataLoader plug-in 1.0"
+from sas.sasgui.guiframe.local_perspectives.data_loader import *
@@ -0,0 +1,2 @@
+PLUGIN_ID = "Plotting plug-in 1.0"
+from sas.sasgui.guiframe.local_perspectives.plotting import *
@@ -0,0 +1,2 @@
+PLUGIN_ID = "Corfunc Plug-In 0.1"
+from corfunc import *
@@ -0,0 +1,7 @@
+GROUP_ID_IQ_DATA = r"$I(q)$"
+IQ_DATA_LABEL = r"$I_{obs}(q) - Bg$"
+IQ_EXTRAPOLATED_DATA_LABEL = r"$I_{extrap}(q)$"
+
+GROUP_ID_TRANSFORM = r"$\Gamma(x)$"
+TRANSFORM_LABEL1 = r"$\Gamma1(x)$"
+TRANSFORM_LABEL3 = r"$\Gamma3(x)$"
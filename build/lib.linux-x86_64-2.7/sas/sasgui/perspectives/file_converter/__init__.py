@@ -0,0 +1,2 @@
+PLUGIN_ID = "File-Converter Plug-In 1.0"
+from file_converter import *
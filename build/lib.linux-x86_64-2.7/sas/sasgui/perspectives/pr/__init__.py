@@ -0,0 +1,2 @@
+PLUGIN_ID = "P(r) plug-in 1.0"
+from pr import *
\ No newline at end of file
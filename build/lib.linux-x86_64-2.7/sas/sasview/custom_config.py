@@ -0,0 +1,17 @@
+"""
+    Application appearance custom configuration
+"""
+DATAPANEL_WIDTH = -1
+CLEANUP_PLOT = False
+FIXED_PANEL = True
+PLOPANEL_WIDTH = -1
+DATALOADER_SHOW = True
+GUIFRAME_HEIGHT = -1 
+GUIFRAME_WIDTH = -1
+CONTROL_WIDTH = -1
+CONTROL_HEIGHT = -1
+DEFAULT_OPEN_FOLDER = None
+WELCOME_PANEL_SHOW = False
+TOOLBAR_SHOW = True
+DEFAULT_PERSPECTIVE = "Fitting"
+SAS_OPENCL = "None"
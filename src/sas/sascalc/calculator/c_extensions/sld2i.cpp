@@ -157,6 +157,9 @@ void GenI :: genicom(int npoints, double *q, double *I_out){
 	double sumj;
 	double sld_j = 0.0;
 	double count = 0.0;
+	// Keep n_pix unchanged so the object can be evaluated again,
+	// possibly from several threads at once
+	int n_pix = this->n_pix;
 	if (n_pix < 0 ){
 		is_sym = 1;
 		n_pix = n_pix * -1;
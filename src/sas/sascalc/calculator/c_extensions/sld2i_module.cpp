@@ -99,7 +99,11 @@ PyObject * genicom_inputXY(PyObject *, PyObject *args) {
 	void *temp = PyCObject_AsVoidPtr(gen_obj);
 	GenI* s = static_cast<GenI *>(temp);
 
+	// The arrays are not touched by python during the computation so
+	// other threads can run, e.g. to compute other chunks of q
+	Py_BEGIN_ALLOW_THREADS
 	s->genicomXY(npoints, qx, qy, I_out);
+	Py_END_ALLOW_THREADS
 	//return PyCObject_FromVoidPtr(s, del_genicom);
 	return Py_BuildValue("i",1);
 }
@@ -127,7 +131,9 @@ PyObject * genicom_input(PyObject *, PyObject *args) {
 	void *temp = PyCObject_AsVoidPtr(gen_obj);
 	GenI* s = static_cast<GenI *>(temp);
 
+	Py_BEGIN_ALLOW_THREADS
 	s->genicom(npoints, q, I_out);
+	Py_END_ALLOW_THREADS
 	//return PyCObject_FromVoidPtr(s, del_genicom);
 	return Py_BuildValue("i",1);
 }
@@ -4,7 +4,6 @@ SAS generic computation and sld file readers
 """
 from __future__ import print_function
 
-import sas.sascalc.calculator.core.sld2i as mod
 from sas.sascalc.calculator.BaseComponent import BaseComponent
 from periodictable import formula
 from periodictable import nsf
@@ -13,14 +12,25 @@ import os
 import copy
 import sys
 import logging
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 
 logger = logging.getLogger(__name__)
 
+try:
+    import sas.sascalc.calculator.core.sld2i as mod
+except ImportError:
+    # GenSAS falls back on the numpy kernels when the extension isn't built
+    logger.warning("sld2i extension not available; using numpy for GenSAS")
+    mod = None
+
 MFACTOR_AM = 2.853E-12
 MFACTOR_MT = 2.3164E-9
 METER2ANG = 1.0E+10
 #Avogadro constant [1/mol]
 NA = 6.02214129e+23
+# Number of (q, pixel) pairs computed at once by the numpy kernels
+_NUMPY_CHUNK_SIZE = 2**18
 
 def mag2sld(mag, v_unit=None):
     """
@@ -47,6 +57,176 @@ def transform_center(pos_x, pos_y, pos_z):
     posz = pos_z - (min(pos_z) + max(pos_z)) / 2.0
     return posx, posy, posz
 
+def _cal_msld(qx, qy, sldn, mx, my, mz, in_spin, out_spin, s_theta):
+    """
+    Numpy version of cal_msld of the sld2i extension (with isangle = 0)
+
+    :param qx, qy: q values as a column vector [1/A]
+    :param sldn, mx, my, mz: nuclear and magnetic sld of the pixels
+    :return: uu, dd, ud, du effective slds for each q and pixel
+    """
+    # Non-magnetic pixels only see the spin fractions
+    nonmag = (np.fabs(mx) < 1.0e-32) & (np.fabs(my) < 1.0e-32) \
+                & (np.fabs(mz) < 1.0e-32)
+    with np.errstate(invalid='ignore'):
+        f_uu0 = np.sqrt(np.sqrt(in_spin * out_spin))
+        f_dd0 = np.sqrt(np.sqrt((1.0 - in_spin) * (1.0 - out_spin)))
+    in_spin = min(max(in_spin, 0.0), 1.0)
+    out_spin = min(max(out_spin, 0.0), 1.0)
+    f_uu = np.sqrt(np.sqrt(in_spin * out_spin))
+    f_dd = np.sqrt(np.sqrt((1.0 - in_spin) * (1.0 - out_spin)))
+    f_ud = np.sqrt(np.sqrt(in_spin * (1.0 - out_spin)))
+    f_du = np.sqrt(np.sqrt((1.0 - in_spin) * out_spin))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        q_angle = np.where(qx == 0.0, np.pi / 2.0, np.arctan(qy / qx))
+    q_angle = np.where((qy < 0.0) & (qx < 0.0), q_angle - np.pi,
+                       np.where((qy > 0.0) & (qx < 0.0),
+                                q_angle + np.pi, q_angle))
+    q_angle = np.pi / 2.0 - q_angle
+    q_angle = np.where(q_angle > np.pi, q_angle - 2.0 * np.pi,
+                       np.where(q_angle < -np.pi,
+                                q_angle + 2.0 * np.pi, q_angle))
+    # The extension passes my and mz as m_theta and m_phi, which cal_msld
+    # uses as the y and z components in that order
+    my, mz = mz, my
+    # No perpendicular magnetization at q = 0
+    m_perp = np.where((np.fabs(qx) < 1.0e-16) & (np.fabs(qy) < 1.0e-16),
+                      0.0, 1.0) * mx
+    m_perp_x = m_perp * np.cos(q_angle) - my * np.sin(q_angle)
+    m_perp_y = m_perp_x * np.sin(-q_angle)
+    m_perp_x = m_perp_x * np.cos(-q_angle)
+    theta = s_theta * np.pi / 180.0
+    m_sigma_x = m_perp_x * np.cos(-theta) - m_perp_y * np.sin(-theta)
+    m_sigma_y = m_perp_x * np.sin(-theta) + m_perp_y * np.cos(-theta)
+
+    uu = np.where(nonmag, f_uu0 * sldn, f_uu * (sldn - m_sigma_x))
+    dd = np.where(nonmag, f_dd0 * sldn, f_dd * (sldn + m_sigma_x))
+    ud = np.where(nonmag, 0.0, f_ud * (m_sigma_y + 1j * mz))
+    du = np.where(nonmag, 0.0, f_du * (m_sigma_y - 1j * mz))
+    return uu, dd, ud, du
+
+def genicom_xy(qx, qy, pos_x, pos_y, sldn, mx, my, mz, vol,
+               in_spin, out_spin, s_theta):
+    """
+    Numpy version of genicomXY of the sld2i extension: 2D (magnetic)
+    scattering of the pixels at each (qx, qy).
+
+    Memory use is proportional to len(qx) * number of pixels, so large
+    detectors should be computed in chunks.
+
+    :return: I(qx, qy) [1/cm]
+    """
+    # Only pixels with some sld contribute, including to the volume
+    keep = (sldn != 0.0) | (mx != 0.0) | (my != 0.0) | (mz != 0.0)
+    pos_x, pos_y, sldn, mx, my, mz, vol = \
+        [np.asarray(v)[keep] for v in (pos_x, pos_y, sldn, mx, my, mz, vol)]
+    qx = np.asarray(qx, 'd')[:, np.newaxis]
+    qy = np.asarray(qy, 'd')[:, np.newaxis]
+    ephase = vol * np.exp(1j * (qx * pos_x + qy * pos_y))
+    uu, dd, ud, du = _cal_msld(qx, qy, sldn, mx, my, mz,
+                               in_spin, out_spin, s_theta)
+    i_out = np.zeros(len(qx))
+    if in_spin > 0.0 and out_spin > 0.0:
+        i_out += np.abs(np.sum(uu * ephase, axis=1))**2
+    if in_spin > 0.0 and out_spin < 1.0:
+        i_out += np.abs(np.sum(ud * ephase, axis=1))**2
+    if in_spin < 1.0 and out_spin > 0.0:
+        i_out += np.abs(np.sum(du * ephase, axis=1))**2
+    if in_spin < 1.0 and out_spin < 1.0:
+        i_out += np.abs(np.sum(dd * ephase, axis=1))**2
+    return i_out * (1.0E+8 / np.sum(vol))
+
+def genicom_1d(q, pos_x, pos_y, pos_z, sldn, vol, is_sym=False):
+    """
+    Numpy version of genicom of the sld2i extension: orientation averaged
+    scattering of non-magnetic pixels at each q.
+
+    :param is_sym: if True, use the spherical symmetric approximation
+        around the center; otherwise compute the full sum over pixel pairs
+    :return: I(q) [1/cm]
+    """
+    q = np.asarray(q, 'd')
+    weight = sldn * vol
+    count = np.sum(vol)
+    if is_sym:
+        dist = np.sqrt(pos_x**2 + pos_y**2 + pos_z**2)
+        i_out = np.dot(_sinc(q[:, np.newaxis] * dist), weight)**2
+    else:
+        i_out = np.zeros(len(q))
+        n_pix = len(pos_x)
+        block = max(1, _NUMPY_CHUNK_SIZE // max(n_pix, 1))
+        for start in range(0, n_pix, block):
+            stop = min(start + block, n_pix)
+            dist = np.sqrt((pos_x[start:stop, np.newaxis] - pos_x)**2
+                           + (pos_y[start:stop, np.newaxis] - pos_y)**2
+                           + (pos_z[start:stop, np.newaxis] - pos_z)**2)
+            pair_weight = weight[start:stop, np.newaxis] * weight
+            for k, q_k in enumerate(q):
+                i_out[k] += np.sum(pair_weight * _sinc(q_k * dist))
+    return i_out * (1.0E+8 / count)
+
+def _sinc(qr):
+    """
+    sin(qr)/qr, taken as 1 for qr <= 0 as in the sld2i extension
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(qr > 0.0, np.sin(qr) / qr, 1.0)
+
+def pair_distance_histogram(pos_x, pos_y, pos_z, weight, bin_width=0.1):
+    """
+    Histogram of the distances between all pairs of pixels, weighted by
+    the product of the pixel weights (usually sld * volume).
+
+    Pairs are counted in both orders and each pixel is paired with itself
+    at r = 0, so that the Debye sum over all pairs is
+    sum_k hist[k] sin(q r[k]) / (q r[k]).
+
+    :param bin_width: histogram resolution [A]; the error on I(q) grows
+        as q * bin_width
+    :return: r, hist with r the distance at the center of each bin
+    """
+    pos_x = np.asarray(pos_x, 'd')
+    pos_y = np.asarray(pos_y, 'd')
+    pos_z = np.asarray(pos_z, 'd')
+    weight = np.asarray(weight, 'd')
+    n_pix = len(pos_x)
+    if bin_width <= 0:
+        raise ValueError("bin_width must be positive")
+    hist = np.zeros(1)
+    # Self pairs
+    hist[0] = np.sum(weight * weight)
+    block = max(1, _NUMPY_CHUNK_SIZE // max(n_pix, 1))
+    for start in range(0, n_pix, block):
+        stop = min(start + block, n_pix)
+        # Pairs (j, k) with k > j, counted twice
+        dist = np.sqrt((pos_x[start:stop, np.newaxis] - pos_x[start:])**2
+                       + (pos_y[start:stop, np.newaxis] - pos_y[start:])**2
+                       + (pos_z[start:stop, np.newaxis] - pos_z[start:])**2)
+        pair_weight = 2.0 * weight[start:stop, np.newaxis] * weight[start:]
+        upper = np.triu(np.ones(dist.shape, dtype=bool), 1)
+        index = np.floor(dist[upper] / bin_width + 0.5).astype(int)
+        block_hist = np.bincount(index, weights=pair_weight[upper])
+        if len(block_hist) > len(hist):
+            block_hist[:len(hist)] += hist
+            hist = block_hist
+        else:
+            hist[:len(block_hist)] += block_hist
+    r = np.arange(len(hist)) * bin_width
+    return r, hist
+
+def debye_transform(q, r, hist):
+    """
+    Debye sum sum_k hist[k] sin(q r[k]) / (q r[k]) at each q
+    """
+    q = np.asarray(q, 'd')
+    i_out = np.empty(len(q))
+    chunk = max(1, _NUMPY_CHUNK_SIZE // max(len(r), 1))
+    for start in range(0, len(q), chunk):
+        stop = min(start + chunk, len(q))
+        i_out[start:stop] = np.dot(_sinc(q[start:stop, np.newaxis] * r), hist)
+    return i_out
+
 class GenSAS(BaseComponent):
     """
     Generic SAS computation Model based on sld (n & m) arrays
@@ -92,6 +272,17 @@ class GenSAS(BaseComponent):
         self.details['Up_theta'] = ['[deg]', -np.inf, np.inf]
         # fixed parameters
         self.fixed = []
+        # Number of threads computing chunks of q; None for one per cpu
+        self.n_threads = None
+        # Number of q values per chunk; None to size them from the data
+        self.chunk_size = None
+        # Use the numpy kernels rather than the sld2i extension
+        self.use_numpy = mod is None
+        # Compute the orientation averaged I(q) from a histogram of the
+        # pair distances, with the given bin width [A]
+        self.use_histogram = False
+        self.histogram_bin = 0.1
+        self._histogram = None
 
     def set_pixel_volumes(self, volume):
         """
@@ -101,6 +292,8 @@ class GenSAS(BaseComponent):
         if self.data_vol is None:
             raise
         self.data_vol = volume
+        # The pair distance histogram is weighted by the pixel volumes
+        self._histogram = None
 
     def set_is_avg(self, is_avg=False):
         """
@@ -108,12 +301,94 @@ class GenSAS(BaseComponent):
         """
         self.is_avg = is_avg
 
+    def set_threads(self, n_threads=None, chunk_size=None):
+        """
+        Sets the number of threads and the number of q values per chunk
+        used to evaluate the model; None chooses them automatically
+        """
+        self.n_threads = n_threads
+        self.chunk_size = chunk_size
+
+    def set_histogram(self, use_histogram=True, bin_width=None):
+        """
+        Use the pair distance histogram for the orientation averaged,
+        non-magnetic I(q)
+
+        The histogram is computed once for the structure and solvent sld,
+        so that other q values, scale or background are fast to evaluate.
+        A smaller bin_width [A] is more accurate but slower.
+        """
+        self.use_histogram = use_histogram
+        if bin_width is not None:
+            self.histogram_bin = bin_width
+
+    def get_histogram(self):
+        """
+        Return r [A] and the sld weighted pair distance histogram of the
+        structure for the current solvent_SLD and histogram_bin
+        """
+        key = (self.params['solvent_SLD'], self.histogram_bin)
+        if self._histogram is None or self._histogram[0] != key:
+            sldn = self.data_sldn - self.params['solvent_SLD']
+            r, hist = pair_distance_histogram(self.data_x, self.data_y,
+                                              self.data_z,
+                                              sldn * self.data_vol,
+                                              bin_width=self.histogram_bin)
+            self._histogram = (key, r, hist)
+        return self._histogram[1:]
+
+    def _get_threads(self):
+        """
+        Number of threads to use for the evaluation
+        """
+        if self.n_threads is None:
+            return multiprocessing.cpu_count()
+        return max(1, int(self.n_threads))
+
+    def _get_chunk_size(self, len_q, len_pix, n_threads, bounded=False):
+        """
+        Number of q values to compute at once
+
+        :param bounded: limit the chunk size by the number of pixels to
+            bound the memory used by the numpy kernels
+        """
+        if self.chunk_size is not None:
+            return max(1, int(self.chunk_size))
+        # A few chunks per thread to balance the load
+        size = -(-len_q // (4 * n_threads))
+        if bounded:
+            size = min(size, _NUMPY_CHUNK_SIZE // max(len_pix, 1))
+        return max(1, size)
+
+    def _run_chunks(self, kernel, len_q, chunk_size, n_threads):
+        """
+        Call kernel(start, stop) for each chunk of the q values, using a
+        pool of threads when there is more than one chunk
+        """
+        starts = range(0, len_q, chunk_size)
+        def _run(start):
+            kernel(start, min(start + chunk_size, len_q))
+        if n_threads > 1 and len(starts) > 1:
+            pool = ThreadPool(min(n_threads, len(starts)))
+            try:
+                pool.map(_run, starts)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for start in starts:
+                _run(start)
+
     def _gen(self, x, y, i):
         """
         Evaluate the function
+
+        The q values are split in chunks computed concurrently; the sld2i
+        extension releases the GIL while it computes a chunk.
+
         :Param x: array of x-values
         :Param y: array of y-values
-        :Param i: array of initial i-value
+        :Param i: array of initial i-value (unused)
         :return: function value
         """
         pos_x = self.data_x
@@ -126,16 +401,53 @@ class GenSAS(BaseComponent):
         len_q = len(x)
         sldn = copy.deepcopy(self.data_sldn)
         sldn -= self.params['solvent_SLD']
-        model = mod.new_GenI(len_x, pos_x, pos_y, pos_z,
-                             sldn, self.data_mx, self.data_my,
-                             self.data_mz, self.data_vol,
-                             self.params['Up_frac_in'],
-                             self.params['Up_frac_out'],
-                             self.params['Up_theta'])
-        if y == []:
-            mod.genicom(model, len_q, x, i)
+        in_spin = self.params['Up_frac_in']
+        out_spin = self.params['Up_frac_out']
+        s_theta = self.params['Up_theta']
+        is_1d = len(y) == 0
+        if is_1d and self.is_avg and self.use_histogram:
+            r, hist = self.get_histogram()
+            i = debye_transform(x, r, hist) * (1.0E+8 / np.sum(self.data_vol))
+            vol_correction = self.data_total_volume / \
+                                self.params['total_volume']
+            return self.params['scale'] * vol_correction * i + \
+                        self.params['background']
+        x = np.ascontiguousarray(x, 'd')
+        if not is_1d:
+            y = np.ascontiguousarray(y, 'd')
+        i = np.zeros(len_q)
+        n_threads = self._get_threads()
+        use_numpy = self.use_numpy or mod is None
+        chunk_size = self._get_chunk_size(len_q, abs(len_x), n_threads,
+                                          bounded=use_numpy and
+                                          (not is_1d or len_x < 0))
+        if use_numpy:
+            if is_1d:
+                def kernel(start, stop):
+                    i[start:stop] = genicom_1d(x[start:stop], pos_x, pos_y,
+                                               pos_z, sldn, self.data_vol,
+                                               is_sym=len_x < 0)
+            else:
+                def kernel(start, stop):
+                    i[start:stop] = genicom_xy(x[start:stop], y[start:stop],
+                                               pos_x, pos_y, sldn,
+                                               self.data_mx, self.data_my,
+                                               self.data_mz, self.data_vol,
+                                               in_spin, out_spin, s_theta)
         else:
-            mod.genicomXY(model, len_q, x, y, i)
+            model = mod.new_GenI(len_x, pos_x, pos_y, pos_z,
+                                 sldn, self.data_mx, self.data_my,
+                                 self.data_mz, self.data_vol,
+                                 in_spin, out_spin, s_theta)
+            if is_1d:
+                def kernel(start, stop):
+                    mod.genicom(model, stop - start, x[start:stop],
+                                i[start:stop])
+            else:
+                def kernel(start, stop):
+                    mod.genicomXY(model, stop - start, x[start:stop],
+                                  y[start:stop], i[start:stop])
+        self._run_chunks(kernel, len_q, chunk_size, n_threads)
         vol_correction = self.data_total_volume / self.params['total_volume']
         return  self.params['scale'] * vol_correction * i + \
                         self.params['background']
@@ -154,6 +466,7 @@ class GenSAS(BaseComponent):
         self.data_my = sld_data.sld_my
         self.data_mz = sld_data.sld_mz
         self.data_vol = sld_data.vol_pix
+        self._histogram = None
         self.data_total_volume = sum(sld_data.vol_pix)
         self.params['total_volume'] = sum(sld_data.vol_pix)
 
@@ -372,9 +685,9 @@ class OMFReader(object):
         :return: x, y, z, sld_n, sld_mx, sld_my, sld_mz
         """
         desc = ""
-        mx = np.zeros(0)
-        my = np.zeros(0)
-        mz = np.zeros(0)
+        mx = []
+        my = []
+        mz = []
         try:
             input_f = open(path, 'rb')
             buff = input_f.read()
@@ -392,9 +705,10 @@ class OMFReader(object):
                     _mx = mag2sld(_mx, valueunit)
                     _my = mag2sld(_my, valueunit)
                     _mz = mag2sld(_mz, valueunit)
-                    mx = np.append(mx, _mx)
-                    my = np.append(my, _my)
-                    mz = np.append(mz, _mz)
+                    mx.append(_mx)
+                    my.append(_my)
+                    mz.append(_mz)
+                    continue
                 except:
                     # Skip non-data lines
                     logger.error(sys.exc_value)
@@ -479,7 +793,7 @@ class OMFReader(object):
                                                       valueunit)
                     output.valuerangemaxmag = mag2sld(float(valuerangemaxmag), \
                                                       valueunit)
-            output.set_m(mx, my, mz)
+            output.set_m(np.array(mx), np.array(my), np.array(mz))
             return output
         except:
             msg = "%s is not supported: \n" % path
@@ -504,21 +818,20 @@ class PDBReader(object):
         :return: MagSLD
         :raise RuntimeError: when the file can't be opened
         """
-        pos_x = np.zeros(0)
-        pos_y = np.zeros(0)
-        pos_z = np.zeros(0)
-        sld_n = np.zeros(0)
-        sld_mx = np.zeros(0)
-        sld_my = np.zeros(0)
-        sld_mz = np.zeros(0)
-        vol_pix = np.zeros(0)
-        pix_symbol = np.zeros(0)
+        pos_x = []
+        pos_y = []
+        pos_z = []
+        sld_n = []
+        vol_pix = []
+        pix_symbol = []
         x_line = []
         y_line = []
         z_line = []
-        x_lines = []
-        y_lines = []
-        z_lines = []
+        # Bonds already drawn, to skip the reverse bond
+        bonds = set()
+        # Atom name of each raw name field, and (sld, volume) per atom name
+        atom_names = {}
+        atom_slds = {}
         try:
             input_f = open(path, 'rb')
             buff = input_f.read()
@@ -527,45 +840,28 @@ class PDBReader(object):
             num = 0
             for line in lines:
                 try:
+                    record = line[0:6].strip()
                     # check if line starts with "ATOM"
-                    if line[0:6].strip().count('ATM') > 0 or \
-                                line[0:6].strip() == 'ATOM':
+                    if record == 'ATOM' or record.count('ATM') > 0:
                         # define fields of interest
-                        atom_name = line[12:16].strip()
-                        try:
-                            float(line[12])
-                            atom_name = atom_name[1].upper()
-                        except:
-                            if len(atom_name) == 4:
-                                atom_name = atom_name[0].upper()
-                            elif line[12] != ' ':
-                                atom_name = atom_name[0].upper() + \
-                                        atom_name[1].lower()
-                            else:
-                                atom_name = atom_name[0].upper()
+                        name_field = line[12:16]
+                        atom_name = atom_names.get(name_field)
+                        if atom_name is None:
+                            atom_name = self._atom_name(line)
+                            atom_names[name_field] = atom_name
                         _pos_x = float(line[30:38].strip())
                         _pos_y = float(line[38:46].strip())
                         _pos_z = float(line[46:54].strip())
-                        pos_x = np.append(pos_x, _pos_x)
-                        pos_y = np.append(pos_y, _pos_y)
-                        pos_z = np.append(pos_z, _pos_z)
-                        try:
-                            val = nsf.neutron_sld(atom_name)[0]
-                            # sld in Ang^-2 unit
-                            val *= 1.0e-6
-                            sld_n = np.append(sld_n, val)
-                            atom = formula(atom_name)
-                            # cm to A units
-                            vol = 1.0e+24 * atom.mass / atom.density / NA
-                            vol_pix = np.append(vol_pix, vol)
-                        except:
-                            print("Error: set the sld of %s to zero"% atom_name)
-                            sld_n = np.append(sld_n, 0.0)
-                        sld_mx = np.append(sld_mx, 0)
-                        sld_my = np.append(sld_my, 0)
-                        sld_mz = np.append(sld_mz, 0)
-                        pix_symbol = np.append(pix_symbol, atom_name)
-                    elif line[0:6].strip().count('CONECT') > 0:
+                        pos_x.append(_pos_x)
+                        pos_y.append(_pos_y)
+                        pos_z.append(_pos_z)
+                        if atom_name not in atom_slds:
+                            atom_slds[atom_name] = self._atom_sld(atom_name)
+                        val, vol = atom_slds[atom_name]
+                        sld_n.append(val)
+                        vol_pix.append(vol)
+                        pix_symbol.append(atom_name)
+                    elif record.count('CONECT') > 0:
                         toks = line.split()
                         num = int(toks[1]) - 1
                         val_list = []
@@ -580,32 +876,74 @@ class PDBReader(object):
                         #need val_list ordered
                         for val in val_list:
                             index = val - 1
-                            if (pos_x[index], pos_x[num]) in x_line and \
-                               (pos_y[index], pos_y[num]) in y_line and \
-                               (pos_z[index], pos_z[num]) in z_line:
+                            bond = (pos_x[num], pos_x[index],
+                                    pos_y[num], pos_y[index],
+                                    pos_z[num], pos_z[index])
+                            reverse = (pos_x[index], pos_x[num],
+                                       pos_y[index], pos_y[num],
+                                       pos_z[index], pos_z[num])
+                            if reverse in bonds:
                                 continue
+                            bonds.add(bond)
                             x_line.append((pos_x[num], pos_x[index]))
                             y_line.append((pos_y[num], pos_y[index]))
                             z_line.append((pos_z[num], pos_z[index]))
-                    if len(x_line) > 0:
-                        x_lines.append(x_line)
-                        y_lines.append(y_line)
-                        z_lines.append(z_line)
                 except:
                     logger.error(sys.exc_value)
 
-            output = MagSLD(pos_x, pos_y, pos_z, sld_n, sld_mx, sld_my, sld_mz)
+            output = MagSLD(np.array(pos_x), np.array(pos_y),
+                            np.array(pos_z), np.array(sld_n),
+                            np.zeros(len(pos_x)), np.zeros(len(pos_x)),
+                            np.zeros(len(pos_x)))
             output.set_conect_lines(x_line, y_line, z_line)
             output.filename = os.path.basename(path)
             output.set_pix_type('atom')
-            output.set_pixel_symbols(pix_symbol)
+            output.set_pixel_symbols(np.array(pix_symbol))
             output.set_nodes()
-            output.set_pixel_volumes(vol_pix)
+            output.set_pixel_volumes(np.array(vol_pix))
             output.sld_unit = '1/A^(2)'
             return output
         except:
             raise RuntimeError, "%s is not a sld file" % path
 
+    @staticmethod
+    def _atom_name(line):
+        """
+        Element symbol from the atom name field of an ATOM line
+        """
+        atom_name = line[12:16].strip()
+        try:
+            float(line[12])
+            atom_name = atom_name[1].upper()
+        except:
+            if len(atom_name) == 4:
+                atom_name = atom_name[0].upper()
+            elif line[12] != ' ':
+                atom_name = atom_name[0].upper() + \
+                        atom_name[1].lower()
+            else:
+                atom_name = atom_name[0].upper()
+        return atom_name
+
+    @staticmethod
+    def _atom_sld(atom_name):
+        """
+        Neutron sld [1/A^2] and volume [A^3] of an atom of the given element
+
+        Unknown elements get a zero sld and volume.
+        """
+        try:
+            val = nsf.neutron_sld(atom_name)[0]
+            # sld in Ang^-2 unit
+            val *= 1.0e-6
+            atom = formula(atom_name)
+            # cm to A units
+            vol = 1.0e+24 * atom.mass / atom.density / NA
+        except:
+            print("Error: set the sld of %s to zero"% atom_name)
+            val, vol = 0.0, 0.0
+        return val, vol
+
     def write(self, path, data):
         """
         Write
@@ -662,31 +1000,31 @@ class SLDReader(object):
                 buff = input_f.read()
                 lines = buff.split('\n')
                 input_f.close()
+                rows = []
+                vol_rows = []
                 for line in lines:
                     toks = line.split()
                     try:
-                        _pos_x = float(toks[0])
-                        _pos_y = float(toks[1])
-                        _pos_z = float(toks[2])
-                        _sld_n = float(toks[3])
-                        _sld_mx = float(toks[4])
-                        _sld_my = float(toks[5])
-                        _sld_mz = float(toks[6])
-                        pos_x = np.append(pos_x, _pos_x)
-                        pos_y = np.append(pos_y, _pos_y)
-                        pos_z = np.append(pos_z, _pos_z)
-                        sld_n = np.append(sld_n, _sld_n)
-                        sld_mx = np.append(sld_mx, _sld_mx)
-                        sld_my = np.append(sld_my, _sld_my)
-                        sld_mz = np.append(sld_mz, _sld_mz)
-                        try:
-                            _vol_pix = float(toks[7])
-                            vol_pix = np.append(vol_pix, _vol_pix)
-                        except:
-                            vol_pix = None
+                        row = [float(tok) for tok in toks[:7]]
+                        if len(row) < 7:
+                            raise ValueError("missing columns in %r" % line)
                     except:
                         # Skip non-data lines
                         logger.error(sys.exc_value)
+                        continue
+                    rows.append(row)
+                    if vol_rows is not None:
+                        try:
+                            vol_rows.append(float(toks[7]))
+                        except:
+                            vol_rows = None
+                columns = np.array(rows, dtype='float').reshape(-1, 7).T
+                pos_x, pos_y, pos_z, sld_n, sld_mx, sld_my, sld_mz = \
+                    [np.array(column) for column in columns]
+                if vol_rows is not None and len(vol_rows) == len(rows):
+                    vol_pix = np.array(vol_rows)
+                else:
+                    vol_pix = None
             output = MagSLD(pos_x, pos_y, pos_z, sld_n,
                             sld_mx, sld_my, sld_mz)
             output.filename = os.path.basename(path)
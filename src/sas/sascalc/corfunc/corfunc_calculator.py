@@ -5,7 +5,7 @@ import warnings
 import numpy as np
 from scipy.optimize import curve_fit
 from scipy.interpolate import interp1d
-from scipy.fftpack import dct
+from scipy.fftpack import dct, next_fast_len
 from scipy.signal import argrelextrema
 from numpy.linalg import lstsq
 from sas.sascalc.dataloader.data_info import Data1D
@@ -105,18 +105,42 @@ class CorfuncCalculator(object):
 
         return bg
 
-    def compute_extrapolation(self):
+    def compute_extrapolation(self, npts=None, resolution=None):
         """
         Extrapolate and interpolate scattering data
 
+        By default the extrapolation uses the q spacing of the data and
+        extends to 100 times the largest q of the data. The transform of
+        the extrapolation has a real space step of pi/q_max and extends to
+        pi/dq, so for finely sampled data the default grid can be much
+        larger than needed. If npts or resolution is given, the number of
+        points is instead rounded up to a length for which the transform is
+        fast.
+
+        :param npts: Number of points of the extrapolated curve, which sets
+            the q spacing of the grid
+        :param resolution: Target real space resolution of the correlation
+            function, which sets the largest q of the grid to pi/resolution
         :return: The extrapolated data
         """
         q = self._data.x
         iq = self._data.y
 
         params, s2 = self._fit_data(q, iq)
-        qs = np.arange(0, q[-1]*100, (q[1]-q[0]))
-        iqs = s2(qs)
+        if npts is None and resolution is None:
+            qs = np.arange(0, q[-1]*100, (q[1]-q[0]))
+        else:
+            q_max = q[-1]*100 if resolution is None else np.pi/resolution
+            dq = q[1]-q[0] if npts is None else q_max/npts
+            qs = dq*np.arange(next_fast_len(int(np.ceil(q_max/dq))))
+
+        # Past the data the extrapolation is the fitted Porod function, so
+        # only evaluate the interpolation chain over the range of the data
+        iqs = np.empty(qs.shape)
+        tail = qs >= q[-1]
+        iqs[~tail] = s2(qs[~tail])
+        iqs[tail] = self._porod(qs[tail], params['K'], params['sigma'],
+            self.background)
 
         extrapolation = Data1D(qs, iqs)
 
@@ -1,9 +1,32 @@
 from sas.sascalc.data_util.calcthread import CalcThread
 from sas.sascalc.dataloader.data_info import Data1D
-from scipy.fftpack import dct
+from scipy.fftpack import dct, next_fast_len
 import numpy as np
 from time import sleep
 
+def hilbert_transform(y):
+    """
+    Compute the Hilbert transform of a function sampled on a uniform grid
+    starting at 0, continued as an even function to negative values.
+
+    The transform is computed with an FFT of the periodic continuation of
+    the even function, padded with its last value to a fast FFT length.
+
+    :param y: The values of the function at 0, dq, 2dq, ...
+    :return: The values of the Hilbert transform at the same points
+    """
+    n = len(y)
+    m = next_fast_len(2*n - 1)
+    even = np.empty(m)
+    even[:n] = y
+    even[n:m-n+1] = y[-1]
+    even[m-n+1:] = y[:0:-1]
+    spectrum = np.fft.rfft(even)
+    spectrum *= -1j
+    spectrum[0] = 0
+    return np.fft.irfft(spectrum, m)[:n]
+
+
 class FourierThread(CalcThread):
     def __init__(self, raw_data, extrapolated_data, bg, updatefn=None,
         completefn=None):
@@ -34,7 +57,7 @@ class FourierThread(CalcThread):
             return
         self.update(msg="Fourier transform completed.")
 
-        xs = np.pi*np.arange(len(qs),dtype=np.float32)/(q[1]-q[0])/len(qs)
+        xs = np.pi*np.arange(len(qs),dtype=np.float32)/(qs[1]-qs[0])/len(qs)
         transform = Data1D(xs, gamma)
 
         self.complete(transform=transform)
@@ -58,9 +81,36 @@ class HilbertThread(CalcThread):
         self.ready(delay=0.0)
         if self.isquit():
             return
-
-        # TODO: Implement hilbert transform
-
+        try:
+            # Amplitude of the scattering from the interface, I(q)q^2 = |A|^2
+            amplitude = qs*np.sqrt(np.clip(iqs-background, 0, None))
+            amplitude = np.maximum(amplitude, amplitude.max()*1e-12)
+            # Phase of the minimum phase profile. The log of the amplitude
+            # is singular at q = 0, so use the value of the next point.
+            log_amplitude = np.log(amplitude)
+            log_amplitude[0] = log_amplitude[1]
+            phase = hilbert_transform(log_amplitude)
+        except:
+            self.update(msg="Hilbert transform failed.")
+            self.complete(transform=None)
+            return
+        if self.isquit():
+            return
+        self.update(msg="Computing the volume fraction profile.")
+        try:
+            # Cosine transform of A(q) cos(qz - phase) on the same real space
+            # grid as the Fourier transform
+            profile = np.real(np.fft.fft(amplitude*np.exp(1j*phase),
+                2*len(qs)))[:len(qs)]
+            xs = np.pi*np.arange(len(qs),dtype=np.float32)/(qs[1]-qs[0])/len(qs)
+        except:
+            self.update(msg="Hilbert transform failed.")
+            self.complete(transform=None)
+            return
+        if self.isquit():
+            return
         self.update(msg="Hilbert transform completed.")
 
-        self.complete(transform=None)
+        transform = Data1D(xs, profile / profile.max())
+
+        self.complete(transform=transform)
@@ -0,0 +1,73 @@
+"""
+Helpers for the caches of results computed from data arrays
+"""
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+def array_digest(array):
+    """
+    Return a cheap fingerprint of the content of an array,
+    or None if there is no array.
+
+    The fingerprint is made of the shape, the dtype and two checksums of
+    the values, so that it can be used in the key of a cache which must
+    be invalidated when the array changes, without keeping a copy of it.
+    """
+    if array is None:
+        return None
+    array = np.ascontiguousarray(array)
+    return (array.shape, array.dtype.str,
+            zlib.crc32(array) & 0xffffffff, zlib.adler32(array) & 0xffffffff)
+
+
+class LRUCache(object):
+    """
+    Least recently used cache of at most *max_size* entries.
+
+    The hits and misses counters are left to the users of the cache,
+    which decide whether a cached value is good enough for a request.
+    """
+
+    def __init__(self, max_size=8):
+        # Maximum number of entries kept; 0 disables the cache
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Remove all the cached entries
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for *key*, which becomes the most
+        recently used entry, or *default* if there is none
+        """
+        if key not in self._entries:
+            return default
+        value = self._entries.pop(key)
+        self._entries[key] = value
+        return value
+
+    def put(self, key, value):
+        """
+        Cache *value* for *key*, dropping the least recently used
+        entries if the cache is full
+        """
+        if self.max_size <= 0:
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+        self._entries[key] = value
@@ -5,11 +5,17 @@
 #
 from __future__ import print_function
 
+import heapq
 import thread
+import threading
+import itertools
 import traceback
+import time
 import sys
 import logging
 
+from sas.sascalc.data_util import parallel
+
 if sys.platform.count("darwin") > 0:
     import time
     stime = time.time()
@@ -25,6 +31,10 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Priorities of the work units run by a WorkPool, lowest first
+INTERACTIVE = 0
+BACKGROUND = 10
+
 
 class CalcThread:
     """Threaded calculation class.  Inherit from here and specialize
@@ -276,6 +286,205 @@ class CalcThread:
         self._running = False
 
 
+class WorkPool(object):
+    """Bounded pool of worker threads running PooledCalcThread work.
+
+    Pending work is started in order of priority, then in the order it
+    was submitted.  At most workers-1 background units, and at least one,
+    run at the same time so that a worker is kept for interactive work,
+    such as a model preview.  A pool of one worker starts a second thread
+    for interactive work submitted while its background unit runs.
+
+    The worker threads wait on a condition rather than polling, and are
+    kept for the next work units once started.
+
+    The GUI thread may call heartbeat() regularly, for instance from a
+    timer.  If the heartbeat is late by more than *starve_time* seconds,
+    the GUI is considered starved and the running work units sleep for
+    their yieldtime in isquit() until it catches up.  Without heartbeat
+    the work units never sleep.
+    """
+    def __init__(self, workers=None, starve_time=0.1):
+        self.workers = get_workers(workers)
+        self.starve_time = starve_time
+        self._background_limit = max(1, self.workers - 1)
+        self._cond = threading.Condition()
+        self._pending = []
+        self._count = itertools.count()
+        self._threads = 0
+        self._idle = 0
+        self._background = 0
+        self._heartbeat = None
+
+    def submit(self, calc):
+        """Schedule calc._run() according to calc.priority."""
+        self._cond.acquire()
+        try:
+            heapq.heappush(self._pending,
+                           (calc.priority, next(self._count), calc))
+            threads = self.workers
+            if (calc.priority < BACKGROUND
+                    and self._background >= self._background_limit):
+                threads = self._background_limit + 1
+            if self._idle == 0 and self._threads < threads:
+                self._threads += 1
+                worker = threading.Thread(target=self._worker)
+                worker.daemon = True
+                worker.start()
+            else:
+                self._cond.notify()
+        finally:
+            self._cond.release()
+
+    def heartbeat(self):
+        """Signal that the GUI thread is running."""
+        self._heartbeat = time.time()
+
+    def starved(self):
+        """Return True if the GUI thread missed its heartbeat."""
+        return (self._heartbeat is not None
+                and time.time() - self._heartbeat > self.starve_time)
+
+    def _next(self):
+        """Pop the next work unit which may be started, if any."""
+        if not self._pending:
+            return None
+        priority = self._pending[0][0]
+        if priority >= BACKGROUND:
+            if self._background >= self._background_limit:
+                return None
+            self._background += 1
+        return heapq.heappop(self._pending)[2]
+
+    def _worker(self):
+        """Internal function run by each worker thread."""
+        while 1:
+            self._cond.acquire()
+            try:
+                calc = self._next()
+                while calc is None:
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                    calc = self._next()
+            finally:
+                self._cond.release()
+            try:
+                calc._run()
+            except Exception:
+                logger.error(traceback.format_exc())
+            if calc.priority >= BACKGROUND:
+                self._cond.acquire()
+                self._background -= 1
+                self._cond.notify()
+                self._cond.release()
+
+
+def get_workers(workers=None):
+    """
+    Return the number of worker threads of a WorkPool.
+
+    If *workers* is None, the value is taken from the SAS_CALC_WORKERS
+    environment variable, one worker per cpu by default.
+    """
+    return parallel.get_workers('SAS_CALC_WORKERS', 0, workers)
+
+
+_POOL = None
+_POOL_LOCK = thread.allocate_lock()
+
+
+def get_pool():
+    """Return the WorkPool shared by the PooledCalcThread objects."""
+    global _POOL
+    _POOL_LOCK.acquire()
+    if _POOL is None:
+        _POOL = WorkPool()
+    _POOL_LOCK.release()
+    return _POOL
+
+
+class PooledCalcThread(CalcThread):
+    """CalcThread whose work units are run by a WorkPool.
+
+    The interface is the one of CalcThread, with the additional keywords
+    priority=BACKGROUND, or INTERACTIVE for work the user is waiting on,
+    and pool=None for the shared pool returned by get_pool().
+
+    Rather than starting a thread for each queue, the calculation is
+    submitted to the pool and its work units are run one after the other
+    by a worker.  isquit(), update() and complete() do not sleep, except
+    in isquit() for yieldtime while the pool reports the GUI as starved.
+    """
+
+    def __init__(self, completefn=None, updatefn=None,
+                 yieldtime=0.01, worktime=0.01,
+                 exception_handler=None, priority=BACKGROUND, pool=None):
+        CalcThread.__init__(self, completefn, updatefn, yieldtime, worktime,
+                            exception_handler=exception_handler)
+        self.priority = priority
+        self.pool = pool
+
+    def queue(self, *args, **kwargs):
+        """Add a work unit to the end of the queue.  See the compute()
+        method for details of the arguments to the work unit."""
+        self._lock.acquire()
+        self._queue.append((args, kwargs))
+        submit = not self._running
+        if submit:
+            self._running = True
+            self._time_for_update = clock() + 1e6
+        self._lock.release()
+        if submit:
+            pool = self.pool if self.pool is not None else get_pool()
+            pool.submit(self)
+
+    def isquit(self):
+        """Check for interrupts.  Should be called frequently to
+        provide user responsiveness.  Yields to the GUI thread only
+        if it is starved."""
+        if self.yieldtime > 0:
+            pool = self.pool if self.pool is not None else get_pool()
+            if pool.starved():
+                sleep(self.yieldtime)
+        if self._interrupting:
+            raise KeyboardInterrupt
+
+    def update(self, **kwargs):
+        """Update GUI with the lastest results from the current work unit."""
+        if self.updatefn is not None and clock() > self._time_for_update:
+            self._lock.acquire()
+            self._time_for_update = clock() + self._delay
+            self._lock.release()
+            self._time_for_update += 1e6  # No more updates
+
+            self.updatefn(**kwargs)
+        self.isquit()
+
+    def complete(self, **kwargs):
+        """Update the GUI with the completed results from a work unit."""
+        if self.completefn is not None:
+            self.completefn(**kwargs)
+
+    def _run(self):
+        """Internal function run by a pool worker."""
+        while 1:
+            self._lock.acquire()
+            if self._queue == []:
+                self._running = False
+                self._lock.release()
+                break
+            self._interrupting = False
+            args, kwargs = self._queue.pop(0)
+            self._lock.release()
+            try:
+                self.compute(*args, **kwargs)
+            except KeyboardInterrupt:
+                pass
+            except:
+                self.exception()
+
+
 # ======================================================================
 # Demonstration of calcthread in action
 class CalcDemo(CalcThread):
@@ -0,0 +1,28 @@
+"""
+Settings of the pools of worker processes and threads
+"""
+import os
+import multiprocessing
+
+
+def get_workers(env_name, default=1, workers=None):
+    """
+    Return the number of workers of a pool.
+
+    If *workers* is None, the value is taken from the *env_name*
+    environment variable, or is *default* if the variable is not set or
+    is not an integer.  0 or less means one worker per cpu.
+
+    :param env_name: name of the environment variable, e.g. SAS_FIT_WORKERS
+    :param default: number of workers if the variable is not set
+    :param workers: number of workers requested by the caller, if any
+    :return: number of workers, at least 1
+    """
+    if workers is None:
+        try:
+            workers = int(os.environ.get(env_name, default))
+        except ValueError:
+            workers = default
+    if workers <= 0:
+        workers = multiprocessing.cpu_count()
+    return workers
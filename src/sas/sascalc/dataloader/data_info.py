@@ -24,7 +24,37 @@ from __future__ import print_function
 #from sas.guitools.plottables import Data1D as plottable_1D
 from sas.sascalc.data_util.uncertainty import Uncertainty
 import numpy as np
-import math
+
+
+def _uncertainty(values, errors):
+    """
+    Return an Uncertainty holding float copies of values and errors**2,
+    so that the propagation is done in double precision as it is for
+    single points.
+    """
+    values = np.array(values, dtype=float)
+    errors = np.asarray(errors, dtype=float)
+    return Uncertainty(values, errors**2)
+
+
+def _relative_difference(values, other):
+    """
+    Return abs((values - other)/values) for two arrays of the same length
+    """
+    values = np.asarray(values, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.fabs((values - np.asarray(other, dtype=float))/values)
+
+
+def _average_resolution(current, resolution, other):
+    """
+    Return the resolution of the result of an operation between two data
+    sets, sqrt((current*resolution + other**2)/2), where current holds a
+    copy of resolution when it was available.
+    """
+    return np.sqrt((current*np.asarray(resolution, dtype=float)
+                    + np.asarray(other, dtype=float)**2)/2)
+
 
 class plottable_1D(object):
     """
@@ -798,10 +828,9 @@ class Data1D(plottable_1D, DataInfo):
                 raise ValueError, msg
             # Here we could also extrapolate between data points
             TOLERANCE = 0.01
-            for i in range(len(self.x)):
-                if math.fabs((self.x[i] - other.x[i])/self.x[i]) > TOLERANCE:
-                    msg = "Incompatible data sets: x-values do not match"
-                    raise ValueError, msg
+            if np.any(_relative_difference(self.x, other.x) > TOLERANCE):
+                msg = "Incompatible data sets: x-values do not match"
+                raise ValueError, msg
 
             # Check that the other data set has errors, otherwise
             # create zero vector
@@ -830,37 +859,39 @@ class Data1D(plottable_1D, DataInfo):
             result.dxl = None
         else:
             result.dxl = np.zeros(len(self.x))
-
-        for i in range(len(self.x)):
-            result.x[i] = self.x[i]
-            if self.dx is not None and len(self.x) == len(self.dx):
-                result.dx[i] = self.dx[i]
-            if self.dxw is not None and len(self.x) == len(self.dxw):
-                result.dxw[i] = self.dxw[i]
-            if self.dxl is not None and len(self.x) == len(self.dxl):
-                result.dxl[i] = self.dxl[i]
-
-            a = Uncertainty(self.y[i], dy[i]**2)
-            if isinstance(other, Data1D):
-                b = Uncertainty(other.y[i], dy_other[i]**2)
-                if other.dx is not None:
-                    result.dx[i] *= self.dx[i]
-                    result.dx[i] += (other.dx[i]**2)
-                    result.dx[i] /= 2
-                    result.dx[i] = math.sqrt(result.dx[i])
-                if result.dxl is not None and other.dxl is not None:
-                    result.dxl[i] *= self.dxl[i]
-                    result.dxl[i] += (other.dxl[i]**2)
-                    result.dxl[i] /= 2
-                    result.dxl[i] = math.sqrt(result.dxl[i])
-            else:
-                b = other
-
-            output = operation(a, b)
-            result.y[i] = output.x
-            result.dy[i] = math.sqrt(math.fabs(output.variance))
+        self._operate(result, other, operation, dy, dy_other)
         return result
 
+    def _operate(self, result, other, operation, dy, dy_other):
+        """
+        Fill the arrays of result, of the same length as the data, with
+        the outcome of operation(self, other). The uncertainties are
+        propagated for all the points at once.
+        """
+        result.x[:] = self.x
+        if self.dx is not None and len(self.x) == len(self.dx):
+            result.dx[:] = self.dx
+        if self.dxw is not None and len(self.x) == len(self.dxw):
+            result.dxw[:] = self.dxw
+        if self.dxl is not None and len(self.x) == len(self.dxl):
+            result.dxl[:] = self.dxl
+
+        a = _uncertainty(self.y, dy)
+        if isinstance(other, Data1D):
+            b = _uncertainty(other.y, dy_other)
+            if other.dx is not None and self.dx is not None:
+                result.dx[:] = _average_resolution(result.dx, self.dx,
+                                                   other.dx)
+            if result.dxl is not None and other.dxl is not None:
+                result.dxl[:] = _average_resolution(result.dxl, self.dxl,
+                                                    other.dxl)
+        else:
+            b = other
+
+        output = operation(a, b)
+        result.y[:] = output.x
+        result.dy[:] = np.sqrt(np.fabs(output.variance))
+
     def _validity_check_union(self, other):
         """
         Checks that the data lengths are compatible.
@@ -1020,13 +1051,17 @@ class Data2D(plottable_2D, DataInfo):
                 len(self.qy_data) != len(other.qy_data):
                 msg = "Unable to perform operation: data length are not equal"
                 raise ValueError, msg
-            for ind in range(len(self.data)):
-                if math.fabs((self.qx_data[ind] - other.qx_data[ind])/self.qx_data[ind]) > TOLERANCE:
+            qx_bad = _relative_difference(self.qx_data, other.qx_data) > TOLERANCE
+            qy_bad = _relative_difference(self.qy_data, other.qy_data) > TOLERANCE
+            bad = np.flatnonzero(qx_bad | qy_bad)
+            if len(bad) > 0:
+                # Report the first incompatible point
+                ind = bad[0]
+                if qx_bad[ind]:
                     msg = "Incompatible data sets: qx-values do not match: %s %s" % (self.qx_data[ind], other.qx_data[ind])
-                    raise ValueError, msg
-                if math.fabs((self.qy_data[ind] - other.qy_data[ind])/self.qy_data[ind]) > TOLERANCE:
+                else:
                     msg = "Incompatible data sets: qy-values do not match: %s %s" % (self.qy_data[ind], other.qy_data[ind])
-                    raise ValueError, msg
+                raise ValueError, msg
 
             # Check that the scales match
             err_other = other.err_data
@@ -1038,7 +1073,7 @@ class Data2D(plottable_2D, DataInfo):
         err = self.err_data
         if self.err_data is None or \
             (len(self.err_data) != len(self.data)):
-            err = np.zeros(len(other.data))
+            err = np.zeros(len(self.data))
         return err, err_other
 
     def _perform_operation(self, other, operation):
@@ -1057,42 +1092,42 @@ class Data2D(plottable_2D, DataInfo):
         else:
             result.dqx_data = np.zeros(len(self.data))
             result.dqy_data = np.zeros(len(self.data))
-        for i in range(np.size(self.data)):
-            result.data[i] = self.data[i]
-            if self.err_data is not None and \
-                            np.size(self.data) == np.size(self.err_data):
-                result.err_data[i] = self.err_data[i]
-            if self.dqx_data is not None:
-                result.dqx_data[i] = self.dqx_data[i]
-            if self.dqy_data is not None:
-                result.dqy_data[i] = self.dqy_data[i]
-            result.qx_data[i] = self.qx_data[i]
-            result.qy_data[i] = self.qy_data[i]
-            result.q_data[i] = self.q_data[i]
-            result.mask[i] = self.mask[i]
-
-            a = Uncertainty(self.data[i], dy[i]**2)
-            if isinstance(other, Data2D):
-                b = Uncertainty(other.data[i], dy_other[i]**2)
-                if other.dqx_data is not None and \
-                        result.dqx_data is not None:
-                    result.dqx_data[i] *= self.dqx_data[i]
-                    result.dqx_data[i] += (other.dqx_data[i]**2)
-                    result.dqx_data[i] /= 2
-                    result.dqx_data[i] = math.sqrt(result.dqx_data[i])
-                if other.dqy_data is not None and \
-                        result.dqy_data is not None:
-                    result.dqy_data[i] *= self.dqy_data[i]
-                    result.dqy_data[i] += (other.dqy_data[i]**2)
-                    result.dqy_data[i] /= 2
-                    result.dqy_data[i] = math.sqrt(result.dqy_data[i])
-            else:
-                b = other
-            output = operation(a, b)
-            result.data[i] = output.x
-            result.err_data[i] = math.sqrt(math.fabs(output.variance))
+        self._operate(result, other, operation, dy, dy_other)
         return result
 
+    def _operate(self, result, other, operation, dy, dy_other):
+        """
+        Fill the arrays of result, of the same length as the data, with
+        the outcome of operation(self, other). The uncertainties are
+        propagated for all the pixels at once.
+        """
+        result.data[:] = self.data
+        if self.dqx_data is not None and result.dqx_data is not None:
+            result.dqx_data[:] = self.dqx_data
+        if self.dqy_data is not None and result.dqy_data is not None:
+            result.dqy_data[:] = self.dqy_data
+        result.qx_data[:] = self.qx_data
+        result.qy_data[:] = self.qy_data
+        result.q_data[:] = self.q_data
+        result.mask[:] = self.mask
+
+        a = _uncertainty(self.data, dy)
+        if isinstance(other, Data2D):
+            b = _uncertainty(other.data, dy_other)
+            if other.dqx_data is not None and \
+                    result.dqx_data is not None:
+                result.dqx_data[:] = _average_resolution(
+                    result.dqx_data, self.dqx_data, other.dqx_data)
+            if other.dqy_data is not None and \
+                    result.dqy_data is not None:
+                result.dqy_data[:] = _average_resolution(
+                    result.dqy_data, self.dqy_data, other.dqy_data)
+        else:
+            b = other
+        output = operation(a, b)
+        result.data[:] = output.x
+        result.err_data[:] = np.sqrt(np.fabs(output.variance))
+
     def _validity_check_union(self, other):
         """
         Checks that the data lengths are compatible.
@@ -33,9 +33,64 @@ from loader_exceptions import NoKnownLoaderException, FileContentsException,\
 from readers import ascii_reader
 from readers import cansas_reader
 from readers import cansas_reader_HDF5
+from file_reader_base_class import FileReader
 
 logger = logging.getLogger(__name__)
 
+# Default readers, keyed by the file type sniff_file_type returns for the
+# files they read, and whether their unexpected errors are ignored
+DEFAULT_READERS = {
+    "ascii": (ascii_reader, False),
+    "xml": (cansas_reader, True),
+    "hdf5": (cansas_reader_HDF5, False),
+}
+# Order in which the default readers are tried when the sniff is unclear
+DEFAULT_ORDER = ["ascii", "xml", "hdf5"]
+# File types only one of the default readers can read
+CONCLUSIVE_TYPES = ["xml", "hdf5"]
+# Number of bytes read from the start of a file to sniff its type
+SNIFF_SIZE = 4096
+HDF5_SIGNATURE = "\x89HDF\r\n\x1a\n"
+# HDF5 user blocks are powers of two, starting at 512 bytes
+HDF5_OFFSETS = [0, 512, 1024, 2048]
+
+
+def sniff_file_type(path, size=SNIFF_SIZE):
+    """
+    Guess the type of a file from the first bytes of its contents.
+
+    :param path: file path
+    :param size: number of bytes to look at
+    :return: 'hdf5', 'xml', 'ascii' (numeric columns) or None if the
+        type cannot be told
+    """
+    try:
+        with open(path, 'rb') as f_open:
+            head = f_open.read(size)
+    except (IOError, OSError):
+        return None
+    for offset in HDF5_OFFSETS:
+        if head[offset:offset + len(HDF5_SIGNATURE)] == HDF5_SIGNATURE:
+            return "hdf5"
+    text = head.lstrip("\xef\xbb\xbf \t\r\n")
+    if text.startswith("<?xml") or "<SASroot" in text:
+        return "xml"
+    # Drop the last line, which may have been cut
+    lines = head.splitlines()[:-1] if len(head) == size else head.splitlines()
+    numeric_lines = 0
+    for line in lines:
+        toks = FileReader.splitline(line.strip())
+        if len(toks) < 2:
+            continue
+        try:
+            [float(tok) for tok in toks]
+            numeric_lines += 1
+        except ValueError:
+            pass
+    if numeric_lines >= 2:
+        return "ascii"
+    return None
+
 
 class Registry(ExtensionRegistry):
     """
@@ -54,6 +109,11 @@ class Registry(ExtensionRegistry):
         # Creation time, for testing
         self._created = time.time()
 
+        # Default reader picked for each (extension, sniffed type) pair
+        self._dispatch_cache = {}
+        # (step, seconds) spent finding the reader in the last load
+        self.dispatch_timings = []
+
         # Register default readers
         readers.read_associations(self)
 
@@ -67,61 +127,144 @@ class Registry(ExtensionRegistry):
 
         Defaults to the ascii (multi-column), cansas XML, and cansas NeXuS
         readers if no reader was registered for the file's extension.
+        The first few KB of the file are sniffed to decide which of the
+        default readers to try first, and whether the readers registered
+        for the extension can be skipped altogether. The time spent in
+        each step is kept in dispatch_timings.
         """
+        self.dispatch_timings = []
+        t_0 = time.time()
+        kind = sniff_file_type(path)
+        self._log_dispatch("sniff", t_0)
+
         # Gets set to a string if the file has an associated reader that fails
         msg_from_reader = None
-        try:
-            return super(Registry, self).load(path, format=format)
-        except NoKnownLoaderException as nkl_e:
-            pass  # Try the ASCII reader
-        except FileContentsException as fc_exc:
-            # File has an associated reader but it failed.
-            # Save the error message to display later, but try the 3 default loaders
-            msg_from_reader = fc_exc.message
-        except Exception:
-            pass
+        if format is not None or not self._skip_associated(path, kind):
+            t_0 = time.time()
+            try:
+                return super(Registry, self).load(path, format=format)
+            except NoKnownLoaderException as nkl_e:
+                pass  # Try the default readers
+            except FileContentsException as fc_exc:
+                # File has an associated reader but it failed.
+                # Save the error message to display later, but try the
+                # default loaders
+                msg_from_reader = fc_exc.message
+            except Exception:
+                pass
+            finally:
+                self._log_dispatch("associated", t_0)
 
         # File has no associated reader, or the associated reader failed.
-        # Try the ASCII reader
-        try:
-            ascii_loader = ascii_reader.Reader()
-            return ascii_loader.read(path)
-        except DefaultReaderException:
-            pass  # Loader specific error to try the cansas XML reader
-        except FileContentsException as e:
-            if msg_from_reader is None:
-                raise RuntimeError(e.message)
-
-        # ASCII reader failed - try CanSAS xML reader
+        # Try the default readers, the one matching the file contents first
+        ext = os.path.splitext(path)[1].lower()
+        for name in self._default_order(ext, kind):
+            module, swallow_errors = DEFAULT_READERS[name]
+            t_0 = time.time()
+            try:
+                output = module.Reader().read(path)
+                self._dispatch_cache[(ext, kind)] = name
+                return output
+            except DefaultReaderException:
+                pass  # Loader specific error to try the next reader
+            except FileContentsException as e:
+                if msg_from_reader is None:
+                    raise RuntimeError(e.message)
+            except Exception:
+                if not swallow_errors:
+                    raise
+            finally:
+                self._log_dispatch(name, t_0)
+
+        logging.error("No default loader can load the data")
+        # No known reader available. Give up and throw an error
+        if msg_from_reader is None:
+            msg = "\nUnknown data format: {}.\nThe file is not a ".format(path)
+            msg += "known format that can be loaded by SasView.\n"
+            raise NoKnownLoaderException(msg)
+        # Associated reader and default readers all failed.
+        # Show error message from associated reader
+        raise RuntimeError(msg_from_reader)
+
+    def _skip_associated(self, path, kind):
+        """
+        Check whether the readers registered for the extension of path are
+        all default readers that cannot read a file of the sniffed kind,
+        e.g. the ascii reader for a CanSAS XML file saved as .txt
+
+        :param path: file path
+        :param kind: file type returned by sniff_file_type
+        """
+        if kind not in CONCLUSIVE_TYPES:
+            return False
         try:
-            cansas_loader = cansas_reader.Reader()
-            return cansas_loader.read(path)
-        except DefaultReaderException:
-            pass  # Loader specific error to try the NXcanSAS reader
-        except FileContentsException as e:
-            if msg_from_reader is None:
-                raise RuntimeError(e.message)
-        except Exception:
-            pass
+            loaders = self.lookup(path)
+        except ValueError:
+            return False
+        others = [module.Reader for name, (module, _) in
+                  DEFAULT_READERS.iteritems() if name != kind]
+        for fn in loaders:
+            reader = getattr(fn, 'im_self', None)
+            if reader is None or type(reader) not in others:
+                return False
+        return True
+
+    def _default_order(self, ext, kind):
+        """
+        Order in which the default readers are tried.
 
-        # CanSAS XML reader failed - try NXcanSAS reader
+        A conclusive sniff only leaves the matching reader. Otherwise the
+        reader that last loaded a file with the same extension and sniffed
+        type goes first, then the sniffed reader, then the usual order.
+
+        :param ext: lower case file extension
+        :param kind: file type returned by sniff_file_type
+        """
+        if kind in CONCLUSIVE_TYPES:
+            return [kind]
+        order = list(DEFAULT_ORDER)
+        for name in (kind, self._dispatch_cache.get((ext, kind))):
+            if name in order:
+                order.remove(name)
+                order.insert(0, name)
+        return order
+
+    def _log_dispatch(self, step, t_0):
+        """
+        Record the time spent in a step of the reader dispatch
+
+        :param step: name of the step
+        :param t_0: start time of the step
+        """
+        elapsed = time.time() - t_0
+        self.dispatch_timings.append((step, elapsed))
+        logger.debug("Reader dispatch: %s took %g s", step, elapsed)
+
+    def iter_load(self, path, format=None):
+        """
+        Iterate over the data sets of a file.
+
+        If the reader for the file type of path has an iter_read method,
+        like the CanSAS XML reader, each data set is yielded as soon as it
+        has been read.  Otherwise the data sets are those returned by load.
+
+        :param path: file path
+        :param format: explicit extension, to force the use
+            of a particular reader
+        """
         try:
-            cansas_nexus_loader = cansas_reader_HDF5.Reader()
-            return cansas_nexus_loader.read(path)
-        except DefaultReaderException as e:
-            logging.error("No default loader can load the data")
-            # No known reader available. Give up and throw an error
-            if msg_from_reader is None:
-                msg = "\nUnknown data format: {}.\nThe file is not a ".format(path)
-                msg += "known format that can be loaded by SasView.\n"
-                raise NoKnownLoaderException(msg)
+            if format is None:
+                loaders = self.lookup(path)
             else:
-                # Associated reader and default readers all failed.
-                # Show error message from associated reader
-                raise RuntimeError(msg_from_reader)
-        except FileContentsException as e:
-            err_msg = msg_from_reader if msg_from_reader is not None else e.message
-            raise RuntimeError(err_msg)
+                loaders = self.loaders[format]
+        except (ValueError, KeyError):
+            loaders = []
+        for fn in loaders:
+            reader = getattr(fn, 'im_self', None)
+            if hasattr(reader, 'iter_read'):
+                # Use a new reader so that iterations do not share state
+                return reader.__class__().iter_read(path)
+        return iter(self.load(path, format=format))
 
     def find_plugins(self, dir):
         """
@@ -402,6 +545,16 @@ class Loader(object):
         """
         return self.__registry.load(file, format)
 
+    def iter_load(self, file, format=None):
+        """
+        Iterate over the data sets of a file
+
+        :param file: file name (path)
+        :param format: specified format to use (optional)
+        :return: iterator over the DataInfo objects
+        """
+        return self.__registry.iter_load(file, format)
+
     def save(self, file, data, format):
         """
         Save a DataInfo object to file
@@ -431,3 +584,9 @@ class Loader(object):
         Return the list of wildcards
         """
         return self.__registry.wildcards
+
+    def get_dispatch_timings(self):
+        """
+        Return the (step, seconds) spent finding the reader in the last load
+        """
+        return self.__registry.dispatch_timings
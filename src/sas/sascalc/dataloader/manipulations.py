@@ -26,6 +26,7 @@ import sys
 
 #from data_info import plottable_2D
 from data_info import Data1D
+from sas.sascalc.data_util.cache import array_digest, LRUCache
 
 
 def get_q(dx, dy, det_dist, wavelength):
@@ -220,14 +221,21 @@ def get_dq_data(data2D):
     # Final protection of dq
     if dq_overlap < 0:
         dq_overlap = dqy_at_z_min
-    dqx_data = data2D.dqx_data[np.isfinite(data2D.data)]
     dqy_data = data2D.dqy_data[np.isfinite(
         data2D.data)] - dq_overlap
     # def; dqx_data = dq_r dqy_data = dq_phi
     # Convert dq 2D to 1D here
-    dq_data = np.sqrt(dqx_data**2 + dqx_data**2)
+    dq_data = _get_pixel_dq(data2D)[np.isfinite(data2D.data)]
     return dq_data
 
+def _get_pixel_dq(data2D):
+    """
+    Get the 1D dq of every pixel, including those with non-finite
+    intensities (see get_dq_data)
+    """
+    dqx_data = data2D.dqx_data
+    return np.sqrt(dqx_data**2 + dqx_data**2)
+
 ################################################################################
 
 def reader2D_converter(data2d=None):
@@ -300,6 +308,132 @@ class Binning(object):
         # Bin index calulation
         return int(math.floor(temp_x / temp_y))
 
+    def get_bin_indices(self, values):
+        '''
+        Vectorized version of get_bin_index for an array of values.
+        Values for which no index can be computed (e.g. log of 0)
+        are returned as an out-of-range index.
+        '''
+        values = np.asarray(values, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self.base:
+                log_base = math.log(self.base)
+                temp_x = self.n_bins * (np.log(values) / log_base - math.log(self.min, self.base))
+                temp_y = math.log(self.max, self.base) - math.log(self.min, self.base)
+            else:
+                temp_x = self.n_bins * (values - self.min)
+                temp_y = self.max - self.min
+            temp = np.floor(temp_x / temp_y)
+        temp[~np.isfinite(temp)] = -self.n_bins - 1
+        return temp.astype(int)
+
+
+def _bin_sums(data2D, index, bins, nbins, x_values=None, with_dq=False):
+    """
+    Accumulate the per-bin sums used by the averaging classes
+    for all the pixels of a region of interest at once.
+
+    This is the vectorized equivalent of the per-pixel loops: pixels
+    with non-finite intensities are skipped, and the error on a pixel
+    with no uncertainty is taken as sqrt(abs(I)).
+
+    :param data2D: Data2D object
+    :param index: indices of the pixels inside the region of interest
+    :param bins: bin index of each pixel in index
+    :param nbins: number of bins
+    :param x_values: values to sum into x for each pixel in index
+    :param with_dq: if True, sum the dq of each pixel (see get_dq_data)
+
+    :return: sums of x, y, err_y**2 and dq, and the counts in each bin
+    """
+    finite = np.isfinite(data2D.data)
+    keep = finite[index]
+    if not keep.all():
+        index = index[keep]
+        bins = bins[keep]
+        if x_values is not None:
+            x_values = x_values[keep]
+
+    bins = _wrap_bins(bins, nbins)
+
+    data = data2D.data[index]
+    if data2D.err_data is None:
+        err_2 = np.fabs(data)
+    else:
+        err_data = data2D.err_data[index]
+        err_2 = np.where(err_data == 0.0, np.fabs(data), err_data * err_data)
+
+    y = np.bincount(bins, weights=data, minlength=nbins)
+    err_y = np.bincount(bins, weights=err_2, minlength=nbins)
+    y_counts = np.bincount(bins, minlength=nbins).astype(float)
+    x = None
+    if x_values is not None:
+        x = np.bincount(bins, weights=x_values, minlength=nbins)
+    err_x = None
+    if with_dq:
+        err_x = np.bincount(bins, weights=_get_pixel_dq(data2D)[index],
+                            minlength=nbins)
+    return x, y, err_y, err_x, y_counts
+
+
+def _wrap_bins(bins, nbins):
+    """
+    Check the bin indices, wrapping negative indices around
+    as they would be with python indexing.
+    """
+    if len(bins) > 0 and bins.min() < 0:
+        if bins.min() < -nbins:
+            raise IndexError("Averaging: bin index out of range")
+        bins = np.where(bins < 0, bins + nbins, bins)
+    if len(bins) > 0 and bins.max() >= nbins:
+        raise IndexError("Averaging: bin index out of range")
+    return bins
+
+
+class BinCache(LRUCache):
+    """
+    Least recently used cache of the pixel to bin assignments
+    of the averaging classes.
+
+    The entries are keyed on the detector geometry (qx, qy, q and,
+    if used, the mask) and on the parameters of the region of interest,
+    so repeated reductions of frames sharing the same geometry only
+    need to accumulate the intensities.
+    """
+
+    def get_bins(self, roi_key, data2D, compute, use_mask=False):
+        """
+        Return the bins for the given region of interest and detector,
+        calling compute() to build them if they are not cached yet.
+
+        :param roi_key: hashable description of the region of interest
+        :param data2D: Data2D object
+        :param compute: function returning the tuple of index arrays
+        :param use_mask: if True, the mask of data2D is part of the key
+        """
+        if self.max_size <= 0:
+            return compute()
+        key = (roi_key,
+               array_digest(data2D.qx_data),
+               array_digest(data2D.qy_data),
+               array_digest(data2D.q_data),
+               array_digest(data2D.mask) if use_mask else None)
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            value = compute()
+            # The arrays are shared between calls: protect them
+            for item in value:
+                item.setflags(write=False)
+            self.put(key, value)
+        return value
+
+
+# Cache shared by all the averaging classes
+bin_cache = BinCache()
+
 
 ################################################################################
 
@@ -323,6 +457,9 @@ class _Slab(object):
         # If True, I(|Q|) will be return, otherwise,
         # negative q-values are allowed
         self.fold = False
+        # If True, use the per-pixel reference loop instead of
+        # the vectorized binning
+        self.reference_loop = False
 
     def __call__(self, data2D):
         return NotImplemented
@@ -342,12 +479,21 @@ class _Slab(object):
             msg += " detectors: %g" % len(data2D.detector)
             raise RuntimeError(msg)
 
-        # Get data
-        data = data2D.data[np.isfinite(data2D.data)]
-        err_data = data2D.err_data[np.isfinite(data2D.data)]
-        qx_data = data2D.qx_data[np.isfinite(data2D.data)]
-        qy_data = data2D.qy_data[np.isfinite(data2D.data)]
+        if self.reference_loop:
+            sums = self._sum_loop(data2D, maj, self._get_nbins(maj))
+        else:
+            sums = _bin_sums(data2D, *self._bin_plan(data2D, maj))
+        x, y, err_y, _, idx = self._average(sums, maj)
 
+        if not idx.any():
+            msg = "Average Error: No points inside ROI to average..."
+            raise ValueError(msg)
+        return Data1D(x=x[idx], y=y[idx], dy=err_y[idx])
+
+    def _get_nbins(self, maj):
+        """
+        Number of bins on the major axis
+        """
         # Build array of Q intervals
         if maj == 'x':
             if self.fold:
@@ -363,6 +509,77 @@ class _Slab(object):
             nbins = int(math.ceil((self.y_max - y_min) / self.bin_width))
         else:
             raise RuntimeError("_Slab._avg: unrecognized axis %s" % str(maj))
+        return nbins
+
+    def _bin_plan(self, data2D, maj):
+        """
+        Get the arguments of _bin_sums for the region of interest.
+        """
+        nbins = self._get_nbins(maj)
+        roi_key = ('slab', maj, self.x_min, self.x_max, self.y_min,
+                   self.y_max, self.bin_width, self.fold)
+        index, bins, q_values = bin_cache.get_bins(
+            roi_key, data2D, lambda: self._get_bins(data2D, maj, nbins))
+        return index, bins, nbins, q_values, False
+
+    def _average(self, sums, maj):
+        """
+        Turn the sums over the bins into averages.
+
+        :param sums: x, y, err_y**2, dq sums and counts, see _bin_sums
+        :param maj: major axis, 'x' or 'y'
+        :return: x, y, dy and dx of every bin, and the bins to keep
+        """
+        x, y, err_y, _, y_counts = sums
+
+        # Average the sums
+        err_y = np.sqrt(err_y)
+
+        err_y = err_y / y_counts
+        y = y / y_counts
+        x = x / y_counts
+        idx = (np.isfinite(y) & np.isfinite(x))
+        return x, y, err_y, None, idx
+
+    def _get_bins(self, data2D, maj, nbins):
+        """
+        Find the pixels inside the ROI and their bin on the major axis.
+
+        :param data2D: Data2D object
+        :param maj: major axis, 'x' or 'y'
+        :param nbins: number of bins
+        :return: pixel indices, bin indices and q-values on the major axis
+        """
+        qx_data = data2D.qx_data
+        qy_data = data2D.qy_data
+        in_roi = ((self.x_min <= qx_data) & (self.x_max > qx_data) &
+                  (self.y_min <= qy_data) & (self.y_max > qy_data))
+        index = np.flatnonzero(in_roi)
+        if maj == 'x':
+            q_values = qx_data[index]
+            min_value = 0 if self.fold else self.x_min
+        else:
+            q_values = qy_data[index]
+            min_value = 0 if self.fold else self.y_min
+        if self.fold:
+            q_values = np.fabs(q_values)
+        bins = np.ceil((q_values - min_value) / self.bin_width).astype(int) - 1
+
+        # skip outside of max bins
+        inside = (bins >= 0) & (bins < nbins)
+        return index[inside], bins[inside], q_values[inside]
+
+    def _sum_loop(self, data2D, maj, nbins):
+        """
+        Reference per-pixel implementation of the sums in _avg.
+        """
+        # Get data
+        data = data2D.data[np.isfinite(data2D.data)]
+        err_data = data2D.err_data[np.isfinite(data2D.data)]
+        qx_data = data2D.qx_data[np.isfinite(data2D.data)]
+        qy_data = data2D.qy_data[np.isfinite(data2D.data)]
+        x_min = 0 if self.fold else self.x_min
+        y_min = 0 if self.fold else self.y_min
 
         x = np.zeros(nbins)
         y = np.zeros(nbins)
@@ -411,26 +628,15 @@ class _Slab(object):
             else:
                 err_y[i_q] += frac * frac * err_data[npts] * err_data[npts]
             y_counts[i_q] += frac
-
-        # Average the sums
-        for n in range(nbins):
-            err_y[n] = math.sqrt(err_y[n])
-
-        err_y = err_y / y_counts
-        y = y / y_counts
-        x = x / y_counts
-        idx = (np.isfinite(y) & np.isfinite(x))
-
-        if not idx.any():
-            msg = "Average Error: No points inside ROI to average..."
-            raise ValueError(msg)
-        return Data1D(x=x[idx], y=y[idx], dy=err_y[idx])
+        return x, y, err_y, None, y_counts
 
 
 class SlabY(_Slab):
     """
     Compute average I(Qy) for a region of interest
     """
+    # Extra arguments of _bin_plan and _average for average_frames
+    _frame_args = ('y',)
 
     def __call__(self, data2D):
         """
@@ -446,6 +652,8 @@ class SlabX(_Slab):
     """
     Compute average I(Qx) for a region of interest
     """
+    # Extra arguments of _bin_plan and _average for average_frames
+    _frame_args = ('x',)
 
     def __call__(self, data2D):
         """
@@ -471,6 +679,9 @@ class Boxsum(object):
         self.y_min = y_min
         # Maximum Qy value [A-1]
         self.y_max = y_max
+        # If True, use the per-pixel reference loop instead of
+        # the vectorized sum
+        self.reference_loop = False
 
     def __call__(self, data2D):
         """
@@ -501,6 +712,33 @@ class Boxsum(object):
             msg = "Circular averaging: invalid number "
             msg += "of detectors: %g" % len(data2D.detector)
             raise RuntimeError(msg)
+        if self.reference_loop:
+            return self._sum_loop(data2D)
+
+        roi_key = ('box', self.x_min, self.x_max, self.y_min, self.y_max)
+        index, bins = bin_cache.get_bins(roi_key, data2D,
+                                         lambda: self._get_bins(data2D))
+        _, y, err_y, _, y_counts = _bin_sums(data2D, index, bins, 1)
+        return y[0], err_y[0], y_counts[0]
+
+    def _get_bins(self, data2D):
+        """
+        Find the pixels inside the box.
+
+        :param data2D: Data2D object
+        :return: pixel indices, and a single bin for all of them
+        """
+        qx_data = data2D.qx_data
+        qy_data = data2D.qy_data
+        in_roi = ((self.x_min <= qx_data) & (self.x_max > qx_data) &
+                  (self.y_min <= qy_data) & (self.y_max > qy_data))
+        index = np.flatnonzero(in_roi)
+        return index, np.zeros(len(index), dtype=int)
+
+    def _sum_loop(self, data2D):
+        """
+        Reference per-pixel implementation of _sum.
+        """
         # Get data
         data = data2D.data[np.isfinite(data2D.data)]
         err_data = data2D.err_data[np.isfinite(data2D.data)]
@@ -583,6 +821,9 @@ class CircularAverage(object):
         self.r_max = r_max
         # Bin width (step size) [A-1]
         self.bin_width = bin_width
+        # If True, use the per-pixel reference loop instead of
+        # the vectorized binning
+        self.reference_loop = False
 
     def __call__(self, data2D, ismask=False):
         """
@@ -591,6 +832,93 @@ class CircularAverage(object):
         :param data2D: Data2D object
         :return: Data1D object
         """
+        if not np.isfinite(data2D.data).any():
+            msg = "Circular averaging: invalid q_data: %g" % data2D.q_data
+            raise RuntimeError(msg)
+
+        if self.reference_loop:
+            # Build array of Q intervals
+            nbins = int(math.ceil((self.r_max - self.r_min) / self.bin_width))
+            sums = self._sum_loop(data2D, ismask, nbins)
+        else:
+            sums = _bin_sums(data2D, *self._bin_plan(data2D, ismask))
+        x, y, err_y, err_x, idx = self._average(sums)
+
+        if err_x is not None:
+            d_x = err_x[idx]
+        else:
+            d_x = None
+
+        if not idx.any():
+            msg = "Average Error: No points inside ROI to average..."
+            raise ValueError(msg)
+
+        return Data1D(x=x[idx], y=y[idx], dy=err_y[idx], dx=d_x)
+
+    def _bin_plan(self, data2D, ismask=False):
+        """
+        Get the arguments of _bin_sums for the region of interest.
+        """
+        # No need to calculate the frac when all data are within range
+        if self.r_min >= self.r_max:
+            raise ValueError("Limit Error: min > max")
+
+        # Build array of Q intervals
+        nbins = int(math.ceil((self.r_max - self.r_min) / self.bin_width))
+        roi_key = ('circular', self.r_min, self.r_max, self.bin_width,
+                   bool(ismask))
+        index, bins = bin_cache.get_bins(
+            roi_key, data2D, lambda: self._get_bins(data2D, ismask, nbins),
+            use_mask=ismask)
+        with_dq = (data2D.dqx_data is not None and
+                   data2D.dqy_data is not None)
+        return index, bins, nbins, data2D.q_data[index], with_dq
+
+    def _average(self, sums):
+        """
+        Turn the sums over the bins into averages.
+
+        :param sums: x, y, err_y**2, dq sums and counts, see _bin_sums
+        :return: x, y, dy and dx of every bin, and the bins to keep
+        """
+        x, y, err_y, err_x, y_counts = sums
+
+        # Average the sums
+        err_y = np.sqrt(np.fabs(err_y))
+
+        err_y = err_y / y_counts
+        err_y[err_y == 0] = np.average(err_y)
+        y = y / y_counts
+        x = x / y_counts
+        idx = (np.isfinite(y)) & (np.isfinite(x))
+        if err_x is not None:
+            err_x = err_x / y_counts
+        return x, y, err_y, err_x, idx
+
+    def _get_bins(self, data2D, ismask, nbins):
+        """
+        Find the pixels inside the ring and their q bin.
+
+        :param data2D: Data2D object
+        :param ismask: if True, only use the pixels where data2D.mask is set
+        :param nbins: number of bins
+        :return: pixel indices and bin indices
+        """
+        q_data = data2D.q_data
+        in_roi = (self.r_min <= q_data) & (q_data <= self.r_max)
+        if ismask:
+            in_roi &= data2D.mask.astype(bool)
+        index = np.flatnonzero(in_roi)
+        bins = np.floor((q_data[index] - self.r_min) / self.bin_width).astype(int)
+
+        # Take care of the edge case at phi = 2pi.
+        bins[bins == nbins] = nbins - 1
+        return index, bins
+
+    def _sum_loop(self, data2D, ismask, nbins):
+        """
+        Reference per-pixel implementation of the sums in __call__.
+        """
         # Get data W/ finite values
         data = data2D.data[np.isfinite(data2D.data)]
         q_data = data2D.q_data[np.isfinite(data2D.data)]
@@ -601,13 +929,6 @@ class CircularAverage(object):
         if data2D.dqx_data is not None and data2D.dqy_data is not None:
             dq_data = get_dq_data(data2D)
 
-        if len(q_data) == 0:
-            msg = "Circular averaging: invalid q_data: %g" % data2D.q_data
-            raise RuntimeError(msg)
-
-        # Build array of Q intervals
-        nbins = int(math.ceil((self.r_max - self.r_min) / self.bin_width))
-
         x = np.zeros(nbins)
         y = np.zeros(nbins)
         err_y = np.zeros(nbins)
@@ -656,31 +977,7 @@ class CircularAverage(object):
             else:
                 err_x = None
             y_counts[i_q] += frac
-
-        # Average the sums
-        for n in range(nbins):
-            if err_y[n] < 0:
-                err_y[n] = -err_y[n]
-            err_y[n] = math.sqrt(err_y[n])
-            # if err_x is not None:
-            #    err_x[n] = math.sqrt(err_x[n])
-
-        err_y = err_y / y_counts
-        err_y[err_y == 0] = np.average(err_y)
-        y = y / y_counts
-        x = x / y_counts
-        idx = (np.isfinite(y)) & (np.isfinite(x))
-
-        if err_x is not None:
-            d_x = err_x[idx] / y_counts[idx]
-        else:
-            d_x = None
-
-        if not idx.any():
-            msg = "Average Error: No points inside ROI to average..."
-            raise ValueError(msg)
-
-        return Data1D(x=x[idx], y=y[idx], dy=err_y[idx], dx=d_x)
+        return x, y, err_y, err_x, y_counts
 
 ################################################################################
 
@@ -709,6 +1006,9 @@ class Ring(object):
         self.center_y = center_y
         # Number of angular bins
         self.nbins_phi = nbins
+        # If True, use the per-pixel reference loop instead of
+        # the vectorized binning
+        self.reference_loop = False
 
     def __call__(self, data2D):
         """
@@ -722,6 +1022,71 @@ class Ring(object):
         if data2D.__class__.__name__ not in ["Data2D", "plottable_2D"]:
             raise RuntimeError("Ring averaging only take plottable_2D objects")
 
+        if self.reference_loop:
+            sums = self._sum_loop(data2D)
+        else:
+            sums = _bin_sums(data2D, *self._bin_plan(data2D))
+        phi_values, phi_bins, phi_err, _, idx = self._average(sums)
+
+        if not idx.any():
+            msg = "Average Error: No points inside ROI to average..."
+            raise ValueError(msg)
+        # elif len(phi_bins[idx])!= self.nbins_phi:
+        #    print "resulted",self.nbins_phi- len(phi_bins[idx])
+        #,"empty bin(s) due to tight binning..."
+        return Data1D(x=phi_values[idx], y=phi_bins[idx], dy=phi_err[idx])
+
+    def _bin_plan(self, data2D):
+        """
+        Get the arguments of _bin_sums for the region of interest.
+        """
+        roi_key = ('ring', self.r_min, self.r_max, self.nbins_phi)
+        index, bins = bin_cache.get_bins(
+            roi_key, data2D, lambda: self._get_bins(data2D))
+        return index, bins, self.nbins_phi, None, False
+
+    def _average(self, sums):
+        """
+        Turn the sums over the bins into averages.
+
+        :param sums: x, y, err_y**2, dq sums and counts, see _bin_sums
+        :return: phi, y, dy and dx of every bin, and the bins to keep
+        """
+        _, phi_bins, phi_err, _, phi_counts = sums
+        phi_bins = phi_bins / phi_counts
+        phi_err = np.sqrt(phi_err) / phi_counts
+        phi_values = 2.0 * math.pi / self.nbins_phi * \
+            np.arange(self.nbins_phi, dtype=float)
+        idx = (np.isfinite(phi_bins))
+        return phi_values, phi_bins, phi_err, None, idx
+
+    def _get_bins(self, data2D):
+        """
+        Find the pixels inside the ring and their phi bin.
+
+        :param data2D: Data2D object
+        :return: pixel indices and bin indices
+        """
+        Pi = math.pi
+        q_data = data2D.q_data
+        index = np.flatnonzero((self.r_min <= q_data) & (q_data <= self.r_max))
+        phi_value = np.arctan2(data2D.qy_data[index],
+                               data2D.qx_data[index]) + Pi
+
+        # Shift to apply to calculated phi values in order
+        # to center first bin at zero
+        phi_shift = Pi / self.nbins_phi
+        bins = np.floor((self.nbins_phi) *
+                        (phi_value + phi_shift) / (2 * Pi)).astype(int)
+
+        # Take care of the edge case at phi = 2pi.
+        bins[bins >= self.nbins_phi] = 0
+        return index, bins
+
+    def _sum_loop(self, data2D):
+        """
+        Reference per-pixel implementation of the sums in __call__.
+        """
         Pi = math.pi
 
         # Get data
@@ -734,7 +1099,6 @@ class Ring(object):
         # Set space for 1d outputs
         phi_bins = np.zeros(self.nbins_phi)
         phi_counts = np.zeros(self.nbins_phi)
-        phi_values = np.zeros(self.nbins_phi)
         phi_err = np.zeros(self.nbins_phi)
 
         # Shift to apply to calculated phi values in order
@@ -770,21 +1134,7 @@ class Ring(object):
             else:
                 phi_err[i_phi] += frac * frac * err_data[npt] * err_data[npt]
             phi_counts[i_phi] += frac
-
-        for i in range(self.nbins_phi):
-            phi_bins[i] = phi_bins[i] / phi_counts[i]
-            phi_err[i] = math.sqrt(phi_err[i]) / phi_counts[i]
-            phi_values[i] = 2.0 * math.pi / self.nbins_phi * (1.0 * i)
-
-        idx = (np.isfinite(phi_bins))
-
-        if not idx.any():
-            msg = "Average Error: No points inside ROI to average..."
-            raise ValueError(msg)
-        # elif len(phi_bins[idx])!= self.nbins_phi:
-        #    print "resulted",self.nbins_phi- len(phi_bins[idx])
-        #,"empty bin(s) due to tight binning..."
-        return Data1D(x=phi_values[idx], y=phi_bins[idx], dy=phi_err[idx])
+        return None, phi_bins, phi_err, None, phi_counts
 
 
 class _Sector(object):
@@ -812,6 +1162,9 @@ class _Sector(object):
         self.phi_max = phi_max
         self.nbins = nbins
         self.base = base
+        # If True, use the per-pixel reference loop instead of
+        # the vectorized binning
+        self.reference_loop = False
 
     def _agv(self, data2D, run='phi'):
         """
@@ -825,6 +1178,126 @@ class _Sector(object):
         if data2D.__class__.__name__ not in ["Data2D", "plottable_2D"]:
             raise RuntimeError("Ring averaging only take plottable_2D objects")
 
+        if self.reference_loop:
+            sums = self._sum_loop(data2D, run)
+        else:
+            sums = _bin_sums(data2D, *self._bin_plan(data2D, run))
+        x, y, y_err, d_x, idx = self._average(sums, run)
+        if d_x is not None:
+            d_x = d_x[idx]
+        if not idx.any():
+            msg = "Average Error: No points inside sector of ROI to average..."
+            raise ValueError(msg)
+        # elif len(y[idx])!= self.nbins:
+        #    print "resulted",self.nbins- len(y[idx]),
+        # "empty bin(s) due to tight binning..."
+        return Data1D(x=x[idx], y=y[idx], dy=y_err[idx], dx=d_x)
+
+    def _bin_plan(self, data2D, run='phi'):
+        """
+        Get the arguments of _bin_sums for the region of interest.
+        """
+        roi_key = ('sector', run.lower(), self.r_min, self.r_max,
+                   self.phi_min, self.phi_max, self.nbins, self.base)
+        index, bins = bin_cache.get_bins(
+            roi_key, data2D, lambda: self._get_bins(data2D, run))
+        with_dq = (data2D.dqx_data is not None and
+                   data2D.dqy_data is not None)
+        return index, bins, self.nbins, data2D.q_data[index], with_dq
+
+    def _average(self, sums, run='phi'):
+        """
+        Turn the sums over the bins into averages.
+
+        :param sums: x, y, err_y**2, dq sums and counts, see _bin_sums
+        :param run:  define the varying parameter ('phi' , 'q' , or 'q2')
+        :return: x, y, dy and dx of every bin, and the bins to keep
+        """
+        x, y, y_err, x_err, y_counts = sums
+
+        # Organize the results
+        y = y / y_counts
+        y_err = np.sqrt(y_err) / y_counts
+
+        # The type of averaging: phi,q2, or q
+        # Calculate x[i]should be at the center of the bin
+        if run.lower() == 'phi':
+            x = (self.phi_max - self.phi_min) / self.nbins * \
+                (np.arange(self.nbins, dtype=float) + 0.5) + self.phi_min
+        else:
+            # We take the center of ring area, not radius.
+            # This is more accurate than taking the radial center of ring.
+            # delta_r = (self.r_max - self.r_min) / self.nbins
+            # r_inner = self.r_min + delta_r * i
+            # r_outer = r_inner + delta_r
+            # x[i] = math.sqrt((r_inner * r_inner + r_outer * r_outer) / 2)
+            x = x / y_counts
+        y_err[y_err == 0] = np.average(y_err)
+        idx = (np.isfinite(y) & np.isfinite(y_err))
+        if x_err is not None:
+            x_err = x_err / y_counts
+        return x, y, y_err, x_err, idx
+
+    def _get_bins(self, data2D, run='phi'):
+        """
+        Find the pixels inside the sector and their bin.
+
+        :param data2D: Data2D object
+        :param run:  define the varying parameter ('phi' , 'q' , or 'q2')
+        :return: pixel indices and bin indices
+        """
+        q_data = data2D.q_data
+
+        # No need to calculate: data outside of the radius
+        index = np.flatnonzero((self.r_min <= q_data) & (q_data <= self.r_max))
+
+        # phi-value of the pixels
+        phi_value = np.arctan2(data2D.qy_data[index],
+                               data2D.qx_data[index]) + math.pi
+
+        # Get the min and max into the region: 0 <= phi < 2Pi
+        phi_min = flip_phi(self.phi_min)
+        phi_max = flip_phi(self.phi_max)
+
+        # In case of two ROIs (symmetric major and minor regions)(for 'q2')
+        is_in = np.zeros(len(index), dtype=bool)
+        if run.lower() == 'q2':
+            # For minor sector wing
+            # Calculate the minor wing phis
+            phi_min_minor = flip_phi(phi_min - math.pi)
+            phi_max_minor = flip_phi(phi_max - math.pi)
+            # Check if phis of the minor ring is within 0 to 2pi
+            if phi_min_minor > phi_max_minor:
+                is_in = ((phi_value > phi_min_minor) |
+                         (phi_value < phi_max_minor))
+            else:
+                is_in = ((phi_value > phi_min_minor) &
+                         (phi_value < phi_max_minor))
+
+        # For all cases(i.e.,for 'q', 'q2', and 'phi')
+        # Find pixels within ROI
+        if phi_min > phi_max:
+            is_in |= (phi_value > phi_min) | (phi_value < phi_max)
+        else:
+            is_in |= (phi_value >= phi_min) & (phi_value < phi_max)
+        index = index[is_in]
+
+        # Get the binning index
+        if run.lower() == 'phi':
+            binning = Binning(self.phi_min, self.phi_max, self.nbins, self.base)
+            bins = binning.get_bin_indices(phi_value[is_in])
+        else:
+            binning = Binning(self.r_min, self.r_max, self.nbins, self.base)
+            bins = binning.get_bin_indices(q_data[index])
+
+        # Take care of the edge case at phi = 2pi.
+        bins[bins == self.nbins] = self.nbins - 1
+        return index, bins
+
+    def _sum_loop(self, data2D, run='phi'):
+        """
+        Reference per-pixel implementation of the sums in _agv.
+        """
         # Get the all data & info
         data = data2D.data[np.isfinite(data2D.data)]
         q_data = data2D.q_data[np.isfinite(data2D.data)]
@@ -925,38 +1398,7 @@ class _Sector(object):
             else:
                 x_err = None
             y_counts[i_bin] += 1
-
-        # Organize the results
-        for i in range(self.nbins):
-            y[i] = y[i] / y_counts[i]
-            y_err[i] = math.sqrt(y_err[i]) / y_counts[i]
-
-            # The type of averaging: phi,q2, or q
-            # Calculate x[i]should be at the center of the bin
-            if run.lower() == 'phi':
-                x[i] = (self.phi_max - self.phi_min) / self.nbins * \
-                    (1.0 * i + 0.5) + self.phi_min
-            else:
-                # We take the center of ring area, not radius.
-                # This is more accurate than taking the radial center of ring.
-                # delta_r = (self.r_max - self.r_min) / self.nbins
-                # r_inner = self.r_min + delta_r * i
-                # r_outer = r_inner + delta_r
-                # x[i] = math.sqrt((r_inner * r_inner + r_outer * r_outer) / 2)
-                x[i] = x[i] / y_counts[i]
-        y_err[y_err == 0] = np.average(y_err)
-        idx = (np.isfinite(y) & np.isfinite(y_err))
-        if x_err is not None:
-            d_x = x_err[idx] / y_counts[idx]
-        else:
-            d_x = None
-        if not idx.any():
-            msg = "Average Error: No points inside sector of ROI to average..."
-            raise ValueError(msg)
-        # elif len(y[idx])!= self.nbins:
-        #    print "resulted",self.nbins- len(y[idx]),
-        # "empty bin(s) due to tight binning..."
-        return Data1D(x=x[idx], y=y[idx], dy=y_err[idx], dx=d_x)
+        return x, y, y_err, x_err, y_counts
 
 
 class SectorPhi(_Sector):
@@ -967,6 +1409,8 @@ class SectorPhi(_Sector):
     A sector is defined by r_min, r_max, phi_min, phi_max.
     The number of bin in phi also has to be defined.
     """
+    # Extra arguments of _bin_plan and _average for average_frames
+    _frame_args = ('phi',)
 
     def __call__(self, data2D):
         """
@@ -987,6 +1431,8 @@ class SectorQ(_Sector):
     r_min, r_max, phi_min, phi_max >0.
     The number of bin in Q also has to be defined.
     """
+    # Extra arguments of _bin_plan and _average for average_frames
+    _frame_args = ('q2',)
 
     def __call__(self, data2D):
         """
@@ -1000,6 +1446,154 @@ class SectorQ(_Sector):
 
 ################################################################################
 
+def _stack_sums(data, err_data, index, bins, nbins, x_values=None,
+                dq_data=None):
+    """
+    Accumulate the sums of _bin_sums for a stack of frames at once,
+    using a sparse matrix mapping the pixels to the bins.
+
+    :param data: (n_frames, n_pixels) intensities
+    :param err_data: (n_frames, n_pixels) uncertainties, or None
+    :param index: indices of the pixels inside the region of interest
+    :param bins: bin index of each pixel in index
+    :param nbins: number of bins
+    :param x_values: values to sum into x for each pixel in index
+    :param dq_data: dq of each pixel in index, or None
+
+    :return: sums of x, y, err_y**2 and dq, and the counts in each bin,
+        as (n_frames, nbins) arrays
+    """
+    from scipy import sparse
+
+    bins = _wrap_bins(bins, nbins)
+    columns = np.arange(len(index))
+
+    def bin_matrix(weights):
+        return sparse.csr_matrix((weights, (bins, columns)),
+                                 shape=(nbins, len(index)))
+
+    data = data[:, index]
+    finite = np.isfinite(data)
+    data[~finite] = 0.0
+    if err_data is None:
+        err_2 = np.fabs(data)
+    else:
+        err_data = err_data[:, index]
+        err_2 = np.where(err_data == 0.0, np.fabs(data), err_data * err_data)
+        err_2[~finite] = 0.0
+    finite = finite.astype(float)
+
+    matrix = bin_matrix(np.ones(len(index)))
+    y = matrix.dot(data.T).T
+    err_y = matrix.dot(err_2.T).T
+    y_counts = matrix.dot(finite.T).T
+    x = None
+    if x_values is not None:
+        x = bin_matrix(x_values).dot(finite.T).T
+    err_x = None
+    if dq_data is not None:
+        err_x = bin_matrix(dq_data).dot(finite.T).T
+    return x, y, err_y, err_x, y_counts
+
+
+def _iter_frame_chunks(frames, err_frames, chunk_size):
+    """
+    Split the frames into (data, err_data) blocks of at most
+    chunk_size frames.
+    """
+    if isinstance(frames, np.ndarray):
+        if frames.ndim != 2:
+            raise ValueError("average_frames: frames must be a 2D array")
+        for start in range(0, len(frames), chunk_size):
+            stop = start + chunk_size
+            err_data = None
+            if err_frames is not None:
+                err_data = np.asarray(err_frames[start:stop], dtype=float)
+            yield np.array(frames[start:stop], dtype=float), err_data
+        return
+
+    data, err_data = [], []
+    for frame in frames:
+        data.append(frame.data)
+        err_data.append(frame.err_data)
+        if len(data) == chunk_size:
+            yield _stack_frames(data, err_data)
+            data, err_data = [], []
+    if data:
+        yield _stack_frames(data, err_data)
+
+
+def _stack_frames(data, err_data):
+    """
+    Stack the data and errors of a list of frames
+    """
+    if any(err is None for err in err_data):
+        return np.array(data, dtype=float), None
+    return np.array(data, dtype=float), np.array(err_data, dtype=float)
+
+
+def average_frames(averager, data2D, frames, err_frames=None,
+                   as_array=False, chunk_size=16):
+    """
+    Apply an averaging object to a series of frames sharing the
+    detector geometry of data2D.
+
+    The pixels are assigned to the bins once for the whole series and
+    the sums for each block of frames are done with a single sparse
+    matrix product. The result for each frame is the same as calling
+    averager(frame).
+
+    :param averager: CircularAverage, Ring, SectorQ, SectorPhi,
+        SlabX or SlabY object
+    :param data2D: Data2D object giving the geometry (qx, qy, q and dq)
+    :param frames: (n_frames, n_pixels) array of intensities,
+        or an iterable of Data2D objects
+    :param err_frames: (n_frames, n_pixels) array of uncertainties when
+        frames is an array; sqrt(abs(I)) is used if not given
+    :param as_array: if True, return x, y, dy and dx as
+        (n_frames, n_bins) arrays, with nan for the empty bins
+        (dx is None without resolution information)
+    :param chunk_size: number of frames summed at once
+
+    :return: list of Data1D objects, or arrays if as_array is True
+    """
+    if not hasattr(averager, '_bin_plan'):
+        msg = "average_frames: cannot average frames with %s"
+        raise TypeError(msg % averager.__class__.__name__)
+    args = getattr(averager, '_frame_args', ())
+    index, bins, nbins, x_values, with_dq = \
+        averager._bin_plan(data2D, *args)
+    dq_data = _get_pixel_dq(data2D)[index] if with_dq else None
+
+    results = []
+    for data, err_data in _iter_frame_chunks(frames, err_frames, chunk_size):
+        sums = _stack_sums(data, err_data, index, bins, nbins,
+                           x_values=x_values, dq_data=dq_data)
+        for i in range(len(data)):
+            frame_sums = [None if item is None else item[i] for item in sums]
+            x, y, dy, dx, idx = averager._average(frame_sums, *args)
+            if as_array:
+                for item in (x, y, dy, dx):
+                    if item is not None:
+                        item[~idx] = np.nan
+                results.append((x, y, dy, dx))
+            elif not idx.any():
+                msg = "Average Error: No points inside ROI to average "
+                msg += "in frame %d..." % len(results)
+                raise ValueError(msg)
+            else:
+                d_x = None if dx is None else dx[idx]
+                results.append(Data1D(x=x[idx], y=y[idx], dy=dy[idx], dx=d_x))
+
+    if not as_array:
+        return results
+    x, y, dy, dx = [np.array(item) for item in zip(*results)] or [None] * 4
+    if not with_dq:
+        dx = None
+    return x, y, dy, dx
+
+################################################################################
+
 class Ringcut(object):
     """
     Defines a ring on a 2D data set.
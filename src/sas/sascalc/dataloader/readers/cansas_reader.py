@@ -38,6 +38,16 @@ try:
 except ImportError:
     HAS_CONVERTER = False
 
+# Data set attribute of each Idata column, None for those not stored
+IDATA_COLUMNS = {"Q": "x", "I": "y", "Qdev": "dx", "Idev": "dy",
+                 "dQw": "dxw", "dQl": "dxl", "Qmean": None,
+                 "Shadowfactor": None}
+
+# Comment standing for the SASdata element in the document written by Reader.write
+DATA_PLACEHOLDER = "SASdata"
+# Number of 2D values formatted at once when streaming a Data2D
+CHUNK_SIZE = 100000
+
 CONSTANTS = CansasConstants()
 CANSAS_FORMAT = CONSTANTS.format
 CANSAS_NS = CONSTANTS.names
@@ -59,6 +69,8 @@ class Reader(XMLreader):
     # Temporary storage location for loading multiple data sets in a single file
     current_data1d = None
     data = None
+    # Set while the Idata points of the current SASdata have already been read
+    idata_read = False
     # Wildcards
     type = ["XML files (*.xml)|*.xml", "SasView Save Files (*.svs)|*.svs"]
     # List of allowed extensions
@@ -125,15 +137,7 @@ class Reader(XMLreader):
             self.set_processing_instructions()
 
             for entry in entry_list:
-                self.current_datainfo.filename = basename + self.extension
-                self.current_datainfo.meta_data["loader"] = "CanSAS XML 1D"
-                self.current_datainfo.meta_data[PREPROCESS] = self.processing_instructions
-                self._parse_entry(entry)
-                has_error_dx = self.current_dataset.dx is not None
-                has_error_dy = self.current_dataset.dy is not None
-                self.remove_empty_q_values(has_error_dx=has_error_dx,
-                    has_error_dy=has_error_dy)
-                self.send_to_output() # Combine datasets with DataInfo
+                self._read_entry(entry, basename + self.extension)
                 self.current_datainfo = DataInfo() # Reset DataInfo
         except FileContentsException as fc_exc:
             # File doesn't meet schema - try loading with a less strict schema
@@ -169,11 +173,130 @@ class Reader(XMLreader):
             raise FileContentsException(e.message)
 
 
-    def load_file_and_schema(self, xml_file, schema_path=""):
+    def iter_read(self, xml_file, validate=True):
+        """
+        Read a CanSAS XML file one SASentry at a time
+
+        The file is parsed incrementally with etree.iterparse and the data
+        set of each SASentry is yielded as soon as the entry is complete.
+        The elements of the entries already read are then discarded, so the
+        memory used does not grow with the number of entries.
+
+        When validate is True, the file is checked against the schema of
+        its CanSAS version while it is parsed instead of before reading it.
+        If the check fails, the rest of the file is read without validation
+        and the schema error is added to the errors of the last data set
+        yielded and of the following ones.
+
+        :param xml_file: The path of the file
+        :param validate: Check the file against the CanSAS schema
+        :raises FileContentsException: If the file cannot be read
+        """
+        self.reset_state()
+        if not os.path.isfile(xml_file):
+            msg = "Unable to find file at: {}\n".format(xml_file)
+            raise FileContentsException(msg)
+        basename, extension = os.path.splitext(os.path.basename(xml_file))
+        self.extension = extension.lower()
+        filename = basename + self.extension
+
+        # The version on the root element selects the namespace and schema
+        try:
+            _, root = next(etree.iterparse(xml_file, events=("start",)))
+        except (etree.XMLSyntaxError, StopIteration):
+            msg = "SasView cannot load {}.\nInvalid XML syntax".format(xml_file)
+            raise FileContentsException(msg)
+        self.cansas_version = root.get("version", "1.0")
+        self.cansas_defaults = CANSAS_NS.get(self.cansas_version, "1.0")
+        namespace = self.cansas_defaults.get("ns")
+        self.base_ns = "{" + namespace + "}"
+        self.names.append("SASentry")
+
+        schema = None
+        error = None
+        if validate:
+            schema = etree.XMLSchema(etree.parse(self._schema_path(),
+                                                 parser=xml_reader.PARSER))
+            location = root.get("{http://www.w3.org/2001/XMLSchema-instance}schemaLocation")
+            if location is None or location.rsplit(" ")[0] != namespace:
+                error = INVALID_XML.format(filename)
+                schema = None
+        del root
+
+        last = None
+        n_read = 0
+        while True:
+            to_skip = n_read
+            parser = etree.iterparse(xml_file, events=("end",),
+                                     tag=self.base_ns + "SASentry",
+                                     remove_comments=True, schema=schema)
+            try:
+                for _, entry in parser:
+                    data = None
+                    if to_skip > 0:
+                        # Entry yielded before the schema check failed
+                        to_skip -= 1
+                    else:
+                        if n_read == 0:
+                            self.xmlroot = entry.getparent()
+                            self.set_processing_instructions()
+                        self.current_datainfo = DataInfo()
+                        self._read_entry(entry, filename)
+                        self.sort_one_d_data()
+                        self.sort_two_d_data()
+                        data = self.output.pop()
+                        if error is not None:
+                            data.errors.append(error)
+                        n_read += 1
+                    # Discard the entries already read
+                    entry.clear()
+                    while entry.getprevious() is not None:
+                        del entry.getparent()[0]
+                    if data is not None:
+                        last = data
+                        yield data
+                return
+            except etree.XMLSyntaxError as exc:
+                schema_errors = exc.error_log.filter_domains(
+                    etree.ErrorDomains.SCHEMASV)
+                if schema is None or len(schema_errors) == 0:
+                    msg = "SasView cannot load {}.\nInvalid XML syntax".format(xml_file)
+                    raise FileContentsException(msg)
+                # Read the rest of the file without validation
+                error = INVALID_XML.format(filename) + schema_errors[0].message
+                if last is not None:
+                    last.errors.append(error)
+                schema = None
+
+    def _read_entry(self, entry, filename):
+        """
+        Read a SASentry element and send its data set to the output
+
+        :param entry: The SASentry element
+        :param filename: The name of the file, without its directory
+        """
+        self.current_datainfo.filename = filename
+        self.current_datainfo.meta_data["loader"] = "CanSAS XML 1D"
+        self.current_datainfo.meta_data[PREPROCESS] = self.processing_instructions
+        self._parse_entry(entry)
+        has_error_dx = self.current_dataset.dx is not None
+        has_error_dy = self.current_dataset.dy is not None
+        self.remove_empty_q_values(has_error_dx=has_error_dx,
+            has_error_dy=has_error_dy)
+        self.send_to_output() # Combine datasets with DataInfo
+
+    def _schema_path(self):
+        """
+        Path of the schema of the CanSAS version of the file
+        """
         base_name = xml_reader.__file__
         base_name = base_name.replace("\\", "/")
         base = base_name.split("/sas/")[0]
+        return "{}/sas/sascalc/dataloader/readers/schema/{}".format(
+            base, self.cansas_defaults.get("schema").replace("\\", "/")
+        )
 
+    def load_file_and_schema(self, xml_file, schema_path=""):
         # Try and parse the XML file
         try:
             self.set_xml_file(xml_file)
@@ -185,9 +308,7 @@ class Reader(XMLreader):
         self.cansas_defaults = CANSAS_NS.get(self.cansas_version, "1.0")
 
         if schema_path == "":
-            schema_path = "{}/sas/sascalc/dataloader/readers/schema/{}".format(
-                base, self.cansas_defaults.get("schema").replace("\\", "/")
-            )
+            schema_path = self._schema_path()
         self.set_schema(schema_path)
 
     def is_cansas(self, ext="xml"):
@@ -233,6 +354,9 @@ class Reader(XMLreader):
             # Skip this iteration when loading in save state information
             if tagname == "fitting_plug_in" or tagname == "pr_inversion" or tagname == "invariant":
                 continue
+            # Skip the points already read by _parse_idata
+            if tagname == "Idata" and self.idata_read:
+                continue
             # Get where to store content
             self.names.append(tagname_original)
             self.ns_list = CONSTANTS.iterate_namespace(self.names)
@@ -248,9 +372,13 @@ class Reader(XMLreader):
                             self.current_dataset.shape = (x_bins, y_bins)
                         else:
                             self.current_dataset.shape = ()
+                    else:
+                        self.idata_read = self._parse_idata(node)
                 # Recurse to access data within the group
                 self._parse_entry(node, recurse=True)
-                if tagname == "SASsample":
+                if tagname == "SASdata":
+                    self.idata_read = False
+                elif tagname == "SASsample":
                     self.current_datainfo.sample.name = name
                 elif tagname == "beam_size":
                     self.current_datainfo.source.beam_size_name = name
@@ -587,6 +715,75 @@ class Reader(XMLreader):
                     node_value = None
         return node_value, units
 
+    def _parse_idata(self, dom):
+        """
+        Read the Idata points of a 1D SASdata element column by column
+
+        The values stored are those _parse_entry finds point by point, but
+        each column is converted to float and to the default units with one
+        array operation per unit found in the file.
+
+        :param dom: The SASdata element
+        :return: False, without storing anything, if the element holds point
+            values that have to be read point by point
+        """
+        # Points with child elements are read point by point
+        if dom.find(self.base_ns + "Idata/*/*") is not None \
+                or dom.find("Idata/*/*") is not None:
+            return False
+        nodes_by_tag = {}
+        for idata in dom.iterchildren(self.base_ns + "Idata", "Idata"):
+            for node in idata:
+                nodes_by_tag.setdefault(node.tag, []).append(node)
+        columns = {}
+        for tag, nodes in nodes_by_tag.items():
+            tagname = tag.replace(self.base_ns, "")
+            if tagname not in IDATA_COLUMNS or tagname in columns:
+                return False
+            columns[tagname] = nodes
+            self.names.extend(["Idata", tagname])
+            self.ns_list = CONSTANTS.iterate_namespace(self.names)
+            is_float = self.ns_list.ns_datatype == "float"
+            del self.names[-2:]
+            if not is_float:
+                return False
+
+        for tagname, nodes in columns.items():
+            self.names.extend(["Idata", tagname])
+            self.ns_list = CONSTANTS.iterate_namespace(self.names)
+            # Empty text fails to convert, as it does point by point
+            text = ["" if node.text is None else node.text for node in nodes]
+            values = np.array(text, dtype=float)
+            values[np.isnan(values)] = 0.0
+            units = [node.get("unit") for node in nodes]
+            unit = ""
+            for local_unit in set(units):
+                index = np.array([item == local_unit for item in units])
+                node = nodes[units.index(local_unit)]
+                values[index], value_unit = \
+                    self._unit_conversion(node, tagname, values[index])
+                # The axis units are those of the last point
+                if local_unit == units[-1]:
+                    unit = value_unit
+            del self.names[-2:]
+
+            dataset = self.current_dataset
+            if tagname == 'I' or tagname == 'Q':
+                unit_list = unit.split("|")
+                set_axis = dataset.yaxis if tagname == 'I' else dataset.xaxis
+                if len(unit_list) > 1:
+                    set_axis(unit_list[0].strip(), unit_list[1].strip())
+                else:
+                    set_axis("Intensity" if tagname == 'I' else "Q", unit)
+            attribute = IDATA_COLUMNS[tagname]
+            if attribute is None:
+                continue
+            if tagname in ('dQw', 'dQl') and getattr(dataset, attribute) is None:
+                setattr(dataset, attribute, np.empty(0))
+            setattr(dataset, attribute,
+                    np.append(getattr(dataset, attribute), values))
+        return True
+
     def _unit_conversion(self, node, tagname, node_value):
         """
         A unit converter method used to convert the data included in the file
@@ -600,7 +797,7 @@ class Reader(XMLreader):
         value_unit = ''
         err_msg = None
         default_unit = None
-        if not isinstance(node_value, float):
+        if not isinstance(node_value, (float, np.ndarray)):
             node_value = float(node_value)
         if 'unit' in attr and attr.get('unit') is not None:
             try:
@@ -692,12 +889,10 @@ class Reader(XMLreader):
 
     def _initialize_new_data_set(self, node=None):
         if node is not None:
-            for child in node:
-                if child.tag.replace(self.base_ns, "") == "Idata":
-                    for i_child in child:
-                        if i_child.tag.replace(self.base_ns, "") == "Qx":
-                            self.current_dataset = plottable_2D()
-                            return
+            for child in node.iterchildren(self.base_ns + "Idata", "Idata"):
+                for _ in child.iterchildren(self.base_ns + "Qx", "Qx"):
+                    self.current_dataset = plottable_2D()
+                    return
         self.current_dataset = plottable_1D(np.array(0), np.array(0))
 
     ## Writing Methods
@@ -705,24 +900,64 @@ class Reader(XMLreader):
         """
         Write the content of a Data1D as a CanSAS XML file
 
+        The data points are not added to the document built by _to_xml_doc
+        but streamed to the file with etree.xmlfile, in place of the SASdata
+        element.  The file is the same as the one written from the complete
+        document.
+
         :param filename: name of the file to write
         :param datainfo: Data1D object
         """
-        # Create XML document
-        doc, _ = self._to_xml_doc(datainfo)
-        # Write the file
-        file_ref = open(filename, 'w')
+        # Create XML document without the data points
+        doc, entry_node = self._to_xml_doc(datainfo, write_points=False)
         if self.encoding is None:
             self.encoding = "UTF-8"
-        doc.write(file_ref, encoding=self.encoding,
-                  pretty_print=True, xml_declaration=True)
+        data_node = entry_node.find("SASdata")
+        placeholder = etree.Comment(DATA_PLACEHOLDER)
+        data_node.addprevious(placeholder)
+        entry_node.remove(data_node)
+        text = etree.tostring(doc, encoding=self.encoding,
+                              pretty_print=True, xml_declaration=True)
+        head, tail = text.split(etree.tostring(placeholder), 1)
+        indent = head[head.rfind("\n") + 1:]
+        # Write the file
+        file_ref = open(filename, 'w')
+        file_ref.write(head)
+        with etree.xmlfile(file_ref, encoding=self.encoding) as xml_file:
+            self._stream_sasdata(datainfo, data_node, xml_file, indent)
+        file_ref.write(tail)
         file_ref.close()
 
-    def _to_xml_doc(self, datainfo):
+    def _stream_sasdata(self, datainfo, node, xml_file, indent):
+        """
+        Write the SASdata element and the data points it is missing as the
+        pretty printed document would
+
+        :param datainfo: The Data1D object the information is coming from
+        :param node: SASdata element written without the data points
+        :param xml_file: etree.xmlfile writer
+        :param indent: indentation of the SASdata element
+        """
+        is_2d = issubclass(datainfo.__class__, Data2D)
+        if not is_2d and len(datainfo.x) == 0 and len(node) == 0:
+            xml_file.write(node)
+            return
+        with xml_file.element(node.tag, node.attrib):
+            if is_2d:
+                self._stream_data_2d(datainfo, xml_file, indent + "  ")
+            else:
+                self._stream_data(datainfo, xml_file, indent + "  ")
+            for child in node:
+                xml_file.write("\n" + indent + "  ")
+                xml_file.write(child)
+            xml_file.write("\n" + indent)
+
+    def _to_xml_doc(self, datainfo, write_points=True):
         """
         Create an XML document to contain the content of a Data1D
 
         :param datainfo: Data1D object
+        :param write_points: if False, the data points are left out
         """
         is_2d = False
         if issubclass(datainfo.__class__, Data2D):
@@ -747,9 +982,9 @@ class Reader(XMLreader):
         self._write_run_names(datainfo, entry_node)
         # Add Data info to SASEntry
         if is_2d:
-            self._write_data_2d(datainfo, entry_node)
+            self._write_data_2d(datainfo, entry_node, write_points)
         else:
-            self._write_data(datainfo, entry_node)
+            self._write_data(datainfo, entry_node, write_points)
         # Transmission Spectrum Info
         # TODO: fix the writer to linearize all data, including T_spectrum
         # self._write_trans_spectrum(datainfo, entry_node)
@@ -842,36 +1077,26 @@ class Reader(XMLreader):
                 runname = {'name': datainfo.run_name[item]}
             self.write_node(entry_node, "Run", item, runname)
 
-    def _write_data(self, datainfo, entry_node):
+    def _write_data(self, datainfo, entry_node, write_points=True):
         """
         Writes 1D I and Q data to the XML file
 
         :param datainfo: The Data1D object the information is coming from
         :param entry_node: lxml node ElementTree object to be appended to
+        :param write_points: if False, leave out the data points
         """
         node = self.create_element("SASdata")
         self.append(node, entry_node)
 
-        for i in range(len(datainfo.x)):
-            point = self.create_element("Idata")
-            node.append(point)
-            self.write_node(point, "Q", datainfo.x[i],
-                            {'unit': datainfo._xaxis + " | " + datainfo._xunit})
-            if len(datainfo.y) >= i:
-                self.write_node(point, "I", datainfo.y[i],
-                                {'unit': datainfo._yaxis + " | " + datainfo._yunit})
-            if datainfo.dy is not None and len(datainfo.dy) > i:
-                self.write_node(point, "Idev", datainfo.dy[i],
-                                {'unit': datainfo._yaxis + " | " + datainfo._yunit})
-            if datainfo.dx is not None and len(datainfo.dx) > i:
-                self.write_node(point, "Qdev", datainfo.dx[i],
-                                {'unit': datainfo._xaxis + " | " + datainfo._xunit})
-            if datainfo.dxw is not None and len(datainfo.dxw) > i:
-                self.write_node(point, "dQw", datainfo.dxw[i],
-                                {'unit': datainfo._xaxis + " | " + datainfo._xunit})
-            if datainfo.dxl is not None and len(datainfo.dxl) > i:
-                self.write_node(point, "dQl", datainfo.dxl[i],
-                                {'unit': datainfo._xaxis + " | " + datainfo._xunit})
+        columns = self._get_columns(datainfo)
+        if write_points:
+            for i in range(len(datainfo.x)):
+                point = self.create_element("Idata")
+                node.append(point)
+                for name, values, attr in columns:
+                    if len(values) > i and values[i] is not None:
+                        child = etree.SubElement(point, name, attr)
+                        child.text = values[i]
         if datainfo.isSesans:
             sesans = self.create_element("Sesans")
             sesans.text = str(datainfo.isSesans)
@@ -881,13 +1106,68 @@ class Reader(XMLreader):
             self.write_node(node, "zacceptance", datainfo.sample.zacceptance[0],
                              {'unit': datainfo.sample.zacceptance[1]})
 
+    def _get_columns(self, datainfo):
+        """
+        Get the text of the 1D data points to write
 
-    def _write_data_2d(self, datainfo, entry_node):
+        :param datainfo: The Data1D object the information is coming from
+        :return: list of the tag name, the text of each point, None where
+            there is no value, and the attributes of each column
+        """
+        x_unit = {'unit': datainfo._xaxis + " | " + datainfo._xunit}
+        y_unit = {'unit': datainfo._yaxis + " | " + datainfo._yunit}
+        columns = []
+        for name, values, attr in [("Q", datainfo.x, x_unit),
+                                   ("I", datainfo.y, y_unit),
+                                   ("Idev", datainfo.dy, y_unit),
+                                   ("Qdev", datainfo.dx, x_unit),
+                                   ("dQw", datainfo.dxw, x_unit),
+                                   ("dQl", datainfo.dxl, x_unit)]:
+            if values is not None:
+                values = format_values(values[:len(datainfo.x)])
+                columns.append((name, values, attr))
+        return columns
+
+    def _stream_data(self, datainfo, xml_file, indent):
+        """
+        Write the 1D data points as the pretty printed document would
+
+        :param datainfo: The Data1D object the information is coming from
+        :param xml_file: etree.xmlfile writer
+        :param indent: indentation of the Idata elements
+        """
+        columns = self._get_columns(datainfo)
+        # The Idata element for each set of present values is reused,
+        # only the text of its children is updated for each point
+        points = {}
+        for i in range(len(datainfo.x)):
+            present = tuple(len(values) > i and values[i] is not None
+                            for _, values, _ in columns)
+            if present not in points:
+                point = self.create_element("Idata")
+                children = []
+                for column, (name, _, attr) in enumerate(columns):
+                    if present[column]:
+                        child = etree.SubElement(point, name, attr)
+                        child.tail = "\n" + indent + "  "
+                        children.append((child, column))
+                if children:
+                    point.text = "\n" + indent + "  "
+                    children[-1][0].tail = "\n" + indent
+                points[present] = (point, children)
+            point, children = points[present]
+            for child, column in children:
+                child.text = columns[column][1][i]
+            xml_file.write("\n" + indent)
+            xml_file.write(point)
+
+    def _write_data_2d(self, datainfo, entry_node, write_points=True):
         """
         Writes 2D data to the XML file
 
         :param datainfo: The Data2D object the information is coming from
         :param entry_node: lxml node ElementTree object to be appended to
+        :param write_points: if False, leave out the data points
         """
         attr = {}
         if datainfo.data.shape:
@@ -896,38 +1176,64 @@ class Reader(XMLreader):
         node = self.create_element("SASdata", attr)
         self.append(node, entry_node)
 
+        if not write_points:
+            return
         point = self.create_element("Idata")
         node.append(point)
-        qx = ','.join([str(datainfo.qx_data[i]) for i in xrange(len(datainfo.qx_data))])
-        qy = ','.join([str(datainfo.qy_data[i]) for i in xrange(len(datainfo.qy_data))])
-        intensity = ','.join([str(datainfo.data[i]) for i in xrange(len(datainfo.data))])
-
-        self.write_node(point, "Qx", qx,
-                        {'unit': datainfo._xunit})
-        self.write_node(point, "Qy", qy,
-                        {'unit': datainfo._yunit})
-        self.write_node(point, "I", intensity,
-                        {'unit': datainfo._zunit})
+        for name, values, attr in self._get_columns_2d(datainfo):
+            self.write_node(point, name, ','.join(values), attr)
+
+    def _get_columns_2d(self, datainfo):
+        """
+        Get the text of the 2D data to write
+
+        :param datainfo: The Data2D object the information is coming from
+        :return: list of the tag name, the text of each value and the
+            attributes of each column
+        """
+        columns = [("Qx", format_values(datainfo.qx_data),
+                    {'unit': datainfo._xunit}),
+                   ("Qy", format_values(datainfo.qy_data),
+                    {'unit': datainfo._yunit}),
+                   ("I", format_values(datainfo.data),
+                    {'unit': datainfo._zunit})]
         if datainfo.err_data is not None:
-            err = ','.join([str(datainfo.err_data[i]) for i in
-                            xrange(len(datainfo.err_data))])
-            self.write_node(point, "Idev", err,
-                            {'unit': datainfo._zunit})
+            columns.append(("Idev", format_values(datainfo.err_data),
+                            {'unit': datainfo._zunit}))
         if datainfo.dqy_data is not None:
-            dqy = ','.join([str(datainfo.dqy_data[i]) for i in
-                            xrange(len(datainfo.dqy_data))])
-            self.write_node(point, "Qydev", dqy,
-                            {'unit': datainfo._yunit})
+            columns.append(("Qydev", format_values(datainfo.dqy_data),
+                            {'unit': datainfo._yunit}))
         if datainfo.dqx_data is not None:
-            dqx = ','.join([str(datainfo.dqx_data[i]) for i in
-                            xrange(len(datainfo.dqx_data))])
-            self.write_node(point, "Qxdev", dqx,
-                            {'unit': datainfo._xunit})
+            columns.append(("Qxdev", format_values(datainfo.dqx_data),
+                            {'unit': datainfo._xunit}))
         if datainfo.mask is not None:
-            mask = ','.join(
-                ["1" if datainfo.mask[i] else "0"
-                 for i in xrange(len(datainfo.mask))])
-            self.write_node(point, "Mask", mask)
+            if isinstance(datainfo.mask, np.ndarray) \
+                    and datainfo.mask.dtype != object:
+                mask = np.where(datainfo.mask, "1", "0")
+            else:
+                mask = ["1" if item else "0" for item in datainfo.mask]
+            columns.append(("Mask", mask, {}))
+        return columns
+
+    def _stream_data_2d(self, datainfo, xml_file, indent):
+        """
+        Write the 2D data as the pretty printed document would
+
+        :param datainfo: The Data2D object the information is coming from
+        :param xml_file: etree.xmlfile writer
+        :param indent: indentation of the Idata element
+        """
+        xml_file.write("\n" + indent)
+        with xml_file.element("Idata"):
+            for name, values, attr in self._get_columns_2d(datainfo):
+                xml_file.write("\n" + indent + "  ")
+                with xml_file.element(name, attr):
+                    for start in range(0, len(values), CHUNK_SIZE):
+                        if start > 0:
+                            xml_file.write(",")
+                        xml_file.write(
+                            ','.join(values[start:start + CHUNK_SIZE]))
+            xml_file.write("\n" + indent)
 
     def _write_trans_spectrum(self, datainfo, entry_node):
         """
@@ -1350,6 +1656,20 @@ def get_content(location, node):
     else:
         return None
 
+def format_values(values):
+    """
+    Get str() of each item of a sequence of values, None for None items
+
+    One dimensional numeric arrays are formatted in bulk.
+
+    :param values: array or list of values
+    """
+    if isinstance(values, np.ndarray) and values.ndim == 1 \
+            and values.dtype.kind in "biuf":
+        return values.astype(str)
+    return [None if value is None else str(value) for value in values]
+
+
 # DO NOT REMOVE Called by outside packages:
 #    sas.sasgui.perspectives.fitting.pagestate
 def write_node(doc, parent, name, value, attr=None):
@@ -7,6 +7,7 @@ import numpy as np
 import re
 import os
 import sys
+from copy import copy, deepcopy
 
 from sas.sascalc.dataloader.data_info import plottable_1D, plottable_2D,\
     Data1D, Data2D, DataInfo, Process, Aperture, Collimation, \
@@ -53,6 +54,17 @@ class Reader(FileReader):
     ext = ['.h5', '.H5']
     # Flag to bypass extension check
     allow_all = True
+    # Frames to read from stacked SASdata, None for all frames
+    frames = None
+    # Only output the frames of stacked SASdata
+    stacked_only = False
+    # HDF5 paths of the stacked I and Idev of the current SASdata
+    current_stack = None
+    # HDF5 paths of the stacked I and Idev, keyed on the id of the frames
+    # read from them
+    frame_stacks = None
+    # List of the outputs read from stacked SASdata, with their HDF5 paths
+    output_stacks = None
 
     def get_file_contents(self):
         """
@@ -98,6 +110,92 @@ class Reader(FileReader):
                             self.output = []
                             raise FileContentsException("Fewer than 5 data points found.")
 
+    def iter_frames(self, filename, frames=None):
+        """
+        Iterate over the frames of the stacked SASdata of an NXcanSAS file,
+        as written by NXcanSASWriter.write_frames.
+
+        The metadata and Q axes are read once, with the first frame of each
+        stacked SASdata, into a template data set. The file is kept open
+        and each frame is then a shallow copy of its template, sharing the
+        Q axes, with only I and Idev read by slicing the chunked datasets,
+        so a long series of frames never has to fit in memory.
+
+        :param filename: A path for an HDF5 formatted NXcanSAS file
+        :param frames: The frame numbers to read, all frames if None
+        :return: generator of Data1D/2D objects, one per frame and SASdata
+        """
+        raw_data = h5py.File(filename, 'r')
+        try:
+            self.reset_class_variables()
+            self.raw_data = raw_data
+            self.frames = [0]
+            self.stacked_only = True
+            self.read_children(self.raw_data, [])
+            self.add_data_set()
+            self.sort_two_d_data()
+            templates = self.output_stacks
+            if frames is None:
+                frames = range(self._count_frames(raw_data))
+            for frame in frames:
+                for template, (i_path, idev_path) in templates:
+                    intensity = raw_data[i_path]
+                    if not 0 <= frame < intensity.shape[0]:
+                        continue
+                    errors = None
+                    if idev_path is not None:
+                        errors = raw_data[idev_path][frame].flatten()
+                    data = copy(template)
+                    if isinstance(data, Data2D):
+                        data.data = intensity[frame].flatten() \
+                            .astype(np.float64)
+                        if errors is not None:
+                            data.err_data = errors.astype(np.float64)
+                    else:
+                        data.y = intensity[frame].flatten()
+                        if errors is not None:
+                            data.dy = errors
+                        self.output = [data]
+                        self.sort_one_d_data()
+                    yield data
+        finally:
+            self.frames = None
+            self.stacked_only = False
+            raw_data.close()
+
+    def _count_frames(self, raw_data):
+        """
+        Find the largest number of frames of the stacked SASdata of a file
+
+        :param raw_data: h5py File object
+        :return: number of frames, 0 if no SASdata is stacked
+        """
+        counts = [0]
+
+        def _visit(name, value):
+            if isinstance(value, h5py.Group) and self._is_stacked(value):
+                counts.append(value[u'I'].shape[0])
+        raw_data.visititems(_visit)
+        return max(counts)
+
+    @staticmethod
+    def _is_stacked(group):
+        """
+        Check whether the I of a SASdata group has one more dimension than its
+        Q axes, the first dimension being the frame number
+
+        :param group: h5py Group object
+        """
+        intensity = group.get(u'I')
+        if not isinstance(intensity, h5py.Dataset):
+            return False
+        q_axis = group.get(u'Qx')
+        if q_axis is None:
+            q_axis = group.get(u'Q')
+        if not isinstance(q_axis, h5py.Dataset):
+            return False
+        return intensity.ndim == q_axis.ndim + 1
+
     def reset_class_variables(self):
         """
         Create the reader object and define initial states for class variables
@@ -107,6 +205,9 @@ class Reader(FileReader):
         self.data1d = []
         self.data2d = []
         self.raw_data = None
+        self.current_stack = None
+        self.frame_stacks = {}
+        self.output_stacks = []
         self.errors = set()
         self.logging = []
         self.output = []
@@ -153,9 +254,21 @@ class Reader(FileReader):
                 parent_list.remove(key)
 
             elif isinstance(value, h5py.Dataset):
+                unit = self._get_unit(value)
+                # Stacked frames are read one at a time in add_intermediate
+                if (self.current_stack is not None
+                        and key in [u'I', u'Idev']
+                        and self.parent_class == u'SASdata'):
+                    self.current_stack[key] = value.name
+                    if key == u'I':
+                        if isinstance(self.current_dataset, plottable_2D):
+                            self.current_dataset.zaxis("Intensity", unit)
+                        else:
+                            self.current_dataset.yaxis("Intensity", unit)
+                    continue
+
                 # If this is a dataset, store the data appropriately
                 data_set = data[key][:]
-                unit = self._get_unit(value)
 
                 # I and Q Data
                 if key == u'I':
@@ -429,10 +542,60 @@ class Reader(FileReader):
             self.collimation.aperture.append(self.aperture)
             self.aperture = Aperture()
         elif self.parent_class == u'SASdata':
-            if isinstance(self.current_dataset, plottable_2D):
-                self.data2d.append(self.current_dataset)
-            elif isinstance(self.current_dataset, plottable_1D):
-                self.data1d.append(self.current_dataset)
+            if self.current_stack is not None:
+                datasets = self._read_frames()
+            elif self.stacked_only:
+                datasets = []
+            else:
+                datasets = [self.current_dataset]
+            for dataset in datasets:
+                if isinstance(dataset, plottable_2D):
+                    self.data2d.append(dataset)
+                elif isinstance(dataset, plottable_1D):
+                    self.data1d.append(dataset)
+
+    def _read_frames(self):
+        """
+        Read the selected frames of the stacked I and Idev of the current
+        SASdata, slicing the datasets so that only those frames are read
+
+        :return: list of plottable_1D/2D objects, one per frame
+        """
+        if u'I' not in self.current_stack:
+            return []
+        intensity = self.raw_data[self.current_stack[u'I']]
+        errors = None
+        if u'Idev' in self.current_stack:
+            errors = self.raw_data[self.current_stack[u'Idev']]
+        n_frames = intensity.shape[0]
+        frames = range(n_frames) if self.frames is None else self.frames
+        datasets = []
+        for frame in frames:
+            if not 0 <= frame < n_frames:
+                continue
+            dataset = deepcopy(self.current_dataset)
+            if isinstance(dataset, plottable_2D):
+                dataset.data = intensity[frame]
+                if errors is not None:
+                    dataset.err_data = errors[frame].flatten()
+            else:
+                dataset.y = intensity[frame].flatten()
+                if errors is not None:
+                    dataset.dy = errors[frame].flatten()
+            datasets.append(dataset)
+            self.frame_stacks[id(dataset)] = (self.current_stack[u'I'],
+                                              self.current_stack.get(u'Idev'))
+        return datasets
+
+    def send_to_output(self):
+        """
+        Combine the current data set with the data info and append it to the
+        output, remembering where its frame was read from if it is stacked
+        """
+        FileReader.send_to_output(self)
+        stack = self.frame_stacks.get(id(self.current_dataset))
+        if stack is not None:
+            self.output_stacks.append((self.output[-1], stack))
 
     def final_data_cleanup(self):
         """
@@ -525,6 +688,10 @@ class Reader(FileReader):
             x = np.array(0)
             y = np.array(0)
             self.current_dataset = plottable_1D(x, y)
+        group = self.raw_data
+        for parent in parent_list:
+            group = group.get(parent)
+        self.current_stack = {} if self._is_stacked(group) else None
         self.current_datainfo.filename = self.raw_data.filename
 
     def _find_intermediate(self, parent_list, basename=""):
@@ -0,0 +1,107 @@
+"""
+Memory mapped access to the frames of the raw float32 binary files used by
+the OTOKO and BSL formats.  Frames are only read from disk when they are
+used, so that a long time-resolved data set can be converted one frame at a
+time instead of being loaded in full.
+"""
+import os
+import sys
+import numpy as np
+
+# Size in bytes of a value in OTOKO and BSL binary files
+FLOAT_SIZE = 4
+
+
+def frame_dtype(swap_bytes):
+    """
+    Explicit endianness dtype of the floats of a binary file.
+
+    :param swap_bytes: True if the bytes of each float are stored in the
+        reverse order of this machine
+    :return: big or little endian float32 dtype
+    """
+    native = '<f4' if sys.byteorder == 'little' else '>f4'
+    dtype = np.dtype(native)
+    if swap_bytes:
+        dtype = dtype.newbyteorder()
+    return dtype
+
+
+def memmap_frames(path, n_frames, frame_shape, swap_bytes, offset=0):
+    """
+    Memory map the frames stored in a binary file.
+
+    :param path: path of the binary file
+    :param n_frames: number of frames in the file
+    :param frame_shape: shape of a frame, e.g. (n_channels,) or
+        (n_rasters, n_pixels)
+    :param swap_bytes: True if the bytes of each float are reversed
+    :param offset: number of frames to skip at the start of the file
+    :return: read only array of shape (n_frames,) + frame_shape
+    :raises IOError: if the file is too small for the frames
+    """
+    frame_shape = tuple(frame_shape)
+    shape = (n_frames,) + frame_shape
+    frame_size = FLOAT_SIZE * int(np.prod(frame_shape))
+    needed = frame_size * (offset + n_frames)
+    available = os.path.getsize(path)
+    if available < needed:
+        msg = "{} has {} bytes, expected at least {}."
+        raise IOError(msg.format(path, available, needed))
+    dtype = frame_dtype(swap_bytes)
+    if n_frames == 0 or frame_size == 0:
+        # mmap cannot map an empty region
+        return np.zeros(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=shape,
+                     offset=frame_size * offset)
+
+
+class FrameStack(object):
+    """
+    Read only sequence of the frames of one or more memory mapped files.
+
+    Indexing the stack with a frame number returns a view of that frame,
+    which is only read from disk when its values are used.  np.asarray
+    reads the whole stack into a single native endian array.
+    """
+    def __init__(self, blocks):
+        """
+        :param blocks: list of arrays of shape (n_frames,) + frame_shape,
+            with the same frame_shape, as returned by memmap_frames
+        """
+        self.blocks = list(blocks)
+        # Index of the first frame of each block
+        self._starts = np.cumsum([0] + [len(block) for block in self.blocks])
+
+    @property
+    def frame_shape(self):
+        """ Shape of a single frame """
+        return self.blocks[0].shape[1:] if self.blocks else ()
+
+    @property
+    def shape(self):
+        """ Shape of the stack, with the frames along the first axis """
+        return (int(self._starts[-1]),) + tuple(self.frame_shape)
+
+    def __len__(self):
+        return int(self._starts[-1])
+
+    def __getitem__(self, index):
+        n_frames = len(self)
+        if index < 0:
+            index += n_frames
+        if not 0 <= index < n_frames:
+            raise IndexError("Frame {} out of range".format(index))
+        block = np.searchsorted(self._starts, index, side='right') - 1
+        return self.blocks[block][index - self._starts[block]]
+
+    def __iter__(self):
+        for block in self.blocks:
+            for frame in block:
+                yield frame
+
+    def __array__(self, dtype=None):
+        if not self.blocks:
+            return np.zeros(self.shape, dtype=dtype or np.float32)
+        data = np.concatenate([np.asarray(block) for block in self.blocks])
+        return data.astype(dtype or data.dtype.newbyteorder('='))
@@ -1,5 +1,6 @@
 from sas.sascalc.file_converter.core.bsl_loader import CLoader
 from sas.sascalc.dataloader.data_info import Data2D
+from sas.sascalc.file_converter.binary_frames import memmap_frames
 from copy import deepcopy
 import os
 import numpy as np
@@ -80,25 +81,51 @@ class BSLLoader(CLoader):
             data_info['pixels'], data_info['rasters'], data_info['swap_bytes'])
 
     def load_frames(self, frames):
-        frame_data = []
+        """
+        Load the given frames of the data file
+
+        :param frames: list of frame numbers
+        :return: list of Data2D objects, one per frame
+        """
+        return list(self.iter_frames(frames))
+
+    def iter_frames(self, frames):
+        """
+        Iterate over the given frames of the data file.
+
+        The data file is memory mapped, and the data of each Data2D is a view
+        of its frame, so frames are only read from disk when they are used.
+        All the Data2D objects share the same qx and qy arrays.
+
+        :param frames: list of frame numbers
+        :return: generator of Data2D objects, one per frame
+        """
         # Prepare axis values (arbitrary scale)
-        x = self.n_rasters * range(1, self.n_pixels+1)
-        y = [self.n_pixels * [i] for i in range(1, self.n_rasters+1)]
-        y = np.reshape(y, (1, self.n_pixels*self.n_rasters))[0]
+        x = np.tile(np.arange(1, self.n_pixels+1), self.n_rasters)
+        y = np.repeat(np.arange(1, self.n_rasters+1), self.n_pixels)
         x_bins = x[:self.n_pixels]
         y_bins = y[0::self.n_pixels]
 
+        frame_stack = self.map_frames()
         for frame in frames:
-            self.frame = frame
-            raw_frame_data = self.load_data()
-            data2d = Data2D(data=raw_frame_data, qx_data=x, qy_data=y)
+            data2d = Data2D(data=frame_stack[frame], qx_data=x, qy_data=y)
             data2d.x_bins = x_bins
             data2d.y_bins = y_bins
             data2d.Q_unit = '' # Using arbitrary units
-            frame_data.append(data2d)
+            yield data2d
 
-        return frame_data
+    def map_frames(self):
+        """
+        Memory map all the frames of the data file
 
+        :return: read only array of shape (n_frames, n_rasters, n_pixels)
+        """
+        # The bytes are swapped when the header indicator is zero
+        try:
+            return memmap_frames(self.filename, self.n_frames,
+                (self.n_rasters, self.n_pixels), self.swap_bytes == 0)
+        except (IOError, OSError) as e:
+            raise BSLParsingError(str(e))
 
     def __setattr__(self, name, value):
         if name == 'filename':
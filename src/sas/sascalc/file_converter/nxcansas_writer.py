@@ -3,6 +3,7 @@
 """
 
 import h5py
+import itertools
 import numpy as np
 import re
 import os
@@ -10,6 +11,9 @@ import os
 from sas.sascalc.dataloader.readers.cansas_reader_HDF5 import Reader as Cansas2Reader
 from sas.sascalc.dataloader.data_info import Data1D, Data2D
 
+# Target size in bytes of the chunks of the stacked frame datasets
+CHUNK_BYTES = 256 * 1024
+
 class NXcanSASWriter(Cansas2Reader):
     """
     A class for writing in NXcanSAS data files. Any number of data sets may be
@@ -31,6 +35,68 @@ class NXcanSASWriter(Cansas2Reader):
         :param dataset: A list of Data1D or Data2D objects to write
         :param filename: Where to write the NXcanSAS file
         """
+        valid_data = all([issubclass(d.__class__, (Data1D, Data2D)) for d in dataset])
+        if not valid_data:
+            raise ValueError("All entries of dataset must be Data1D or Data2D objects")
+
+        def _write_data(sasentry):
+            i = 1
+            for data_obj in dataset:
+                data_entry = sasentry.create_group("sasdata{0:0=2d}".format(i))
+                data_entry.attrs['canSAS_class'] = 'SASdata'
+                if isinstance(data_obj, Data1D):
+                    self._write_1d_data(data_obj, data_entry)
+                elif isinstance(data_obj, Data2D):
+                    self._write_2d_data(data_obj, data_entry)
+                i += 1
+
+        self._write_sasentry(dataset[0], filename, _write_data)
+
+    def write_frames(self, frames, filename, compression='gzip',
+                     compression_opts=None):
+        """
+        Write a series of Data1D or Data2D frames sharing the same Q axis to
+        an NXcanSAS file, as one SASentry with a single SASdata element. The
+        I and Idev of the frames are stacked along a first, frame, axis of
+        chunked and compressed datasets, and the frames are appended as they
+        are taken from the iterable. The Q axis and the SASentry metadata are
+        those of the first frame.
+
+        :param frames: An iterable of Data1D or Data2D objects
+        :param filename: Where to write the NXcanSAS file
+        :param compression: 'gzip', 'lzf' or None for no compression
+        :param compression_opts: The gzip compression level (0-9)
+        :return: The number of frames written
+        """
+        frames = iter(frames)
+        try:
+            first = next(frames)
+        except StopIteration:
+            raise ValueError("No frames to write")
+        if not isinstance(first, (Data1D, Data2D)):
+            raise ValueError("All frames must be Data1D or Data2D objects")
+
+        n_frames = []
+
+        def _write_data(sasentry):
+            data_entry = sasentry.create_group('sasdata01')
+            data_entry.attrs['canSAS_class'] = 'SASdata'
+            n_frames.append(self._write_frame_stack(first, frames, data_entry,
+                compression, compression_opts))
+
+        self._write_sasentry(first, filename, _write_data)
+        return n_frames[0]
+
+    def _write_sasentry(self, data_info, filename, write_data):
+        """
+        Write an NXcanSAS file with one SASentry
+
+        :param data_info: The Data1D or Data2D object to take the SASentry
+            metadata from
+        :param filename: Where to write the NXcanSAS file
+        :param write_data: A function of the form f(sasentry) that writes the
+            SASdata elements to the h5py Group of the SASentry
+        """
 
         def _h5_string(string):
             """
@@ -86,12 +152,7 @@ class NXcanSASWriter(Cansas2Reader):
                 if units is not None:
                     entry[names[2]].attrs['units'] = units
 
-        valid_data = all([issubclass(d.__class__, (Data1D, Data2D)) for d in dataset])
-        if not valid_data:
-            raise ValueError("All entries of dataset must be Data1D or Data2D objects")
-
         # Get run name and number from first Data object
-        data_info = dataset[0]
         run_number = ''
         run_name = ''
         if len(data_info.run) > 0:
@@ -108,18 +169,12 @@ class NXcanSASWriter(Cansas2Reader):
         sasentry.attrs['canSAS_class'] = 'SASentry'
         sasentry.attrs['version'] = '1.0'
 
-        i = 1
+        try:
+            write_data(sasentry)
+        except Exception:
+            f.close()
+            raise
 
-        for data_obj in dataset:
-            data_entry = sasentry.create_group("sasdata{0:0=2d}".format(i))
-            data_entry.attrs['canSAS_class'] = 'SASdata'
-            if isinstance(data_obj, Data1D):
-                self._write_1d_data(data_obj, data_entry)
-            elif isinstance(data_obj, Data2D):
-                self._write_2d_data(data_obj, data_entry)
-            i += 1
-
-        data_info = dataset[0]
         # Sample metadata
         sample_entry = sasentry.create_group('sassample')
         sample_entry.attrs['canSAS_class'] = 'SASsample'
@@ -231,7 +286,7 @@ class NXcanSASWriter(Cansas2Reader):
             detector_entry.attrs['canSAS_class'] = 'SASdetector'
             detector_entry.attrs['name'] = ''
 
-        note_entry = sasentry.create_group('sasnote'.format(i))
+        note_entry = sasentry.create_group('sasnote')
         note_entry.attrs['canSAS_class'] = 'SASnote'
         notes = None
         if len(data_info.notes) > 1:
@@ -276,6 +331,102 @@ class NXcanSASWriter(Cansas2Reader):
         data_entry.attrs['I_uncertainties'] = 'Idev'
         data_entry.attrs['Q_indicies'] = [0,1]
 
+        (n_rows, n_cols) = self._get_2d_shape(data)
+        I, dI = self._get_intensity(data, (n_rows, n_cols))
+        qx =  np.reshape(data.qx_data, (n_rows, n_cols))
+        qy = np.reshape(data.qy_data, (n_rows, n_cols))
+
+        I_entry = data_entry.create_dataset('I', data=I)
+        I_entry.attrs['units'] = data.I_unit
+        Qx_entry = data_entry.create_dataset('Qx', data=qx)
+        Qx_entry.attrs['units'] = data.Q_unit
+        Qy_entry = data_entry.create_dataset('Qy', data=qy)
+        Qy_entry.attrs['units'] = data.Q_unit
+        Idev_entry = data_entry.create_dataset('Idev', data=dI)
+        Idev_entry.attrs['units'] = data.I_unit
+
+    def _write_frame_stack(self, first, frames, data_entry, compression,
+                           compression_opts):
+        """
+        Writes a series of frames to a SASdata h5py Group, with the I and Idev
+        of each frame appended to stacked datasets and the Q axis of the first
+        frame shared by all frames
+
+        :param first: The first Data1D or Data2D frame
+        :param frames: An iterator over the other frames
+        :param data_entry: A h5py Group object representing the SASdata
+        :param compression: The h5py compression filter
+        :param compression_opts: The h5py compression options
+        :return: The number of frames written
+        """
+        data_entry.attrs['signal'] = 'I'
+        data_entry.attrs['I_uncertainties'] = 'Idev'
+        if isinstance(first, Data2D):
+            shape = self._get_2d_shape(first)
+            data_entry.attrs['I_axes'] = '.,Q,Q'
+            data_entry.attrs['Q_indicies'] = [1,2]
+            Qx_entry = data_entry.create_dataset('Qx',
+                data=np.reshape(first.qx_data, shape))
+            Qx_entry.attrs['units'] = first.Q_unit
+            Qy_entry = data_entry.create_dataset('Qy',
+                data=np.reshape(first.qy_data, shape))
+            Qy_entry.attrs['units'] = first.Q_unit
+            I_unit = first.I_unit
+        else:
+            shape = (len(first.x),)
+            data_entry.attrs['I_axes'] = '.,Q'
+            data_entry.attrs['Q_indicies'] = 1
+            data_entry.create_dataset('Q', data=first.x)
+            I_unit = None
+
+        # Keep the precision of the frames, e.g. float32 for BSL and OTOKO
+        first_I, first_dI = self._get_intensity(first, shape)
+        dtype = np.result_type(first_I, first_dI, np.float32)
+        dtype = dtype.newbyteorder('=')
+        # Chunks hold whole frames, so that reading a frame back only
+        # decompresses the chunk it is in
+        frame_bytes = dtype.itemsize * int(np.prod(shape))
+        chunk_frames = max(1, CHUNK_BYTES // frame_bytes)
+        entries = []
+        for key in ['I', 'Idev']:
+            entry = data_entry.create_dataset(key, shape=(0,) + shape,
+                maxshape=(None,) + shape, chunks=(chunk_frames,) + shape,
+                dtype=dtype, compression=compression,
+                compression_opts=compression_opts)
+            if I_unit is not None:
+                entry.attrs['units'] = I_unit
+            entries.append(entry)
+
+        def _append(buffers, n_frames):
+            n_new = len(buffers[0])
+            for entry, buff in zip(entries, buffers):
+                entry.resize(n_frames + n_new, axis=0)
+                entry[n_frames:] = np.array(buff, dtype=dtype)
+                del buff[:]
+            return n_frames + n_new
+
+        # Buffer the frames so that each chunk is only compressed once
+        n_frames = 0
+        buffers = ([], [])
+        for frame in itertools.chain([first], frames):
+            if isinstance(frame, Data2D) != isinstance(first, Data2D):
+                raise ValueError("All frames must be either 1D or 2D")
+            I, dI = self._get_intensity(frame, shape)
+            buffers[0].append(I)
+            buffers[1].append(dI)
+            if len(buffers[0]) == chunk_frames:
+                n_frames = _append(buffers, n_frames)
+        if len(buffers[0]) > 0:
+            n_frames = _append(buffers, n_frames)
+        return n_frames
+
+    def _get_2d_shape(self, data):
+        """
+        Find the number of rows and columns of the detector of a Data2D object
+
+        :param data: A Data2D object
+        :return: The (n_rows, n_cols) of the data
+        """
         (n_rows, n_cols) = (len(data.y_bins), len(data.x_bins))
 
         if n_rows == 0 and n_cols == 0:
@@ -287,18 +438,24 @@ class NXcanSASWriter(Cansas2Reader):
             if n_rows * n_cols != len(data.qy_data):
                 raise ValueError("Unable to calculate dimensions of 2D data")
 
-        I = np.reshape(data.data, (n_rows, n_cols))
-        dI = np.zeros((n_rows, n_cols))
-        if not all(data.err_data == [None]):
-            dI = np.reshape(data.err_data, (n_rows, n_cols))
-        qx =  np.reshape(data.qx_data, (n_rows, n_cols))
-        qy = np.reshape(data.qy_data, (n_rows, n_cols))
+        return (n_rows, n_cols)
 
-        I_entry = data_entry.create_dataset('I', data=I)
-        I_entry.attrs['units'] = data.I_unit
-        Qx_entry = data_entry.create_dataset('Qx', data=qx)
-        Qx_entry.attrs['units'] = data.Q_unit
-        Qy_entry = data_entry.create_dataset('Qy', data=qy)
-        Qy_entry.attrs['units'] = data.Q_unit
-        Idev_entry = data_entry.create_dataset('Idev', data=dI)
-        Idev_entry.attrs['units'] = data.I_unit
+    def _get_intensity(self, data, shape):
+        """
+        Get the intensity and its uncertainty of a Data1D or Data2D object
+
+        :param data: A Data1D or Data2D object
+        :param shape: The shape to give the arrays
+        :return: The I and Idev arrays, Idev is zero if data has no errors
+        """
+        if isinstance(data, Data2D):
+            I = np.reshape(data.data, shape)
+            dI = np.zeros(shape, dtype=I.dtype)
+            if not all(data.err_data == [None]):
+                dI = np.reshape(data.err_data, shape)
+        else:
+            I = np.reshape(data.y, shape)
+            dI = np.zeros(shape, dtype=I.dtype)
+            if data.dy is not None:
+                dI = np.reshape(data.dy, shape)
+        return I, dI
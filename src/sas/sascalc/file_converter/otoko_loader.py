@@ -6,8 +6,7 @@ aim to load the data into numpy arrays for use later.
 
 import itertools
 import os
-import struct
-import numpy as np
+from sas.sascalc.file_converter.binary_frames import FrameStack, memmap_frames
 
 class CStyleStruct:
     """A nice and easy way to get "C-style struct" functionality."""
@@ -58,7 +57,6 @@ class OTOKOLoader(object):
             raise OTOKOParsingError("The header file %s does not exist." % header_path)
 
         binary_file_info_list = []
-        total_frames = 0
         header_dir = os.path.dirname(os.path.abspath(header_path))
 
         with open(header_path, "r") as header_file:
@@ -109,8 +107,6 @@ class OTOKOLoader(object):
 
                 binary_file_info_list.append(binary_file_info)
 
-                total_frames += binary_file_info.n_frames
-
         # Check that all binary files are listed in the header as having the same
         # number of channels, since I don't think CorFunc can handle ragged data.
         all_n_channels = [info.n_channels for info in binary_file_info_list]
@@ -118,29 +114,23 @@ class OTOKOLoader(object):
             raise OTOKOParsingError(
                 "Expected all binary files listed in %s to have the same number of channels." % header_path)
 
-        data = np.zeros(shape=(total_frames, all_n_channels[0]))
-        frames_so_far = 0
-
+        blocks = []
         for info in binary_file_info_list:
             if not os.path.exists(info.file_path):
                 raise OTOKOParsingError(
                     "The data file %s does not exist." % info.file_path)
 
-            with open(info.file_path, "rb") as binary_file:
-                # Ideally we'd like to use numpy's fromfile() to read in binary
-                # data, but we are forced to roll our own float-by-float file
-                # reader because of the rules imposed on us by the file format;
-                # namely, if the swap indicator flag has been raised then the bytes
-                # of each float occur in reverse order.
-                for frame in range(info.n_frames):
-                    for channel in range(info.n_channels):
-                        b = bytes(binary_file.read(4))
-                        if info.swap_bytes:
-                            b = b[::-1] # "Extended slice" syntax, used to reverse.
-                        value = struct.unpack('f', b)[0]
-                        data[frames_so_far + frame][channel] = value
-
-                frames_so_far += info.n_frames
+            # If the swap indicator flag has been raised then the bytes of
+            # each float occur in reverse order, which the explicit byte
+            # order of the memory mapped dtype takes care of.
+            try:
+                blocks.append(memmap_frames(info.file_path, info.n_frames,
+                    (info.n_channels,), info.swap_bytes))
+            except IOError as e:
+                raise OTOKOParsingError(str(e))
+
+        # Frames are read from the binary files when they are used
+        data = FrameStack(blocks)
 
         return CStyleStruct(
             header_path = header_path,
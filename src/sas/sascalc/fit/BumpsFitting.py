@@ -251,7 +251,7 @@ class BumpsFit(FitEngine):
 
     def fit(self, msg_q=None,
             q=None, handler=None, curr_thread=None,
-            ftol=1.49012e-8, reset_flag=False):
+            ftol=1.49012e-8, reset_flag=False, serial=False):
         # Build collection of bumps fitness calculators
         models = [SasFitness(model=M.get_model(),
                              data=M.get_data(),
@@ -272,7 +272,7 @@ class BumpsFit(FitEngine):
         problem.setp_hook = ParameterExpressions(models)
 
         # Run the fit
-        result = run_bumps(problem, handler, curr_thread)
+        result = run_bumps(problem, handler, curr_thread, serial=serial)
         if handler is not None:
             handler.update_fit(last=True)
 
@@ -317,7 +317,15 @@ class BumpsFit(FitEngine):
         else:
             return all_results
 
-def run_bumps(problem, handler, curr_thread):
+def run_bumps(problem, handler, curr_thread, serial=False):
+    """
+    Run the bumps fit of *problem*.
+
+    The function evaluations are spread over processes with the bumps
+    MPMapper when OMP_NUM_THREADS is 1, unless *serial* is True.  Fits run
+    in a daemonic worker process must be serial since such a process
+    cannot start children.
+    """
     def abort_test():
         if curr_thread is None: return False
         try: curr_thread.isquit()
@@ -343,7 +351,7 @@ def run_bumps(problem, handler, curr_thread):
     fitdriver = fitters.FitDriver(fitclass, problem=problem,
                                   abort_test=abort_test, **options)
     omp_threads = int(os.environ.get('OMP_NUM_THREADS','0'))
-    mapper = MPMapper if omp_threads == 1 else SerialMapper
+    mapper = MPMapper if omp_threads == 1 and not serial else SerialMapper
     fitdriver.mapper = mapper.start_mapper(problem, None)
     #import time; T0 = time.time()
     try:
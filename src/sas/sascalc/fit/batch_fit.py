@@ -0,0 +1,419 @@
+"""
+Headless batch fitting.
+
+Fits one model to every data file matching a set of glob patterns, without
+the fitting perspective or the batch grid.  The fits are independent so they
+are sent to a pool of worker processes, and one result row per data set is
+written to CSV or JSON Lines as soon as its fit finishes.
+
+Example::
+
+    python -m sas.sascalc.fit.batch_fit sphere "run_*.xml" \\
+        --fit radius=60:10:200 --fit scale --set background=0.001 \\
+        --workers 8 --output results.csv
+
+Parameter specifications are ``name``, ``name=value`` or
+``name=value:min:max``.  Constraints are ``name=expression`` where the
+expression is a python expression of the other parameters of the model,
+referred to by their bare names, e.g. ``--constraint radius_pd=0.1*radius``.
+The names are qualified with the model name before the expression is given
+to bumps.
+"""
+from __future__ import print_function
+
+import os
+import re
+import sys
+import csv
+import glob
+import json
+import time
+import logging
+import argparse
+import traceback
+import multiprocessing
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Columns written before the fitted parameters
+RESULT_COLUMNS = ["file", "name", "success", "Chi2", "npts", "elapsed", "error"]
+
+
+def parse_parameter(spec):
+    """
+    Split a parameter specification into (name, value, bounds).
+
+    :param spec: ``name``, ``name=value`` or ``name=value:min:max``
+    :return: name, value or None, (min, max) or None
+    """
+    name, _, value = spec.partition("=")
+    name = name.strip()
+    if not name:
+        raise ValueError("missing parameter name in %r" % spec)
+    if not value:
+        return name, None, None
+    fields = value.split(":")
+    if len(fields) == 1:
+        return name, float(fields[0]), None
+    if len(fields) == 3:
+        low = float(fields[1]) if fields[1] else -np.inf
+        high = float(fields[2]) if fields[2] else np.inf
+        return name, float(fields[0]), (low, high)
+    raise ValueError("parameter %r should be name=value:min:max" % spec)
+
+
+def parse_constraint(spec):
+    """
+    Split a constraint specification ``name=expression`` into a tuple
+    """
+    name, _, expression = spec.partition("=")
+    if not name.strip() or not expression.strip():
+        raise ValueError("constraint %r should be name=expression" % spec)
+    return name.strip(), expression.strip()
+
+
+def find_files(patterns):
+    """
+    Expand the glob patterns into a sorted list of unique files
+    """
+    files = set()
+    for pattern in patterns:
+        files.update(path for path in glob.glob(pattern)
+                     if os.path.isfile(path))
+    return sorted(files)
+
+
+# sasmodels model classes by name, loaded once per process
+_MODEL_CLASSES = {}
+
+
+def make_model(model_name):
+    """
+    Create an instance of the sasmodels model named *model_name*
+    """
+    if not _MODEL_CLASSES:
+        from sasmodels.sasview_model import load_standard_models
+        for model in load_standard_models():
+            _MODEL_CLASSES[model.name] = model
+    if model_name not in _MODEL_CLASSES:
+        raise ValueError("unknown model %r" % model_name)
+    return _MODEL_CLASSES[model_name]()
+
+
+# Names in a constraint expression, possibly dotted as in radius.width
+_SYMBOL = re.compile(r"(?<![\w.])([a-zA-Z_][a-zA-Z_0-9.]*)")
+
+
+def qualify_constraint(expression, model_name, param_names):
+    """
+    Prefix the parameter names of a constraint expression with the model
+    name, as bumps expects, e.g. ``0.1*radius`` -> ``0.1*sphere.radius``
+
+    :param expression: constraint expression using bare parameter names
+    :param model_name: name of the model the parameters belong to
+    :param param_names: names of the parameters of the model
+    :return: the expression with qualified parameter names
+    """
+    def _qualify(match):
+        name = match.group(1)
+        if name in param_names:
+            return "%s.%s" % (model_name, name)
+        return name
+    return _SYMBOL.sub(_qualify, expression)
+
+
+class BatchFitJob(object):
+    """
+    Description of a fit to apply to each data set of a batch.
+
+    The job only stores names and numbers so that it can be sent to the
+    worker processes; the model and the data are created in the worker.
+    """
+    def __init__(self, model_name, fitted, fixed=None, constraints=None,
+                 qmin=None, qmax=None, smearing=True):
+        """
+        :param model_name: name of the sasmodels model
+        :param fitted: list of (name, value, bounds) of the fitted parameters
+        :param fixed: list of (name, value) of the parameters to set
+        :param constraints: list of (name, expression)
+        :param qmin: lower limit of the fit range
+        :param qmax: upper limit of the fit range
+        :param smearing: if True, use the resolution stored with the data
+        """
+        if not fitted:
+            raise ValueError("no fitting parameters")
+        self.model_name = model_name
+        self.fitted = list(fitted)
+        self.fixed = list(fixed or [])
+        self.constraints = list(constraints or [])
+        self.qmin = qmin
+        self.qmax = qmax
+        self.smearing = smearing
+
+    @property
+    def param_names(self):
+        """
+        Names of the fitted and constrained parameters, in output order
+        """
+        names = [name for name, _, _ in self.fitted]
+        names += [name for name, _ in self.constraints if name not in names]
+        return names
+
+    def columns(self):
+        """
+        Column names of the result rows
+        """
+        columns = list(RESULT_COLUMNS)
+        for name in self.param_names:
+            columns += [name, "error on %s" % name]
+        return columns
+
+    def make_model(self):
+        """
+        Create the model with the initial values and bounds of the job
+        """
+        model = make_model(self.model_name)
+        for name, value in self.fixed:
+            model.setParam(name, value)
+        for name, value, bounds in self.fitted:
+            if value is not None:
+                model.setParam(name, value)
+            if bounds is not None:
+                units = model.details.get(name, [""])[0]
+                model.details[name] = [units, bounds[0], bounds[1]]
+        return model
+
+    def fit_data(self, data):
+        """
+        Fit a single data set and return the FResult
+        """
+        from sas.sascalc.fit.BumpsFitting import BumpsFit
+        from sas.sascalc.data_util.qsmearing import smear_selection
+
+        model = self.make_model()
+        smearer = smear_selection(data, model) if self.smearing else None
+        pars = [name for name, _, _ in self.fitted]
+        pars += [name for name, _ in self.constraints if name not in pars]
+        param_names = model.getParamList()
+        constraints = [(name, qualify_constraint(expression, model.name,
+                                                 param_names))
+                       for name, expression in self.constraints]
+        fitter = BumpsFit()
+        fitter.set_model(model, 0, pars, data=data, constraints=constraints)
+        fitter.set_data(data=data, id=0, smearer=smearer,
+                        qmin=self.qmin, qmax=self.qmax)
+        fitter.select_problem_for_fit(id=0, value=1)
+        # The fits of a batch may run in daemonic pool workers
+        return fitter.fit(serial=True)[0]
+
+    def result_row(self, path, data, result, elapsed):
+        """
+        Convert a fit result into a result row
+        """
+        row = dict.fromkeys(self.columns())
+        row["file"] = path
+        row["name"] = getattr(data, "title", "") or getattr(data, "filename", "")
+        row["success"] = bool(result.success)
+        row["Chi2"] = _to_float(result.fitness)
+        row["npts"] = int(np.sum(result.index))
+        row["elapsed"] = elapsed
+        row["error"] = result.mesg or ""
+        for i, name in enumerate(result.param_list):
+            row[name] = _to_float(result.pvec[i])
+            if result.stderr is not None and i < len(result.stderr):
+                row["error on %s" % name] = _to_float(result.stderr[i])
+        return row
+
+    def error_row(self, path, msg, elapsed=0.0):
+        """
+        Result row for a file which could not be loaded or fitted
+        """
+        row = dict.fromkeys(self.columns())
+        row.update(file=path, name="", success=False, elapsed=elapsed,
+                   error=msg)
+        return row
+
+    def __call__(self, path):
+        """
+        Load the file at *path* and fit each data set it contains.
+
+        :return: list of result rows; errors are reported in the rows
+        """
+        from sas.sascalc.dataloader.loader import Loader
+
+        start = time.time()
+        try:
+            output = Loader().load(path)
+        except Exception:
+            return [self.error_row(path, traceback.format_exc(),
+                                   time.time() - start)]
+        if not isinstance(output, list):
+            output = [output]
+        if not output:
+            return [self.error_row(path, "no data could be read from file",
+                                   time.time() - start)]
+        rows = []
+        for data in output:
+            start = time.time()
+            try:
+                result = self.fit_data(data)
+                rows.append(self.result_row(path, data, result,
+                                            time.time() - start))
+            except Exception:
+                rows.append(self.error_row(path, traceback.format_exc(),
+                                           time.time() - start))
+        return rows
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def run_batch(job, files, workers=1):
+    """
+    Fit each file of *files* with *job*.
+
+    Rows are yielded as the fits complete, which is not necessarily in the
+    order of *files*.  With *workers* > 1 the files are fitted in a pool of
+    processes; *workers* <= 0 uses one process per cpu.
+    """
+    if workers <= 0:
+        workers = multiprocessing.cpu_count()
+    workers = min(workers, len(files))
+    if workers <= 1:
+        for path in files:
+            for row in job(path):
+                yield row
+        return
+
+    pool = multiprocessing.Pool(processes=workers)
+    try:
+        for rows in pool.imap_unordered(job, files):
+            for row in rows:
+                yield row
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+class CSVResultWriter(object):
+    """
+    Write result rows to a CSV file, one line per row
+    """
+    def __init__(self, stream, columns):
+        self.stream = stream
+        self.writer = csv.DictWriter(stream, fieldnames=columns,
+                                     extrasaction='ignore')
+        self.writer.writeheader()
+        self.stream.flush()
+
+    def write(self, row):
+        self.writer.writerow(dict((k, "" if v is None else v)
+                                  for k, v in row.items()))
+        self.stream.flush()
+
+
+class JSONLinesResultWriter(object):
+    """
+    Write result rows to a JSON Lines file, one object per line
+    """
+    def __init__(self, stream, columns):
+        self.stream = stream
+        self.columns = columns
+
+    def write(self, row):
+        record = [(k, row.get(k)) for k in self.columns]
+        self.stream.write(json.dumps(dict(record), sort_keys=True) + "\n")
+        self.stream.flush()
+
+
+WRITERS = {
+    "csv": CSVResultWriter,
+    "jsonl": JSONLinesResultWriter,
+}
+
+
+def get_writer(stream, columns, fmt=None, path=None):
+    """
+    Return the writer for *fmt*, or guess it from the extension of *path*
+    """
+    if fmt is None:
+        ext = os.path.splitext(path or "")[1].lower()
+        fmt = "jsonl" if ext in (".jsonl", ".json") else "csv"
+    if fmt not in WRITERS:
+        raise ValueError("unknown output format %r" % fmt)
+    return WRITERS[fmt](stream, columns)
+
+
+def main(argv=None):
+    """
+    Command line entry point; returns the number of failed fits
+    """
+    parser = argparse.ArgumentParser(
+        description="Fit a model to many data files without the GUI.")
+    parser.add_argument("model", help="name of the sasmodels model")
+    parser.add_argument("files", nargs="+",
+                        help="data files or glob patterns")
+    parser.add_argument("--fit", action="append", default=[],
+                        metavar="NAME[=VALUE[:MIN:MAX]]",
+                        help="fitted parameter, with optional start and range")
+    parser.add_argument("--set", action="append", default=[],
+                        metavar="NAME=VALUE", help="fixed parameter value")
+    parser.add_argument("--constraint", action="append", default=[],
+                        metavar="NAME=EXPR", help="parameter constraint")
+    parser.add_argument("--qmin", type=float, default=None)
+    parser.add_argument("--qmax", type=float, default=None)
+    parser.add_argument("--no-smearing", action="store_true",
+                        help="ignore the resolution stored with the data")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="number of worker processes (0 = one per cpu)")
+    parser.add_argument("--output", default=None,
+                        help="output file (default: standard output)")
+    parser.add_argument("--format", choices=sorted(WRITERS), default=None,
+                        help="output format (default: from the extension)")
+    opts = parser.parse_args(argv)
+
+    fitted = [parse_parameter(spec) for spec in opts.fit]
+    fixed = []
+    for spec in opts.set:
+        name, value, _ = parse_parameter(spec)
+        if value is None:
+            parser.error("--set %s needs a value" % spec)
+        fixed.append((name, value))
+    constraints = [parse_constraint(spec) for spec in opts.constraint]
+    if not fitted:
+        parser.error("at least one --fit parameter is required")
+    job = BatchFitJob(opts.model, fitted, fixed=fixed,
+                      constraints=constraints, qmin=opts.qmin,
+                      qmax=opts.qmax, smearing=not opts.no_smearing)
+    # Fail early on a bad model name rather than once per file
+    job.make_model()
+
+    files = find_files(opts.files)
+    if not files:
+        parser.error("no data files match %s" % " ".join(opts.files))
+
+    stream = open(opts.output, "wb") if opts.output else sys.stdout
+    try:
+        writer = get_writer(stream, job.columns(), fmt=opts.format,
+                            path=opts.output)
+        failed = 0
+        for row in run_batch(job, files, workers=opts.workers):
+            writer.write(row)
+            if not row["success"]:
+                failed += 1
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    logger.info("Batch fit: %d files, %d failed fits", len(files), failed)
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -19,6 +19,7 @@ import math
 import numpy as np
 
 from sas.sascalc.dataloader.data_info import Data1D as LoaderData1D
+from sas.sascalc.data_util.cache import array_digest
 
 # The minimum q-value to be used when extrapolating
 Q_MINIMUM = 1e-5
@@ -52,19 +53,17 @@ class Transform(object):
             dy = np.ones(len(data.y))
 
         # Transform the data
-        data_points = zip(data.x, data.y, dy)
-
-        output_points = [(self.linearize_q_value(p[0]),
-                          math.log(p[1]),
-                          p[2] / p[1]) for p in data_points if p[0] > 0 and \
-                          p[1] > 0 and p[2] > 0]
-
-        x_out, y_out, dy_out = zip(*output_points)
+        x = np.asarray(data.x, dtype=float)
+        y = np.asarray(data.y, dtype=float)
+        dy = np.asarray(dy, dtype=float)
+        idx = (x > 0) & (y > 0) & (dy > 0)
+        if not np.any(idx):
+            raise ValueError, "No data point can be linearized"
 
         # Create Data1D object
-        x_out = np.asarray(x_out)
-        y_out = np.asarray(y_out)
-        dy_out = np.asarray(dy_out)
+        x_out = self.linearize_q_value(x[idx])
+        y_out = np.log(y[idx])
+        dy_out = dy[idx] / y[idx]
         linear_data = LoaderData1D(x=x_out, y=y_out, dy=dy_out)
 
         return linear_data
@@ -76,8 +75,8 @@ class Transform(object):
 
         :param data: Data1D object
         """
-        return [p[0] > 0 and p[1] > 0 and p[2] > 0 for p in zip(data.x, data.y,
-                                                                data.dy)]
+        return ((np.asarray(data.x) > 0) & (np.asarray(data.y) > 0)
+                & (np.asarray(data.dy) > 0)).tolist()
 
     def linearize_q_value(self, value):
         """
@@ -157,12 +156,13 @@ class Guinier(Transform):
 
         :param x: array of q-values
         """
-        p1 = np.array([self.dscale * math.exp(-((self.radius * q) ** 2 / 3)) \
-                          for q in x])
-        p2 = np.array([self.scale * math.exp(-((self.radius * q) ** 2 / 3))\
-                     * (-(q ** 2 / 3)) * 2 * self.radius * self.dradius for q in x])
+        x = np.asarray(x, dtype=float)
+        exp_term = np.exp(-((self.radius * x) ** 2 / 3))
+        p1 = self.dscale * exp_term
+        p2 = self.scale * exp_term \
+                     * (-(x ** 2 / 3)) * 2 * self.radius * self.dradius
         diq2 = p1 * p1 + p2 * p2
-        return np.array([math.sqrt(err) for err in diq2])
+        return np.sqrt(diq2)
 
     def _guinier(self, x):
         """
@@ -181,7 +181,7 @@ class Guinier(Transform):
         if self.radius <= 0:
             msg = "Rg expected positive value, but got %s" % self.radius
             raise ValueError(msg)
-        value = np.array([math.exp(-((self.radius * i) ** 2 / 3)) for i in x])
+        value = np.exp(-((self.radius * np.asarray(x, dtype=float)) ** 2 / 3))
         return self.scale * value
 
 class PowerLaw(Transform):
@@ -204,7 +204,7 @@ class PowerLaw(Transform):
 
         :return: log(q)
         """
-        return math.log(value)
+        return np.log(value)
 
     def extract_model_parameters(self, constant, slope, dconstant=0, dslope=0):
         """
@@ -231,11 +231,12 @@ class PowerLaw(Transform):
         Returns the error on I(q) for the given array of q-values
         :param x: array of q-values
         """
-        p1 = np.array([self.dscale * math.pow(q, -self.power) for q in x])
-        p2 = np.array([self.scale * self.power * math.pow(q, -self.power - 1)\
-                           * self.dpower for q in x])
+        x = np.asarray(x, dtype=float)
+        p1 = self.dscale * np.power(x, -self.power)
+        p2 = self.scale * self.power * np.power(x, -self.power - 1)\
+                           * self.dpower
         diq2 = p1 * p1 + p2 * p2
-        return np.array([math.sqrt(err) for err in diq2])
+        return np.sqrt(diq2)
 
     def _power_law(self, x):
         """
@@ -258,7 +259,7 @@ class PowerLaw(Transform):
             msg = "scale expected positive value, but got %s" % self.scale
             raise ValueError(msg)
 
-        value = np.array([math.pow(i, -self.power) for i in x])
+        value = np.power(np.asarray(x, dtype=float), -self.power)
         return self.scale * value
 
 class Extrapolator(object):
@@ -414,6 +415,10 @@ class InvariantCalculator(object):
         # Extrapolation range
         self._low_q_limit = Q_MINIMUM
 
+        # Results of the last computations of Q* for the data and for the
+        # low-Q and high-Q extrapolations, with the inputs they depend on
+        self._cache = {}
+
     def _get_data(self, data):
         """
         :note: this function must be call before computing any type
@@ -504,11 +509,10 @@ class InvariantCalculator(object):
             if len(data.x) == 2:
                 return total
             else:
-                #iterate between for element different
+                #sum the elements different
                 #from the first and the last
-                for i in xrange(1, n - 1):
-                    dxi = (data.x[i + 1] - data.x[i - 1]) / 2
-                    total += gx[i] * data.y[i] * dxi
+                dxi = (data.x[2:n] - data.x[0:n - 2]) / 2
+                total += np.sum(gx[1:n - 1] * data.y[1:n - 1] * dxi)
                 return total
 
     def _get_qstar_uncertainty(self, data):
@@ -536,7 +540,7 @@ class InvariantCalculator(object):
         else:
             #Create error for data without dy error
             if data.dy is None:
-                dy = math.sqrt(data.y)
+                dy = np.sqrt(data.y)
             else:
                 dy = data.dy
             # Take care of smeared data
@@ -557,11 +561,10 @@ class InvariantCalculator(object):
             if len(data.x) == 2:
                 return math.sqrt(total)
             else:
-                #iterate between for element different
+                #sum the elements different
                 #from the first and the last
-                for i in xrange(1, n - 1):
-                    dxi = (data.x[i + 1] - data.x[i - 1]) / 2
-                    total += (gx[i] * dy[i] * dxi) ** 2
+                dxi = (data.x[2:n] - data.x[0:n - 2]) / 2
+                total += np.sum((gx[1:n - 1] * dy[1:n - 1] * dxi) ** 2)
                 return math.sqrt(total)
 
     def _get_extrapolated_data(self, model, npts=INTEGRATION_NSTEPS,
@@ -597,6 +600,25 @@ class InvariantCalculator(object):
             return self._low_extrapolation_power_fitted
         return self._high_extrapolation_power_fitted
 
+    def _data_key(self):
+        """
+        Fingerprint of the data used to key the cached results
+        """
+        return (array_digest(self._data.x), array_digest(self._data.y),
+                array_digest(self._data.dy), self._smeared,
+                array_digest(self._data.dxl) if self._smeared is not None
+                else None)
+
+    def _get_cached(self, name, key):
+        """
+        Return the cached result *name* if it was computed for *key*,
+        or None otherwise.
+        """
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        return None
+
     def get_qstar_low(self):
         """
         Compute the invariant for extrapolated data at low q range.
@@ -605,8 +627,32 @@ class InvariantCalculator(object):
             data = self._get_extra_data_low()
             return self._get_qstar()
 
+        The result is reused until the data or the low-Q extrapolation
+        settings change.
+
         :return q_star: the invariant for data extrapolated at low q.
         """
+        model = self._low_extrapolation_function
+        key = (self._data_key(), self._low_extrapolation_npts,
+               self._low_extrapolation_power, model.__class__,
+               Q_MINIMUM, INTEGRATION_NSTEPS)
+        cached = self._get_cached('low', key)
+        if cached is None:
+            result = self._compute_qstar_low()
+            self._cache['low'] = (key, (result, dict(model.__dict__),
+                                        self._low_extrapolation_power_fitted,
+                                        self._low_q_limit))
+            return result
+        result, params, power_fitted, low_q_limit = cached
+        model.__dict__.update(params)
+        self._low_extrapolation_power_fitted = power_fitted
+        self._low_q_limit = low_q_limit
+        return result
+
+    def _compute_qstar_low(self):
+        """
+        Fit the low-Q extrapolation and compute its invariant
+        """
         # Data boundaries for fitting
         qmin = self._data.x[0]
         qmax = self._data.x[self._low_extrapolation_npts - 1]
@@ -644,8 +690,30 @@ class InvariantCalculator(object):
             data = self._get_extra_data_high()
             return self._get_qstar()
 
+        The result is reused until the data or the high-Q extrapolation
+        settings change.
+
         :return q_star: the invariant for data extrapolated at high q.
         """
+        model = self._high_extrapolation_function
+        key = (self._data_key(), self._high_extrapolation_npts,
+               self._high_extrapolation_power, model.__class__,
+               Q_MAXIMUM, INTEGRATION_NSTEPS)
+        cached = self._get_cached('high', key)
+        if cached is None:
+            result = self._compute_qstar_high()
+            self._cache['high'] = (key, (result, dict(model.__dict__),
+                                         self._high_extrapolation_power_fitted))
+            return result
+        result, params, power_fitted = cached
+        model.__dict__.update(params)
+        self._high_extrapolation_power_fitted = power_fitted
+        return result
+
+    def _compute_qstar_high(self):
+        """
+        Fit the high-Q extrapolation and compute its invariant
+        """
         # Data boundaries for fitting
         x_len = len(self._data.x) - 1
         qmin = self._data.x[x_len - (self._high_extrapolation_npts - 1)]
@@ -777,8 +845,13 @@ class InvariantCalculator(object):
             properly apply to the data
 
         """
-        self._qstar = self._get_qstar(self._data)
-        self._qstar_err = self._get_qstar_uncertainty(self._data)
+        key = self._data_key()
+        cached = self._get_cached('data', key)
+        if cached is None:
+            cached = (self._get_qstar(self._data),
+                      self._get_qstar_uncertainty(self._data))
+            self._cache['data'] = (key, cached)
+        self._qstar, self._qstar_err = cached
 
         if extrapolation is None:
             return self._qstar
@@ -960,3 +1033,395 @@ class InvariantCalculator(object):
                  + self._qstar_err * (v - v ** 2))
 
         return s, ds
+
+
+def _trapezoid_weights(x):
+    """
+    Return the weights w such that sum(gx * y * w) is the sum computed by
+    InvariantCalculator._get_qstar for the q-values x.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x) - 1
+    weights = np.zeros(len(x))
+    weights[0] = (x[1] - x[0]) / 2
+    weights[n] = (x[n] - x[n - 1]) / 2
+    if len(x) > 2:
+        weights[1:n - 1] = (x[2:n] - x[0:n - 2]) / 2
+    return weights
+
+
+class BatchInvariantCalculator(object):
+    """
+    Compute the invariant of a series of I(q) curves measured on the same
+    q-values, such as the frames of a kinetics experiment.
+
+    The results are those of an InvariantCalculator created for each curve
+    with the same background, scale and extrapolation settings, returned as
+    arrays with one value per curve.  The linear fits of the extrapolations
+    and the integrals are computed for all the curves at once.  Where the
+    InvariantCalculator would raise an exception for a curve, for instance
+    when no point can be linearized or the volume fraction has no solution,
+    the value for that curve is NaN.
+    """
+    def __init__(self, data, background=0, scale=1, chunk_size=1000):
+        """
+        Initialize variables.
+
+        :param data: list of DataLoader.Data1D sharing the same q-values
+        :param background: Background value. The data will be corrected
+            before processing
+        :param scale: Scaling factor for I(q). The data will be corrected
+            before processing
+        :param chunk_size: number of curves for which the extrapolated
+            distributions are evaluated at the same time
+        """
+        if len(data) == 0:
+            raise ValueError, "No data to compute the invariant of"
+        for item in data:
+            if not issubclass(item.__class__, LoaderData1D):
+                raise ValueError, "Data must be of type DataLoader.Data1D"
+        self._background = background
+        self._scale = scale
+        self._chunk_size = chunk_size
+
+        self._x = np.asarray(data[0].x, dtype=float)
+        if len(self._x) <= 1:
+            raise ValueError, "The data must have more than one point"
+        for item in data:
+            if len(item.x) != len(self._x) or len(item.y) != len(self._x) \
+                or not np.array_equal(item.x, self._x):
+                raise ValueError, "All the curves must share the same q-values"
+
+        # Same corrections as InvariantCalculator._get_data
+        self._y = self._scale * np.array([item.y for item in data],
+                                         dtype=float) - self._background
+        self._dy = np.ones(self._y.shape)
+        for i, item in enumerate(data):
+            if item.dy is not None and len(item.dy) == len(self._x) \
+                and np.any(np.asarray(item.dy) != 0):
+                self._dy[i] = math.fabs(self._scale) * np.asarray(item.dy)
+
+        # slit height for smeared data, taken from the first curve
+        self._smeared = None
+        dxl = data[0].dxl
+        if dxl is not None and len(dxl) == len(self._x) and np.all(dxl != 0):
+            # assumes constant dxl
+            self._smeared = dxl[0]
+            self._gx = np.asarray(dxl, dtype=float) * self._x
+        else:
+            self._gx = self._x * self._x
+
+        # Extrapolation parameters
+        self._low_extrapolation_npts = 4
+        self._low_extrapolation_function = Guinier
+        self._low_extrapolation_power = None
+        self._low_extrapolation_power_fitted = None
+
+        self._high_extrapolation_npts = 4
+        self._high_extrapolation_power = None
+        self._high_extrapolation_power_fitted = None
+
+        self._qstar = None
+        self._qstar_err = None
+        # Results of the extrapolations for their current settings
+        self._cache = {}
+
+    def set_extrapolation(self, range, npts=4, function=None, power=None):
+        """
+        Set the extrapolation parameters for the high or low Q-range.
+        See InvariantCalculator.set_extrapolation.
+        """
+        range = range.lower()
+        if range not in ['high', 'low']:
+            raise ValueError, "Extrapolation range should be 'high' or 'low'"
+        function = function.lower()
+        if function not in ['power_law', 'guinier']:
+            msg = "Extrapolation function should be 'guinier' or 'power_law'"
+            raise ValueError, msg
+
+        if range == 'high':
+            if function != 'power_law':
+                msg = "Extrapolation only allows a power law at high Q"
+                raise ValueError, msg
+            self._high_extrapolation_npts = npts
+            self._high_extrapolation_power = power
+            self._high_extrapolation_power_fitted = power
+        else:
+            if function == 'power_law':
+                self._low_extrapolation_function = PowerLaw
+            else:
+                self._low_extrapolation_function = Guinier
+            self._low_extrapolation_npts = npts
+            self._low_extrapolation_power = power
+            self._low_extrapolation_power_fitted = power
+
+    def get_extrapolation_power(self, range='high'):
+        """
+        :return: the fitted power of the power law extrapolation of each
+            curve, or the radius for a Guinier low-Q extrapolation
+        """
+        if range == 'low':
+            return self._low_extrapolation_power_fitted
+        return self._high_extrapolation_power_fitted
+
+    def _fit(self, model, qmin, qmax, power=None):
+        """
+        Perform the linear fit of Extrapolator.fit for all the curves.
+
+        :return: slope, constant, error on slope, error on constant
+        """
+        idx = (self._x >= qmin) & (self._x <= qmax)
+        x = self._x[idx]
+        y = self._y[:, idx]
+        # Extrapolator.fit only uses the errors if they are all positive
+        sigma = np.where(np.all(self._dy > 0, axis=1)[:, np.newaxis],
+                         self._dy[:, idx], 1.0)
+
+        # Linearize the data; the points that can't be are given no weight
+        valid = (x > 0) & (y > 0) & (sigma > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lin_x = np.where(x > 0, model().linearize_q_value(
+                np.where(x > 0, x, 1.0)), 0.0)
+            lin_y = np.log(np.where(valid, y, 1.0))
+            weight = np.where(valid, (y / sigma) ** 2, 0.0)
+        npts = np.sum(valid, axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sum_w = np.sum(weight, axis=1)
+            mean_x = np.sum(weight * lin_x, axis=1) / sum_w
+            if power is not None:
+                slope = -power * np.ones(len(y))
+                constant = np.sum(weight * (lin_y - slope[:, np.newaxis]
+                                            * lin_x), axis=1) / sum_w
+                deltas = lin_x * slope[:, np.newaxis] \
+                    + constant[:, np.newaxis] - lin_y
+                residuals = np.sum(weight * deltas * deltas, axis=1)
+                dslope = np.zeros(len(y))
+                dconstant = np.sqrt(np.fabs(residuals) / sum_w)
+            else:
+                # Weighted least squares on centered abscissae
+                dx = lin_x - mean_x[:, np.newaxis]
+                sxx = np.sum(weight * dx * dx, axis=1)
+                slope = np.sum(weight * dx * lin_y, axis=1) / sxx
+                constant = np.sum(weight * lin_y, axis=1) / sum_w \
+                    - slope * mean_x
+                deltas = lin_x * slope[:, np.newaxis] \
+                    + constant[:, np.newaxis] - lin_y
+                residuals = np.fabs(np.sum(weight * deltas * deltas, axis=1))
+                dslope = np.sqrt(residuals / sxx)
+                dconstant = np.sqrt(residuals * (1.0 / sum_w
+                                                 + mean_x * mean_x / sxx))
+                # lstsq gives no residuals without extra degrees of freedom
+                dslope[npts <= 2] = -1.0
+                dconstant[npts <= 2] = -1.0
+                slope[npts < 2] = np.nan
+        constant[npts == 0] = np.nan
+        return slope, constant, dslope, dconstant
+
+    def _extract_model_parameters(self, model, slope, constant,
+                                  dslope, dconstant):
+        """
+        Vectorized version of the extract_model_parameters of the models.
+
+        :return: dictionary of parameter arrays, with the fitted value
+            stored as the extrapolation power under the key 'fitted'
+        """
+        params = dict(scale=np.exp(constant),
+                      dscale=np.exp(constant) * dconstant)
+        if model is Guinier:
+            slope = np.where(slope > 0, 0.0, slope)
+            params['radius'] = np.sqrt(-3 * slope)
+            with np.errstate(divide='ignore'):
+                params['dradius'] = -3.0 / 2.0 \
+                    / np.sqrt(-3 * np.where(slope == 0.0, -1.0e-24, slope)) \
+                    * dslope
+            params['fitted'] = params['radius']
+        else:
+            params['power'] = -slope
+            params['dpower'] = -dslope
+            params['fitted'] = params['power']
+        return params
+
+    def _get_extrapolated_qstar(self, model, params, q_start, q_end):
+        """
+        Compute the invariant and its uncertainty of the extrapolated
+        distribution of each curve, as InvariantCalculator does with the
+        output of _get_extrapolated_data.
+
+        :return: Q*, error on Q*, I(q_start) - I(q_end)
+        """
+        q = np.linspace(start=q_start, stop=q_end,
+                        num=INTEGRATION_NSTEPS, endpoint=True)
+        weights = _trapezoid_weights(q)
+        if self._smeared is not None:
+            weights = weights * self._smeared * q
+        else:
+            weights = weights * q * q
+
+        n_curves = len(self._y)
+        qstar = np.zeros(n_curves)
+        qstar_err = np.zeros(n_curves)
+        delta = np.zeros(n_curves)
+        for start in range(0, n_curves, self._chunk_size):
+            chunk = slice(start, start + self._chunk_size)
+            scale = params['scale'][chunk, np.newaxis]
+            dscale = params['dscale'][chunk, np.newaxis]
+            with np.errstate(all='ignore'):
+                if model is Guinier:
+                    radius = params['radius'][chunk, np.newaxis]
+                    exp_term = np.exp(-((radius * q) ** 2 / 3))
+                    iq = scale * exp_term
+                    diq = np.hypot(dscale * exp_term,
+                                   scale * exp_term * (-(q ** 2 / 3)) * 2
+                                   * radius * params['dradius'][chunk, np.newaxis])
+                    invalid = ~(radius > 0)
+                else:
+                    power = params['power'][chunk, np.newaxis]
+                    iq = scale * np.power(q, -power)
+                    diq = np.hypot(dscale * np.power(q, -power),
+                                   scale * power * np.power(q, -power - 1)
+                                   * params['dpower'][chunk, np.newaxis])
+                    invalid = ~((power > 0) & (scale > 0))
+            qstar[chunk] = np.dot(iq, weights)
+            qstar_err[chunk] = np.sqrt(np.dot(diq * diq, weights * weights))
+            delta[chunk] = iq[:, 0] - iq[:, -1]
+            qstar[chunk][invalid[:, 0]] = np.nan
+        return qstar, qstar_err, delta
+
+    def get_qstar_low(self):
+        """
+        Compute the invariant for the low-Q extrapolation of each curve.
+
+        :return: Q*, error on Q* arrays
+        """
+        model = self._low_extrapolation_function
+        key = ('low', self._low_extrapolation_npts,
+               self._low_extrapolation_power, model)
+        if key not in self._cache:
+            # Data boundaries for fitting
+            qmin = self._x[0]
+            qmax = self._x[self._low_extrapolation_npts - 1]
+            params = self._extract_model_parameters(
+                model, *self._fit(model, qmin, qmax,
+                                  power=self._low_extrapolation_power))
+
+            # Distribution starting point
+            low_q_limit = Q_MINIMUM
+            if Q_MINIMUM >= qmin:
+                low_q_limit = qmin / 10
+            qstar, qstar_err, delta = self._get_extrapolated_qstar(
+                model, params, low_q_limit, qmin)
+            # Systematic error, as in InvariantCalculator.get_qstar_low
+            qstar_err += qmin * qmin * np.fabs((qmin - low_q_limit) * delta)
+            self._cache[key] = (qstar, qstar_err, params['fitted'])
+        qstar, qstar_err, fitted = self._cache[key]
+        self._low_extrapolation_power_fitted = fitted
+        return qstar, qstar_err
+
+    def get_qstar_high(self):
+        """
+        Compute the invariant for the high-Q extrapolation of each curve.
+
+        :return: Q*, error on Q* arrays
+        """
+        key = ('high', self._high_extrapolation_npts,
+               self._high_extrapolation_power)
+        if key not in self._cache:
+            # Data boundaries for fitting
+            x_len = len(self._x) - 1
+            qmin = self._x[x_len - (self._high_extrapolation_npts - 1)]
+            qmax = self._x[x_len]
+            params = self._extract_model_parameters(
+                PowerLaw, *self._fit(PowerLaw, qmin, qmax,
+                                     power=self._high_extrapolation_power))
+            qstar, qstar_err, _ = self._get_extrapolated_qstar(
+                PowerLaw, params, qmax, Q_MAXIMUM)
+            self._cache[key] = (qstar, qstar_err, params['fitted'])
+        qstar, qstar_err, fitted = self._cache[key]
+        self._high_extrapolation_power_fitted = fitted
+        return qstar, qstar_err
+
+    def get_qstar_with_error(self, extrapolation=None):
+        """
+        Compute the invariant of each curve and its uncertainty.
+
+        :param extrapolation: string to apply optional extrapolation
+
+        :return: invariant, invariant uncertainty arrays
+        """
+        if 'data' not in self._cache:
+            weights = _trapezoid_weights(self._x) * self._gx
+            self._cache['data'] = (
+                np.dot(self._y, weights),
+                np.sqrt(np.dot(self._dy * self._dy, weights * weights)))
+        qstar, qstar_err = self._cache['data']
+        qstar_err = qstar_err * qstar_err
+
+        if extrapolation is not None:
+            extrapolation = extrapolation.lower()
+            if extrapolation in ('low', 'both'):
+                qs_low, dqs_low = self.get_qstar_low()
+                qstar = qstar + qs_low
+                qstar_err = qstar_err + dqs_low * dqs_low
+            if extrapolation in ('high', 'both'):
+                qs_hi, dqs_hi = self.get_qstar_high()
+                qstar = qstar + qs_hi
+                qstar_err = qstar_err + dqs_hi * dqs_hi
+
+        self._qstar = qstar
+        self._qstar_err = np.sqrt(qstar_err)
+        return self._qstar, self._qstar_err
+
+    def get_qstar(self, extrapolation=None):
+        """
+        Compute the invariant of each curve.
+
+        :param extrapolation: string to apply optional extrapolation
+
+        :return: invariant array
+        """
+        return self.get_qstar_with_error(extrapolation)[0]
+
+    def get_volume_fraction_with_error(self, contrast, extrapolation=None):
+        """
+        Compute the volume fraction of each curve and its uncertainty.
+        See InvariantCalculator.get_volume_fraction_with_error.
+
+        :param contrast: contrast value
+        :param extrapolation: string to apply optional extrapolation
+
+        :return: V, dV = volume fraction, error on volume fraction arrays
+        """
+        if contrast <= 0:
+            raise ValueError, "The contrast parameter must be greater than zero"
+        qstar, qstar_err = self.get_qstar_with_error(extrapolation)
+
+        with np.errstate(invalid='ignore'):
+            k = 1.e-8 * qstar / (2 * (math.pi * math.fabs(float(contrast))) ** 2)
+            discrim = np.where(qstar > 0, 1 - 4 * k, np.nan)
+            volume1 = 0.5 * (1 - np.sqrt(discrim))
+            volume2 = 0.5 * (1 + np.sqrt(discrim))
+            volume = np.where((0 <= volume1) & (volume1 <= 1), volume1,
+                              np.where((0 <= volume2) & (volume2 <= 1),
+                                       volume2, np.nan))
+            uncertainty = np.fabs((0.5 * 4 * k * qstar_err)
+                                  / (2 * np.sqrt(1 - k * qstar)))
+        uncertainty[np.isnan(volume)] = np.nan
+        return volume, uncertainty
+
+    def get_surface_with_error(self, contrast, porod_const, extrapolation=None):
+        """
+        Compute the specific surface of each curve and its uncertainty.
+        See InvariantCalculator.get_surface_with_error.
+
+        :param contrast: contrast value
+        :param porod_const: porod constant value
+        :param extrapolation: string to apply optional extrapolation
+
+        :return S, dS: the surface, with its uncertainty arrays
+        """
+        v, dv = self.get_volume_fraction_with_error(contrast, extrapolation)
+        s = 2 * math.pi * v * (1 - v) * float(porod_const) / self._qstar
+        ds = porod_const * 2 * math.pi * ((dv - 2 * v * dv) / self._qstar
+                                          + self._qstar_err * (v - v ** 2))
+        return s, ds
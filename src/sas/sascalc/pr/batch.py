@@ -0,0 +1,194 @@
+"""
+P(r) inversion of a series of I(q) curves measured on the same q-values.
+
+The least square problem solved by Invertor.lstsq for each curve only
+differs by the error weighting of its rows and by its right hand side.
+invert_batch builds the base functions and the regularization rows once
+and solves the problems of all the curves together with a stacked SVD.
+"""
+import time
+
+import numpy as np
+
+from sas.sascalc.pr.invertor import Invertor
+
+
+class BatchResults(object):
+    """
+    Class to hold the inversion outputs of a batch, one row per curve
+    """
+    def __init__(self, n_curves, nfunc):
+        """
+        Initialization. Create the output arrays.
+        """
+        ## Coefficients of the base functions
+        self.out = np.zeros([n_curves, nfunc])
+        ## Covariance matrices of the coefficients
+        self.cov = np.zeros([n_curves, nfunc, nfunc])
+        ## Chi^2 of each inversion, -1 if the problem is rank deficient
+        self.chi2 = np.zeros(n_curves)
+        ## Background, fitted if est_bck is True
+        self.background = np.zeros(n_curves)
+        ## Radius of gyration
+        self.rg = np.zeros(n_curves)
+        ## I(q=0)
+        self.iq0 = np.zeros(n_curves)
+        ## Oscillation parameter
+        self.osc = np.zeros(n_curves)
+        ## Fraction of P(r) above zero
+        self.pos = np.zeros(n_curves)
+        ## Fraction of P(r) 1-sigma above zero
+        self.pos_err = np.zeros(n_curves)
+        ## Number of P(r) peaks
+        self.peaks = np.zeros(n_curves, dtype=int)
+        ## Computation time
+        self.elapsed = 0.0
+
+
+def invert_batch(x, y, err, d_max, nfunc=10, alpha=0.0, nr=20,
+                 chunk_size=256, **kwargs):
+    """
+    Perform the P(r) inversion of a series of curves.
+
+    For each curve, the results are those of Invertor.invert(nfunc, nr)
+    for an Invertor set up with the same parameters, except that the
+    outputs only have nfunc coefficients when the background is fitted.
+
+    :param x: q-values shared by all the curves [n_q]
+    :param y: intensities [n_curves, n_q]
+    :param err: errors on the intensities, either [n_curves, n_q] or
+        [n_q] if all the curves have the same errors
+    :param d_max: maximum distance
+    :param nfunc: number of base functions to use.
+    :param alpha: regularization constant
+    :param nr: number of r points to evaluate the 2nd derivative at for the reg. term.
+    :param chunk_size: number of curves with different errors solved at
+        the same time, which bounds the memory used
+    :param kwargs: other Invertor parameters: q_min, q_max, est_bck,
+        background, slit_height, slit_width
+
+    :return: BatchResults object
+    """
+    t_0 = time.time()
+    x = np.asarray(x, dtype=float)
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    err = np.fabs(np.asarray(err, dtype=float))
+    if y.shape[1] != len(x) or err.shape[-1] != len(x) \
+        or (err.ndim == 2 and err.shape[0] != y.shape[0]):
+        msg = "invert_batch: invalid data; incompatible data lengths."
+        raise RuntimeError, msg
+    if np.any(err == 0):
+        msg = "invert_batch: Some I(Q) points have no error."
+        raise RuntimeError, msg
+
+    # Template invertor holding the parameters shared by the curves
+    pr = Invertor()
+    pr.x = x
+    pr.y = np.zeros(len(x))
+    pr.err = np.ones(len(x))
+    pr.d_max = d_max
+    pr.alpha = alpha
+    for name, value in kwargs.items():
+        if name not in ('q_min', 'q_max', 'est_bck', 'background',
+                        'slit_height', 'slit_width'):
+            raise TypeError, "invert_batch: unknown parameter %s" % name
+        setattr(pr, name, value)
+
+    # Matrix with unit errors: the base functions of the accepted points
+    # and the regularization rows
+    npts = len(x)
+    nterms = nfunc + 1 if pr.est_bck else nfunc
+    a = np.zeros([npts + nr, nterms])
+    pr._get_matrix(nterms, nr, a, np.zeros(npts + nr), pr.get_basis(nfunc))
+    accepted = np.array([pr._accept_q(q) for q in x], dtype=bool)
+    b = np.where(accepted, y, 0.0)
+    if not pr.est_bck:
+        b = np.where(accepted, b - pr.background, 0.0)
+
+    results = BatchResults(len(y), nfunc)
+    if err.ndim == 1:
+        coeffs, cov, chi2 = _solve(a, b / err, err[np.newaxis, :], npts)
+    else:
+        coeffs = np.zeros([len(y), nterms])
+        cov = np.zeros([len(y), nterms, nterms])
+        chi2 = np.zeros(len(y))
+        for start in range(0, len(y), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            coeffs[chunk], cov[chunk], chi2[chunk] = \
+                _solve(a, b[chunk] / err[chunk], err[chunk], npts)
+
+    if pr.est_bck:
+        results.background[:] = coeffs[:, 0]
+        results.out[:] = coeffs[:, 1:]
+        results.cov[:] = cov[:, 1:, 1:]
+    else:
+        results.background[:] = pr.background
+        results.out[:] = coeffs
+        results.cov[:] = cov
+    results.chi2[:] = chi2
+
+    for i in range(len(y)):
+        out = results.out[i]
+        results.rg[i] = pr.rg(out)
+        results.iq0[i] = pr.iq0(out)
+        results.osc[i] = pr.oscillations(out)
+        results.pos[i] = pr.get_positive(out)
+        results.pos_err[i] = pr.get_pos_err(out, results.cov[i])
+        results.peaks[i] = pr.get_peaks(out)
+    results.elapsed = time.time() - t_0
+    return results
+
+
+def _solve(a, b, err, npts):
+    """
+    Solve the least square problems of a set of curves.
+
+    :param a: matrix for unit errors [npts+nr, nterms]
+    :param b: weighted intensities [n_curves, npts]
+    :param err: errors, [n_curves, npts] or [1, npts] if shared
+    :param npts: number of points
+
+    :return: coefficients, covariance matrices and chi^2 of the curves
+    """
+    n_curves = len(b)
+    nrows, nterms = a.shape
+    # Stack of weighted matrices, a single one if the errors are shared
+    mat = np.repeat(a[np.newaxis, :, :], len(err), axis=0)
+    mat[:, :npts, :] /= err[:, :, np.newaxis]
+    rhs = np.zeros([n_curves, nrows])
+    rhs[:, :npts] = b
+
+    # Least square solutions, cutting the singular values like lstsq
+    # One decomposition per matrix: stacked linalg needs numpy 1.8
+    u_mat, s, v_t = [np.array(part) for part in zip(
+        *[np.linalg.svd(m, full_matrices=False) for m in mat])]
+    cutoff = np.finfo(float).eps * s[:, :1]
+    inv_s = np.where(s > cutoff, 1.0 / np.where(s > 0, s, 1.0), 0.0)
+    rank = np.sum(s > cutoff, axis=1)
+    if len(err) == 1:
+        coeffs = np.dot(np.dot(rhs, u_mat[0]) * inv_s[0], v_t[0])
+        residuals = np.dot(coeffs, mat[0].T) - rhs
+    else:
+        u_b = np.einsum('kji,kj->ki', u_mat, rhs)
+        coeffs = np.einsum('kij,ki->kj', v_t, u_b * inv_s)
+        residuals = np.einsum('kij,kj->ki', mat, coeffs) - rhs
+
+    # Residuals, only defined for a full rank overdetermined problem
+    chi2 = np.sum(residuals**2, axis=1)
+    if nrows <= nterms:
+        chi2[:] = -1.0
+    else:
+        # The rank is shared by all the curves if their errors are
+        chi2[np.repeat(rank < nterms, n_curves // len(rank))] = -1.0
+
+    # Covariance: pseudo-inverse of a^T a, scaled by the reduced chi^2
+    s2 = s**2
+    inv_s2 = np.where(s2 > 1e-15 * s2[:, :1],
+                      1.0 / np.where(s2 > 0, s2, 1.0), 0.0)
+    cov = np.einsum('kli,kl,klj->kij', v_t, inv_s2, v_t)
+    if npts != nterms:
+        scale = np.fabs(chi2 / float(npts - nterms))
+        cov = cov * scale[:, np.newaxis, np.newaxis]
+    else:
+        cov = np.zeros([n_curves, nterms, nterms])
+    return coeffs, np.repeat(cov, n_curves // len(cov), axis=0), chi2
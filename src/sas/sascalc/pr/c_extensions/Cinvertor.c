@@ -850,29 +850,77 @@ int accept_q(Cinvertor *self, double q) {
     return 1;
 }
 
+const char get_basis_doc[] =
+	"Fills a matrix with the Fourier transformed base functions,\n"
+	"slit-smeared if a slit size is set, for all the q-values.\n"
+	" @param n_min: order of the first base function (starting at 1)\n"
+	" @param n_max: order after the last base function\n"
+	" @param a: npoints x (n_max-n_min) array to fill\n"
+	" @return: 0";
+
+static PyObject * get_basis(Cinvertor *self, PyObject *args) {
+	double *a;
+	PyObject *a_obj;
+	Py_ssize_t n_a;
+	int n_min, n_max, ncol;
+	int i, n;
+
+	if (!PyArg_ParseTuple(args, "iiO", &n_min, &n_max, &a_obj)) return NULL;
+	OUTVECTOR(a_obj,a,n_a);
+
+	ncol = n_max - n_min;
+	if (n_min < 1 || ncol < 0 || n_a < ncol*self->params.npoints) {
+		PyErr_SetString(CinvertorError,
+			"Cinvertor.get_basis: invalid base function range or array size.");
+		return NULL;
+	}
+
+	Py_BEGIN_ALLOW_THREADS
+	for (i=0; i<self->params.npoints; i++) {
+		for (n=n_min; n<n_max; n++) {
+			if (self->params.slit_width>0 || self->params.slit_height>0) {
+				a[i*ncol+n-n_min] = ortho_transformed_smeared(self->params.d_max,
+						n, self->params.slit_height, self->params.slit_width,
+						self->params.x[i], 21);
+			} else {
+				a[i*ncol+n-n_min] = ortho_transformed(self->params.d_max, n, self->params.x[i]);
+			}
+		}
+	}
+	Py_END_ALLOW_THREADS
+
+	return Py_BuildValue("i", 0);
+}
+
 const char get_matrix_doc[] =
 	"Returns A matrix and b vector for least square problem.\n"
 	" @param nfunc: number of base functions\n"
 	" @param nr: number of r-points used when evaluating reg term.\n"
 	" @param a: A array to fill\n"
 	" @param b: b vector to fill\n"
+	" @param basis: optional npoints x ncol matrix filled by get_basis\n"
+	"     starting at order 1, used instead of computing the base functions\n"
 	" @return: 0";
 
 static PyObject * get_matrix(Cinvertor *self, PyObject *args) {
 	double *a;
 	double *b;
+	double *basis = NULL;
 	PyObject *a_obj;
 	PyObject *b_obj;
+	PyObject *basis_obj = NULL;
 	Py_ssize_t n_a;
 	Py_ssize_t n_b;
+	Py_ssize_t n_basis = 0;
 	// Number of bins for regularization term evaluation
 	int nr, nfunc;
 	int i, j, i_r;
 	double r, sqrt_alpha, pi;
 	double tmp;
 	int offset;
+	int ncol = 0;
 
-	if (!PyArg_ParseTuple(args, "iiOO", &nfunc, &nr, &a_obj, &b_obj)) return NULL;
+	if (!PyArg_ParseTuple(args, "iiOO|O", &nfunc, &nr, &a_obj, &b_obj, &basis_obj)) return NULL;
 	OUTVECTOR(a_obj,a,n_a);
 	OUTVECTOR(b_obj,b,n_b);
 
@@ -883,6 +931,16 @@ static PyObject * get_matrix(Cinvertor *self, PyObject *args) {
 	pi = acos(-1.0);
 	offset = (self->params.est_bck==1) ? 0 : 1;
 
+	if (basis_obj != NULL && basis_obj != Py_None) {
+		INVECTOR(basis_obj,basis,n_basis);
+		if (self->params.npoints > 0) ncol = n_basis/self->params.npoints;
+		if (self->params.npoints > 0 && ncol < nfunc+offset-1) {
+			PyErr_SetString(CinvertorError,
+				"Cinvertor.get_matrix: the basis has too few base functions.");
+			return NULL;
+		}
+	}
+
     for (j=0; j<nfunc; j++) {
         for (i=0; i<self->params.npoints; i++) {
             if (self->params.err[i]==0.0) {
@@ -894,7 +952,9 @@ static PyObject * get_matrix(Cinvertor *self, PyObject *args) {
                 if (self->params.est_bck==1 && j==0) {
                     a[i*nfunc+j] = 1.0/self->params.err[i];
                 } else {
-                	if (self->params.slit_width>0 || self->params.slit_height>0) {
+                	if (basis != NULL) {
+                		a[i*nfunc+j] = basis[i*ncol+j+offset-1]/self->params.err[i];
+                	} else if (self->params.slit_width>0 || self->params.slit_height>0) {
                 		a[i*nfunc+j] = ortho_transformed_smeared(self->params.d_max,
                 				j+offset, self->params.slit_height, self->params.slit_width,
                 				self->params.x[i], 21)/self->params.err[i];
@@ -1046,6 +1106,7 @@ static PyMethodDef Cinvertor_methods[] = {
 		   {"rg", (PyCFunction)get_rg, METH_VARARGS, get_rg_doc},
 		   {"iq0", (PyCFunction)get_iq0, METH_VARARGS, get_iq0_doc},
 		   {"_get_matrix", (PyCFunction)get_matrix, METH_VARARGS, get_matrix_doc},
+		   {"_get_basis", (PyCFunction)get_basis, METH_VARARGS, get_basis_doc},
 		   {"_get_invcov_matrix", (PyCFunction)get_invcov_matrix, METH_VARARGS, get_invcov_matrix_doc},
 		   {"_get_reg_size", (PyCFunction)get_reg_size, METH_VARARGS, get_reg_size_doc},
 
@@ -15,7 +15,7 @@ of D_max value. User picks a number of points and a range of
 distances, then get a series of outputs as a function of D_max
 over that range.
 """
-import sys
+from sas.sascalc.pr import scan
 
 
 class Results(object):
@@ -57,13 +57,15 @@ class DistExplorer(object):
         self._default_min = 0.8 * self.pr_state.d_max
         self._default_max = 1.2 * self.pr_state.d_max
 
-    def __call__(self, dmin=None, dmax=None, npts=10):
+    def __call__(self, dmin=None, dmax=None, npts=10, workers=None):
         """
         Compute the outputs as a function of D_max.
 
         :param dmin: minimum value for D_max
         :param dmax: maximum value for D_max
         :param npts: number of points for D_max
+        :param workers: number of processes used for the inversions,
+            see :func:`sas.sascalc.pr.scan.get_workers`
 
         """
         # Take care of the defaults if needed
@@ -77,31 +79,19 @@ class DistExplorer(object):
         results = Results()
 
         # Loop over d_max values
-        for i in range(npts):
-            d = dmin + i * (dmax - dmin) / (npts - 1.0)
-            self.pr_state.d_max = d
-            try:
-                out, cov = self.pr_state.invert(self.pr_state.nfunc)
-
-                # Store results
-                iq0 = self.pr_state.iq0(out)
-                rg = self.pr_state.rg(out)
-                pos = self.pr_state.get_positive(out)
-                pos_err = self.pr_state.get_pos_err(out, cov)
-                osc = self.pr_state.oscillations(out)
-
-                results.d_max.append(self.pr_state.d_max)
-                results.bck.append(self.pr_state.background)
-                results.chi2.append(self.pr_state.chi2)
-                results.iq0.append(iq0)
-                results.rg.append(rg)
-                results.pos.append(pos)
-                results.pos_err.append(pos_err)
-                results.osc.append(osc)
-            except:
+        d_values = [dmin + i * (dmax - dmin) / (npts - 1.0)
+                    for i in range(npts)]
+        points = scan.scan(scan.explore_point,
+                           [(self.pr_state, self.pr_state.nfunc, d)
+                            for d in d_values],
+                           workers)
+        for output in points:
+            if isinstance(output, basestring):
                 # This inversion failed, skip this D_max value
-                msg = "ExploreDialog: inversion failed for "
-                msg += "D_max=%s\n %s" % (str(d), sys.exc_value)
-                results.errors.append(msg)
+                results.errors.append("ExploreDialog: " + output)
+                continue
+            # Store results
+            for name, value in output.items():
+                getattr(results, name).append(value)
 
         return results
@@ -15,8 +15,10 @@ import os
 import re
 import logging
 from numpy.linalg import lstsq
-from scipy import optimize
+from scipy import optimize, linalg
 from sas.sascalc.pr.core.pr_inversion import Cinvertor
+from sas.sascalc.pr import scan
+from sas.sascalc.data_util.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -109,9 +111,12 @@ class Invertor(Cinvertor):
     background = 0
     ## Information dictionary for application use
     info = {}
+    ## Cache of the base functions, shared with the clones
+    basis_cache = None
 
     def __init__(self):
         Cinvertor.__init__(self)
+        self.basis_cache = BasisCache()
 
     def __setstate__(self, state):
         """
@@ -253,6 +258,7 @@ class Invertor(Cinvertor):
         invertor.slit_width = self.slit_width
 
         invertor.info = copy.deepcopy(self.info)
+        invertor.basis_cache = self.basis_cache
 
         return invertor
 
@@ -470,7 +476,7 @@ class Invertor(Cinvertor):
         # Construct the a matrix and b vector that represent the problem
         t_0 = time.time()
         try:
-            self._get_matrix(nfunc, nq, a, b)
+            self._get_matrix(nfunc, nq, a, b, self.get_basis(self.nfunc))
         except:
             raise RuntimeError, "Invertor: could not invert I(Q)\n  %s" % sys.exc_value
 
@@ -527,7 +533,50 @@ class Invertor(Cinvertor):
 
         return self.out, self.cov
 
-    def estimate_numterms(self, isquit_func=None):
+    def get_basis(self, nfunc):
+        """
+        Returns the matrix of the Fourier transformed base functions,
+        slit-smeared if needed, for each q-value.
+
+        The matrix is kept in the basis cache, so it is only computed
+        again when the q-values, D_max or slit size change, and only the
+        new columns are computed when nfunc grows.
+
+        :param nfunc: number of base functions
+
+        :return: npts x nfunc array
+        """
+        if self.basis_cache is None:
+            self.basis_cache = BasisCache()
+        return self.basis_cache.get_basis(self, nfunc)
+
+    def regularization_path(self, nfunc=10, nr=20):
+        """
+        Factorize the least square problem solved by lstsq so that it
+        can be solved for many values of alpha.
+
+        :param nfunc: number of base functions to use.
+        :param nr: number of r points to evaluate the 2nd derivative at for the reg. term.
+
+        :return: RegularizationPath object
+        """
+        return RegularizationPath(self, nfunc, nr)
+
+    def _alpha_peaks(self, nfunc, alphas, path=None, workers=None):
+        """
+        Iterate over the number of P(r) peaks and the suggested alpha
+        obtained for each value of *alphas*, from the regularization
+        path *path* or from one inversion per value if path is None.
+        """
+        if path is None:
+            return scan.scan(scan.peaks_point,
+                             [(self, nfunc, alpha) for alpha in alphas],
+                             workers)
+        out, _, _, suggested_alpha, _ = path(alphas)
+        return ((self.get_peaks(out[i]), suggested_alpha[i])
+                for i in range(len(out)))
+
+    def estimate_numterms(self, isquit_func=None, workers=None):
         """
         Returns a reasonable guess for the
         number of terms
@@ -535,27 +584,32 @@ class Invertor(Cinvertor):
         :param isquit_func:
           reference to thread function to call to check whether the computation needs to
           be stopped.
+        :param workers: number of processes used to scan the number of terms,
+            see :func:`sas.sascalc.pr.scan.get_workers`
 
         :return: number of terms, alpha, message
 
         """
         from num_term import NTermEstimator
-        estimator = NTermEstimator(self.clone())
+        estimator = NTermEstimator(self.clone(), workers=workers)
         try:
             return estimator.num_terms(isquit_func)
         except:
             # If we fail, estimate alpha and return the default
             # number of terms
-            best_alpha, _, _ = self.estimate_alpha(self.nfunc)
+            best_alpha, _, _ = self.estimate_alpha(self.nfunc, workers)
             logger.warning("Invertor.estimate_numterms: %s" % sys.exc_value)
             return self.nfunc, best_alpha, "Could not estimate number of terms"
 
-    def estimate_alpha(self, nfunc):
+    def estimate_alpha(self, nfunc, workers=None):
         """
         Returns a reasonable guess for the
         regularization constant alpha
 
         :param nfunc: number of terms to use in the expansion.
+        :param workers: number of processes used to try the alpha values
+            when the problem cannot be solved with a regularization path,
+            see :func:`sas.sascalc.pr.scan.get_workers`
 
         :return: alpha, message, elapsed
 
@@ -576,17 +630,23 @@ class Invertor(Cinvertor):
             if pr.alpha <= 0:
                 pr.alpha = 0.0001
 
+            # Factorize the problem once for all the alpha values
+            try:
+                path = pr.regularization_path(nfunc)
+            except np.linalg.LinAlgError:
+                # Perform one inversion per alpha value instead
+                path = None
+
             # Perform inversion to find the largest alpha
-            out, _ = pr.invert(nfunc)
-            elapsed = time.time() - starttime
             initial_alpha = pr.alpha
-            initial_peaks = pr.get_peaks(out)
+            initial_peaks, pr.suggested_alpha = \
+                next(pr._alpha_peaks(nfunc, [initial_alpha], path))
+            elapsed = time.time() - starttime
 
             # Try the inversion with the estimated alpha
             pr.alpha = pr.suggested_alpha
-            out, _ = pr.invert(nfunc)
-
-            npeaks = pr.get_peaks(out)
+            npeaks, pr.suggested_alpha = \
+                next(pr._alpha_peaks(nfunc, [pr.alpha], path))
             # if more than one peak to start with
             # just return the estimate
             if npeaks > 1:
@@ -602,15 +662,17 @@ class Invertor(Cinvertor):
                 alpha = pr.suggested_alpha
                 best_alpha = pr.suggested_alpha
                 found = False
-                for i in range(10):
-                    pr.alpha = (0.33) ** (i + 1) * alpha
-                    out, _ = pr.invert(nfunc)
-
-                    peaks = pr.get_peaks(out)
-                    if peaks > 1:
-                        found = True
-                        break
-                    best_alpha = pr.alpha
+                ladder = [(0.33) ** (i + 1) * alpha for i in range(10)]
+                points = pr._alpha_peaks(nfunc, ladder, path, workers)
+                try:
+                    for i, (peaks, suggested_alpha) in enumerate(points):
+                        pr.suggested_alpha = suggested_alpha
+                        if peaks > 1:
+                            found = True
+                            break
+                        best_alpha = ladder[i]
+                finally:
+                    points.close()
 
                 # If we didn't find a turning point for alpha and
                 # the initial alpha already had only one peak,
@@ -759,3 +821,180 @@ class Invertor(Cinvertor):
         else:
             msg = "Invertor.from_file: '%s' is not a file" % str(path)
             raise RuntimeError, msg
+
+
+class BasisCache(LRUCache):
+    """
+    Least recently used cache of the base function matrices.
+
+    The entries are keyed on the q-values, D_max and slit size.  They
+    only depend on the number of base functions through their number of
+    columns, so a request for more functions than cached only computes
+    the missing columns.
+    """
+
+    def get_basis(self, invertor, nfunc):
+        """
+        Return the base function matrix for the data of *invertor*.
+
+        :param invertor: Invertor holding the q-values, D_max and slit size
+        :param nfunc: number of base functions
+
+        :return: npts x nfunc array, which should not be modified
+        """
+        x = invertor.x
+        key = (invertor.d_max, invertor.slit_height, invertor.slit_width,
+               x.tostring())
+        basis = self.get(key)
+        if basis is not None and basis.shape[1] >= nfunc:
+            self.hits += 1
+        else:
+            self.misses += 1
+            ncol = 0 if basis is None else basis.shape[1]
+            columns = np.zeros([len(x), nfunc - ncol])
+            invertor._get_basis(ncol + 1, nfunc + 1, columns)
+            basis = columns if basis is None else np.hstack([basis, columns])
+            basis.setflags(write=False)
+            self.put(key, basis)
+        return np.ascontiguousarray(basis[:, :nfunc])
+
+
+class RegularizationPath(object):
+    """
+    Solution of the least square problem of Invertor.lstsq for a series
+    of values of the regularization constant alpha.
+
+    The problem matrix is made of a data block D, which does not depend
+    on alpha, and of a regularization block sqrt(alpha)*L. The matrix is
+    built only once and the pair (D, L) is factorized with a generalized
+    SVD ::
+
+        D = U C X^T,  sqrt(alpha_0) L = V S X^T,  C**2 + S**2 = 1
+
+    where alpha_0 balances the size of the two blocks. The coefficients
+    for any alpha are then
+
+        c = X^-T diag(C / (C**2 + alpha/alpha_0 S**2)) U^T b
+
+    and the chi^2 and covariance follow just as cheaply.
+
+    The factorization requires the stacked matrix to have full rank;
+    np.linalg.LinAlgError is raised otherwise, in which case lstsq should
+    be used for each alpha.
+    """
+    def __init__(self, invertor, nfunc=10, nr=20):
+        """
+        :param invertor: Invertor holding the data and D_max
+        :param nfunc: number of base functions to use.
+        :param nr: number of r points to evaluate the 2nd derivative at for the reg. term.
+        """
+        if invertor.is_valid() < 0:
+            msg = "Invertor: invalid data; incompatible data lengths."
+            raise RuntimeError, msg
+
+        self.nfunc = nfunc
+        self.nr = nr
+        self.est_bck = invertor.est_bck
+        self.background = invertor.background
+        self.npts = len(invertor.x)
+        # Number of unknowns, including the background if fitted
+        self.nterms = nfunc + 1 if self.est_bck else nfunc
+
+        # Build the matrix for alpha = 1 and split it into its blocks,
+        # subtracting the background as invert() does
+        a = np.zeros([self.npts + nr, self.nterms])
+        b = np.zeros(self.npts + nr)
+        alpha = invertor.alpha
+        if not self.est_bck:
+            invertor.y -= self.background
+        invertor.alpha = 1.0
+        try:
+            invertor._get_matrix(self.nterms, nr, a, b,
+                                 invertor.get_basis(nfunc))
+        except:
+            raise RuntimeError, "Invertor: could not invert I(Q)\n  %s" % sys.exc_value
+        finally:
+            invertor.alpha = alpha
+            if not self.est_bck:
+                invertor.y += self.background
+        data = a[:self.npts]
+        reg = a[self.npts:]
+        b = b[:self.npts]
+
+        # Sizes of the signal and of the reg term for alpha = 1
+        self.sum_sig = np.sum(data**2)
+        self.sum_reg = np.sum(reg**2)
+        if self.sum_reg > 0:
+            self.alpha_0 = self.sum_sig / self.sum_reg
+        else:
+            self.alpha_0 = 1.0
+
+        if self.npts + nr < self.nterms:
+            raise np.linalg.LinAlgError("RegularizationPath: too few points")
+        q_mat, r_mat = np.linalg.qr(np.vstack([data,
+                                               math.sqrt(self.alpha_0) * reg]))
+        # The solutions for all alphas are only as accurate as the
+        # balanced matrix is well conditioned
+        r_sv = np.linalg.svd(r_mat, compute_uv=False)
+        if r_sv[-1] <= math.sqrt(np.finfo(float).eps) * r_sv[0]:
+            raise np.linalg.LinAlgError("RegularizationPath: ill-conditioned matrix")
+        u_mat, self.c, z_t = np.linalg.svd(q_mat[:self.npts],
+                                           full_matrices=False)
+        self.s = np.sqrt(np.sum(np.dot(q_mat[self.npts:], z_t.T)**2, axis=0))
+        self.g = np.dot(u_mat.T, b)
+        # Part of chi^2 outside of the range of the data block
+        self.chi2_0 = np.sum((b - np.dot(u_mat, self.g))**2)
+        # X^-T = R^-1 Z
+        self.x_inv = linalg.solve_triangular(r_mat, z_t.T)
+
+    def __call__(self, alphas):
+        """
+        Solve the problem for each value of *alphas*.
+
+        :param alphas: sequence of regularization constants
+
+        :return: out, cov, chi2, suggested_alpha, background
+
+        where out[i] and cov[i] are the coefficients and covariance
+        matrix that lstsq returns for alphas[i], and chi2[i],
+        suggested_alpha[i] and background[i] are the values it
+        stores on the Invertor.
+        """
+        alphas = np.atleast_1d(np.asarray(alphas, dtype=float))
+        if np.any(alphas < 0):
+            raise ValueError, "RegularizationPath: alpha must be positive"
+        ratio = alphas / self.alpha_0
+        denom = self.c**2 + ratio[:, np.newaxis] * self.s**2
+        y = self.c * self.g / denom
+        coeffs = np.dot(y, self.x_inv.T)
+
+        if self.npts + self.nr > self.nterms:
+            chi2 = self.chi2_0 + np.sum((self.c * y - self.g)**2, axis=1) \
+                + ratio * np.sum((self.s * y)**2, axis=1)
+        else:
+            # lstsq does not return residuals for a square problem
+            chi2 = -np.ones(len(alphas))
+
+        if self.npts != self.nterms:
+            scale = np.fabs(chi2 / float(self.npts - self.nterms))
+            cov = np.einsum('ik,ak,jk->aij', self.x_inv, 1.0 / denom,
+                            self.x_inv) * scale[:, np.newaxis, np.newaxis]
+        else:
+            cov = np.zeros([len(alphas), self.nterms, self.nterms])
+
+        # The reg term size of lstsq goes through single precision
+        sum_sig = float(np.float32(self.sum_sig))
+        sum_reg = (alphas * self.sum_reg).astype(np.float32).astype(float)
+        suggested_alpha = np.zeros(len(alphas))
+        nonzero = alphas > 0
+        suggested_alpha[nonzero] = sum_sig / (sum_reg[nonzero] / alphas[nonzero])
+
+        if self.est_bck:
+            # Like lstsq, keep the length of the output at nfunc+1
+            out = np.zeros([len(alphas), self.nterms])
+            out[:, :self.nfunc] = coeffs[:, 1:]
+            err = np.zeros([len(alphas), self.nterms, self.nterms])
+            err[:, :self.nfunc, :self.nfunc] = cov[:, 1:, 1:]
+            return out, err, chi2, suggested_alpha, coeffs[:, 0]
+        return (coeffs, cov, chi2, suggested_alpha,
+                self.background * np.ones(len(alphas)))
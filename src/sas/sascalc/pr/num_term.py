@@ -6,16 +6,24 @@ import copy
 import sys
 import logging
 from sas.sascalc.pr.invertor import Invertor
+from sas.sascalc.pr import scan
 
 logger = logging.getLogger(__name__)
 
 class NTermEstimator(object):
     """
     """
-    def __init__(self, invertor):
+    def __init__(self, invertor, workers=None):
         """
+        :param invertor: Invertor holding the data
+        :param workers: number of processes used to scan the number of
+            terms, see :func:`sas.sascalc.pr.scan.get_workers`.  With more
+            than one process, the alpha estimate for each number of terms
+            starts from the alpha of *invertor* rather than from the
+            estimate for the previous number of terms.
         """
         self.invertor = invertor
+        self.workers = workers
         self.nterm_min = 10
         self.nterm_max = len(self.invertor.x)
         if self.nterm_max > 50:
@@ -67,20 +75,26 @@ class NTermEstimator(object):
         self.osc_list = []
         self.err_list = []
         self.alpha_list = []
-        for k in range(self.nterm_min, self.nterm_max, 1):
-            if self.isquit_func is not None:
-                self.isquit_func()
-            best_alpha, message, _ = inver.estimate_alpha(k)
-            inver.alpha = best_alpha
-            inver.out, inver.cov = inver.lstsq(k)
-            osc = inver.oscillations(inver.out)
-            err = inver.get_pos_err(inver.out, inver.cov)
-            if osc > 10.0:
-                break
-            self.osc_list.append(osc)
-            self.err_list.append(err)
-            self.alpha_list.append(inver.alpha)
-            self.mess_list.append(message)
+        points = scan.scan(scan.nterm_point,
+                           [(inver, k) for k in range(self.nterm_min,
+                                                      self.nterm_max, 1)],
+                           self.workers)
+        try:
+            while True:
+                if self.isquit_func is not None:
+                    self.isquit_func()
+                try:
+                    osc, err, alpha, message = next(points)
+                except StopIteration:
+                    break
+                if osc > 10.0:
+                    break
+                self.osc_list.append(osc)
+                self.err_list.append(err)
+                self.alpha_list.append(alpha)
+                self.mess_list.append(message)
+        finally:
+            points.close()
 
         new_osc1 = []
         new_osc2 = []
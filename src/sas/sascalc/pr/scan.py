@@ -0,0 +1,117 @@
+"""
+Parallel evaluation of the P(r) parameter scans.
+
+The D_max exploration, the alpha ladder of Invertor.estimate_alpha and the
+number of terms scan of NTermEstimator each perform a series of independent
+inversions.  The functions of this module send a copy of the invertor to a
+pool of worker processes for each point of the scan.  The results are
+returned in the order of the scan so that the caller can reduce them exactly
+as it would the results of the serial loop.
+"""
+import multiprocessing
+
+
+def get_workers(workers=None):
+    """
+    Return the number of worker processes to use for a scan.
+
+    If *workers* is None, the value is taken from the SAS_PR_WORKERS
+    environment variable, 1 (no pool) by default.  0 means one worker
+    per cpu.
+    """
+    return parallel.get_workers('SAS_PR_WORKERS', 1, workers)
+
+
+def _apply(arguments):
+    return arguments[0](*arguments[1:])
+
+
+def scan(func, args_list, workers=None):
+    """
+    Iterate over func(\*args) for each argument tuple of *args_list*.
+
+    The results are yielded in order.  With more than one worker the
+    calls are made in a process pool, so *func* and its arguments must be
+    picklable and *func* must not rely on changes made to its arguments by
+    the previous calls.  In the serial case the calls are made lazily, one
+    per iteration, so a caller which stops iterating early does not pay
+    for the remaining points.
+
+    Exceptions raised by *func* are raised by the iteration.
+    """
+    args_list = list(args_list)
+    workers = min(get_workers(workers), len(args_list))
+    if workers <= 1:
+        for args in args_list:
+            yield func(*args)
+        return
+
+    pool = multiprocessing.Pool(processes=workers)
+    try:
+        tasks = [(func,) + tuple(args) for args in args_list]
+        for result in pool.imap(_apply, tasks):
+            yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def invert_point(pr, nfunc, d_max=None, alpha=None):
+    """
+    Perform an inversion with the given D_max and alpha.
+
+    :return: out, cov, suggested_alpha, chi2, background
+    """
+    if d_max is not None:
+        pr.d_max = d_max
+    if alpha is not None:
+        pr.alpha = alpha
+    out, cov = pr.invert(nfunc)
+    return out, cov, pr.suggested_alpha, pr.chi2, pr.background
+
+
+def peaks_point(pr, nfunc, alpha):
+    """
+    Perform an inversion with the given alpha for the alpha ladder.
+
+    :return: number of P(r) peaks, suggested alpha
+    """
+    out, _, suggested_alpha, _, _ = invert_point(pr, nfunc, alpha=alpha)
+    return pr.get_peaks(out), suggested_alpha
+
+
+def explore_point(pr, nfunc, d_max):
+    """
+    Perform an inversion with the given D_max for the D_max explorer.
+
+    :return: dictionary of the outputs stored in a distance_explorer.Results,
+        or an error message if the inversion failed
+    """
+    try:
+        out, cov, _, chi2, background = invert_point(pr, nfunc, d_max=d_max)
+        return dict(d_max=pr.d_max,
+                    bck=background,
+                    chi2=chi2,
+                    iq0=pr.iq0(out),
+                    rg=pr.rg(out),
+                    pos=pr.get_positive(out),
+                    pos_err=pr.get_pos_err(out, cov),
+                    osc=pr.oscillations(out))
+    except Exception as exc:
+        return "inversion failed for D_max=%s\n %s" % (str(d_max), exc)
+
+
+def nterm_point(pr, nfunc):
+    """
+    Estimate alpha for *nfunc* terms and invert with it.
+
+    :return: oscillations, positive fraction error, alpha, message
+    """
+    best_alpha, message, _ = pr.estimate_alpha(nfunc, workers=1)
+    pr.alpha = best_alpha
+    pr.out, pr.cov = pr.lstsq(nfunc)
+    osc = pr.oscillations(pr.out)
+    err = pr.get_pos_err(pr.out, pr.cov)
+    return osc, err, pr.alpha, message
+
@@ -44,6 +44,7 @@ from sas.sasgui.guiframe.data_processor import GridFrame
 from sas.sasgui.guiframe.events import EVT_NEW_BATCH
 from sas.sasgui.guiframe.CategoryManager import CategoryManager
 from sas.sascalc.dataloader.loader import Loader
+from sas.sascalc.data_util.calcthread import get_pool
 from sas.sasgui.guiframe.proxy import Connection
 from matplotlib import _pylab_helpers
 
@@ -212,6 +213,8 @@ IS_WIN = True
 IS_LINUX = False
 CLOSE_SHOW = True
 TIME_FACTOR = 2
+# Period in ms of the heartbeat of the GUI thread to the calculation pool
+HEARTBEAT_INTERVAL = 50
 MDI_STYLE = wx.DEFAULT_FRAME_STYLE
 NOT_SO_GRAPH_LIST = ["BoxSum"]
 PARENT_FRAME = wx.MDIParentFrame
@@ -334,6 +337,10 @@ class ViewerFrame(PARENT_FRAME):
         self._idle_count = 0
         self.schedule_full_draw_list = []
         self.idletimer = wx.CallLater(TIME_FACTOR, self._onDrawIdle)
+        # The calculation threads yield to the GUI thread when it is late
+        self.heartbeat_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_heartbeat, self.heartbeat_timer)
+        self.heartbeat_timer.Start(HEARTBEAT_INTERVAL)
 
         self.batch_frame = GridFrame(parent=self)
         self.batch_frame.Hide()
@@ -3262,6 +3269,12 @@ class ViewerFrame(PARENT_FRAME):
         # restart idle
         self.idletimer.Restart(100 * TIME_FACTOR, *args, **kwargs)
 
+    def _on_heartbeat(self, event=None):
+        """
+        Tell the calculation pool that the GUI thread is running
+        """
+        get_pool().heartbeat()
+
 
 class DefaultPanel(wx.Panel, PanelBase):
     """
@@ -15,6 +15,8 @@ from sas.sasgui.guiframe.plugin_base import PluginBase
 from sas.sasgui.guiframe.events import StatusEvent
 from sas.sasgui.guiframe.gui_style import GUIFRAME
 from sas.sasgui.guiframe.gui_manager import DEFAULT_OPEN_FOLDER
+from sas.sasgui.guiframe.local_perspectives.data_loader.load_thread import \
+    load_files, get_load_workers
 try:
     # Try to find a local config
     import imp
@@ -49,6 +51,8 @@ class Plugin(PluginBase):
         # Default location
         self._default_save_location = DEFAULT_OPEN_FOLDER
         self.loader = Loader()
+        # Number of processes reading the files of a folder
+        self.load_workers = get_load_workers()
         self._data_menu = None
 
     def populate_file_menu(self):
@@ -175,6 +179,7 @@ class Plugin(PluginBase):
         output = {}
         exception_occurred = False
 
+        file_list = []
         for p_file in path:
             basename = os.path.basename(p_file)
             # Skip files that start with a period
@@ -195,11 +200,19 @@ class Plugin(PluginBase):
                 logger.info(log_msg)
                 file_errors[basename] = [log_msg]
                 continue
+            file_list.append(p_file)
 
+        # The files are read by a bounded pool of worker processes, but
+        # are turned into GUI data here, in the order of the list
+        loaded = load_files(self.loader, file_list, format=format,
+                            workers=self.load_workers)
+        for p_file, temp, error in loaded:
+            basename = os.path.basename(p_file)
             try:
                 message = "Loading {}...\n".format(p_file)
                 self.load_update(output=output, message=message, info="info")
-                temp = self.loader.load(p_file, format)
+                if error is not None:
+                    raise error
                 if not isinstance(temp, list):
                     temp = [temp]
                 for item in temp:
@@ -4,15 +4,101 @@
 import time
 import sys
 import os
+import collections
+import multiprocessing
 
+from sas.sascalc.data_util import parallel
 from sas.sascalc.data_util.calcthread import CalcThread
 
 
 EXTENSIONS = ['.svs', '.prv', '.inv', '.fitv']
 
+
+def get_load_workers():
+    """
+    Return the number of worker processes to use to load a list of files.
+
+    The value is taken from the SAS_LOAD_WORKERS environment variable;
+    0 means one worker per cpu, and 1 (the default) loads in the thread.
+    """
+    return parallel.get_workers('SAS_LOAD_WORKERS', 1)
+
+
+def _load(loader, path, format=None):
+    """
+    Load a file, in a worker process when loading concurrently
+
+    :return: the loaded data, or None, and the exception raised, or None
+    """
+    try:
+        return loader.load(path, format), None
+    except Exception:
+        return None, sys.exc_value
+
+
+def load_files(loader, paths, format=None, workers=1, max_in_flight=None):
+    """
+    Load a list of files, one after the other if *workers* is 1, or in a
+    pool of *workers* processes otherwise (0 for one process per cpu).
+    In the latter case at most *max_in_flight* files, 4 per worker by
+    default, are being loaded or waiting to be consumed at a time.
+
+    :return: iterator over the path, data and exception of each file, in
+        the order of the list; the exception is None if the file loaded
+    """
+    if workers == 1 or len(paths) < 2:
+        return ((path,) + _load(loader, path, format) for path in paths)
+    return _load_concurrent(loader, paths, format, workers, max_in_flight)
+
+
+def _load_concurrent(loader, paths, format, workers, max_in_flight):
+    """
+    Load the files in a pool of worker processes
+    """
+    if workers <= 0:
+        workers = multiprocessing.cpu_count()
+    if max_in_flight is None:
+        max_in_flight = 4 * workers
+    pool = multiprocessing.Pool(processes=min(workers, len(paths)))
+    try:
+        pending = collections.deque()
+        for path in paths:
+            pending.append(
+                (path, pool.apply_async(_load, (loader, path, format))))
+            while len(pending) >= max_in_flight:
+                yield _get_result(*pending.popleft())
+        while pending:
+            yield _get_result(*pending.popleft())
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _get_result(path, result):
+    """
+    Wait for the result of a file loaded by a worker process
+    """
+    try:
+        return (path,) + result.get()
+    except Exception:
+        # The data could not be sent back by the worker
+        return path, None, sys.exc_value
+
 class DataReader(CalcThread):
     """
     Load a data given a filename
+
+    The files of the list are loaded one after the other, or by a pool
+    of *workers* processes if workers is not 1 (0 for one process per
+    cpu).  In the latter case at most *max_in_flight* files, 4 per worker
+    by default, are being loaded or waiting to be transformed at a time.
+    Either way the files are transformed in the order of the list, and
+    updatefn is called for each file with the progress or error message.
+
+    If given, batchfn is called with output= the data transformed since
+    its last call, once at least *batch_size* of them are available and
+    once all the files are loaded.
     """
     def __init__(self, path, loader,
                  flag=True,
@@ -20,7 +106,11 @@ class DataReader(CalcThread):
                  completefn=None,
                  updatefn=None,
                  yieldtime=0.01,
-                 worktime=0.01):
+                 worktime=0.01,
+                 workers=1,
+                 max_in_flight=None,
+                 batchfn=None,
+                 batch_size=50):
         CalcThread.__init__(self, completefn,
                             updatefn,
                             yieldtime,
@@ -33,6 +123,10 @@ class DataReader(CalcThread):
         self.message = ""
         self.starttime = 0
         self.updatefn = updatefn
+        self.workers = workers
+        self.max_in_flight = max_in_flight
+        self.batchfn = batchfn
+        self.batch_size = batch_size
 
     def isquit(self):
         """
@@ -49,8 +143,14 @@ class DataReader(CalcThread):
         """
         self.starttime = time.time()
         output = []
+        batch = []
         error_message = ""
-        for path in self.list_path:
+        loaded = load_files(self.loader, self.list_path,
+                            workers=self.workers,
+                            max_in_flight=self.max_in_flight)
+        for path, temp, error in loaded:
+            if error is not None:
+                error = str(error)
             basename = os.path.basename(path)
             _, extension = os.path.splitext(basename)
             if self.load_state_flag:
@@ -59,22 +159,29 @@ class DataReader(CalcThread):
             else:
                 if extension.lower() not in EXTENSIONS:
                     pass
-            try:
-                temp = self.loader.load(path)
-                if temp.__class__.__name__ == "list":
+            if error is None:
+                try:
+                    if not isinstance(temp, list):
+                        temp = [temp]
                     for item in temp:
                         data = self.transform_data(item, path)
                         output.append(data)
-                else:
-                    data = self.transform_data(temp, path)
-                    output.append(data)
+                        batch.append(data)
+                except:
+                    error = str(sys.exc_value)
+            if error is None:
                 message = "Loading ..." + str(path) + "\n"
                 if self.updatefn is not None:
                     self.updatefn(output=output, message=message)
-            except:
+            else:
                 error_message = "Error while loading: %s\n" % str(path)
-                error_message += str(sys.exc_value) + "\n"
+                error_message += error + "\n"
                 self.updatefn(output=output, message=error_message)
+            if self.batchfn is not None and len(batch) >= self.batch_size:
+                self.batchfn(output=batch)
+                batch = []
+        if self.batchfn is not None and batch:
+            self.batchfn(output=batch)
 
         message = "Loading Complete!"
         self.complete(output=output, error_message=error_message,
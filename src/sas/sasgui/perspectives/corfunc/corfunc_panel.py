@@ -263,8 +263,6 @@ class CorfuncPanel(ScrolledPanel,PanelBase):
         self._transform_btn.SetLabel("Transform")
         if transform is None:
             msg = "Error calculating Transform."
-            if self.transform_type == 'hilbert':
-                msg = "Not yet implemented"
             wx.PostEvent(self._manager.parent,
                 StatusEvent(status=msg, info="Error"))
             self._extract_btn.Disable()
@@ -274,7 +272,9 @@ class CorfuncPanel(ScrolledPanel,PanelBase):
         plot_x = transform.x[np.where(transform.x <= 200)]
         plot_y = transform.y[np.where(transform.x <= 200)]
         self._manager.show_data(Data1D(plot_x, plot_y), TRANSFORM_LABEL1)
-        # Only enable extract params button if a fourier trans. has been done
+        # Only enable extract params button if a fourier trans. has been done:
+        # the parameters are read from a correlation function, not from a
+        # volume fraction profile
         if self.transform_type == 'fourier':
             self._extract_btn.Enable()
         else:
@@ -333,8 +333,9 @@ class ConverterPanel(ScrolledPanel, PanelBase):
             data = Data1D(x=qdata, y=iqdata[i])
             frame_data[i] = data
         if single_file:
+            # Keep the frames in order, they may be stacked in one data set
+            frame_data = [frame_data[i] for i in frames]
             # Only need to set metadata on first Data1D object
-            frame_data = frame_data.values() # Don't need to know frame numbers
             frame_data[0].filename = output_path.split('\\')[-1]
             for key, value in metadata.iteritems():
                 setattr(frame_data[0], key, value)
@@ -350,7 +351,11 @@ class ConverterPanel(ScrolledPanel, PanelBase):
             self.convert_to_cansas(frame_data, output_path, single_file)
         else: # ext == '.h5'
             w = NXcanSASWriter()
-            w.write(frame_data, output_path)
+            if single_file and len(frame_data) > 1:
+                # Store the frames as one stacked, compressed data set
+                w.write_frames(frame_data, output_path)
+            else:
+                w.write(frame_data, output_path)
 
     def convert_2d_data(self, dataset):
         metadata = self.get_metadata()
@@ -358,7 +363,11 @@ class ConverterPanel(ScrolledPanel, PanelBase):
             setattr(dataset[0], key, value)
 
         w = NXcanSASWriter()
-        w.write(dataset, self.output.GetPath())
+        if len(dataset) > 1:
+            # Store the frames as one stacked, compressed data set
+            w.write_frames(dataset, self.output.GetPath())
+        else:
+            w.write(dataset, self.output.GetPath())
 
     def on_convert(self, event):
         """Called when the Convert button is clicked"""
@@ -1,7 +1,25 @@
 
 import sys
 import time
-from sas.sascalc.data_util.calcthread import CalcThread
+import cPickle
+import logging
+import traceback
+import multiprocessing
+import numpy as np
+from sas.sascalc.data_util import parallel
+from sas.sascalc.data_util.calcthread import PooledCalcThread, BACKGROUND
+from sas.sascalc.fit.AbstractFitEngine import FResult
+
+logger = logging.getLogger(__name__)
+
+def get_batch_workers():
+    """
+    Return the number of worker processes to use for a batch fit.
+
+    The value is taken from the SAS_FIT_WORKERS environment variable;
+    0 means one worker per cpu, and 1 (the default) fits in the thread.
+    """
+    return parallel.get_workers('SAS_FIT_WORKERS', 1)
 
 def map_getattr(classInstance, classFunc, *args):
     """
@@ -13,8 +31,49 @@ def map_getattr(classInstance, classFunc, *args):
 def map_apply(arguments):
     return apply(arguments[0], arguments[1:])
 
-class FitThread(CalcThread):
-    """Thread performing the fit """
+def fit_failure(fitter, msg):
+    """
+    Return the results of a fitter whose fit raised an exception.
+
+    There is one unsuccessful result per fitted problem, with NaN values,
+    so that the batch results can report the failed fit and go on.
+    """
+    results = []
+    for fit_arrange in fitter.fit_arrange_dict.values():
+        if not fit_arrange.get_to_fit():
+            continue
+        data = fit_arrange.get_data()
+        result = FResult(model=fit_arrange.get_model(), data=data,
+                         param_list=fit_arrange.pars)
+        result.fitter_id = fitter.fitter_id
+        result.success = False
+        result.mesg = msg
+        result.fitness = np.NaN
+        result.pvec = np.NaN*np.ones(len(fit_arrange.pars))
+        result.stderr = np.NaN*np.ones(len(fit_arrange.pars))
+        result.index = np.asarray(data.idx, dtype=bool)
+        result.theory = np.NaN*np.ones(np.sum(result.index))
+        results.append(result)
+    return results
+
+def fit_worker(payload, reset_flag=False):
+    """
+    Run a pickled fitter in a worker process and return its results.
+
+    The fit runs without a handler or thread; progress and cancellation
+    are managed by the FitThread waiting on the pool.  The worker is a
+    daemonic process, so the fit uses the serial bumps mapper.  An
+    exception raised by the fit is returned as a failed result.
+    """
+    fitter = cPickle.loads(payload)
+    try:
+        return fitter.fit(None, None, None, None, reset_flag=reset_flag,
+                          serial=True)
+    except Exception:
+        return fit_failure(fitter, traceback.format_exc())
+
+class FitThread(PooledCalcThread):
+    """Thread performing the fit, as background work of the calculation pool"""
 
     def __init__(self,
                  fn,
@@ -27,12 +86,14 @@ class FitThread(CalcThread):
                  updatefn=None,
                  yieldtime=0.03,
                  worktime=0.03,
-                 reset_flag=False):
-        CalcThread.__init__(self,
+                 reset_flag=False,
+                 batch_workers=None):
+        PooledCalcThread.__init__(self,
                  completefn,
                  updatefn,
                  yieldtime,
-                 worktime)
+                 worktime,
+                 priority=BACKGROUND)
         self.handler = handler
         self.fitter = fn
         self.pars = pars
@@ -43,6 +104,10 @@ class FitThread(CalcThread):
         self.updatefn = updatefn
         #Relative error desired in the sum of squares.
         self.reset_flag = reset_flag
+        # Number of processes used for the fits of a batch
+        if batch_workers is None:
+            batch_workers = get_batch_workers()
+        self.batch_workers = batch_workers
 
     def isquit(self):
         """
@@ -50,36 +115,94 @@ class FitThread(CalcThread):
 
         """
         try:
-            CalcThread.isquit(self)
+            PooledCalcThread.isquit(self)
         except KeyboardInterrupt:
             msg = "Fitting: terminated by the user."
             raise KeyboardInterrupt, msg
 
+    def _serial_fit(self):
+        """
+        Run each fitter in turn within this thread
+        """
+        list_handler = []
+        list_curr_thread = []
+        list_reset_flag = []
+        list_map_get_attr = []
+        list_fit_function = []
+        list_q = []
+        for i in range(len(self.fitter)):
+            list_handler.append(self.handler)
+            list_q.append(None)
+            list_curr_thread.append(self)
+            list_reset_flag.append(self.reset_flag)
+            list_fit_function.append('fit')
+            list_map_get_attr.append(map_getattr)
+        inputs = zip(list_map_get_attr, self.fitter, list_fit_function,
+                     list_q, list_q, list_handler, list_curr_thread,
+                     list_reset_flag)
+        return map(map_apply, inputs)
+
+    def _parallel_fit(self):
+        """
+        Send the independent fitters of a batch to a pool of processes.
+
+        Results are returned in the order of the fitters.  Progress is
+        reported to the handler as each fit completes and the pool is
+        terminated if the user stops the fit.  Falls back to the serial
+        fit when a fitter cannot be pickled.
+        """
+        try:
+            payloads = [cPickle.dumps(fitter, cPickle.HIGHEST_PROTOCOL)
+                        for fitter in self.fitter]
+        except Exception:
+            logger.warning("Batch fit: fitters cannot be sent to worker "
+                           "processes; fitting serially.\n%s",
+                           sys.exc_value)
+            return self._serial_fit()
+
+        n_fits = len(payloads)
+        workers = min(self.batch_workers, n_fits)
+        pool = multiprocessing.Pool(processes=workers)
+        try:
+            pending = [pool.apply_async(fit_worker, (payload, self.reset_flag))
+                       for payload in payloads]
+            result = [None] * n_fits
+            done = 0
+            if self.handler is not None:
+                self.handler.progress(done, n_fits)
+            while done < n_fits:
+                self.isquit()
+                for i, async_result in enumerate(pending):
+                    if result[i] is not None or not async_result.ready():
+                        continue
+                    try:
+                        result[i] = async_result.get()
+                    except Exception:
+                        # The fitter or its results could not be sent
+                        result[i] = fit_failure(self.fitter[i],
+                                                traceback.format_exc())
+                    done += 1
+                    if self.handler is not None and result[i]:
+                        self.handler.set_result(result[i][0])
+                        self.handler.progress(done, n_fits)
+                        self.handler.update_fit(last=(done == n_fits))
+                if done < n_fits:
+                    pending[result.index(None)].wait(0.1)
+        finally:
+            pool.terminate()
+            pool.join()
+        return result
+
     def compute(self):
         """
         Perform a fit
         """
         msg = ""
         try:
-            import copy
-            list_handler = []
-            list_curr_thread = []
-            list_reset_flag = []
-            list_map_get_attr = []
-            list_fit_function = []
-            list_q = []
-            for i in range(len(self.fitter)):
-                list_handler.append(self.handler)
-                list_q.append(None)
-                list_curr_thread.append(self)
-                list_reset_flag.append(self.reset_flag)
-                list_fit_function.append('fit')
-                list_map_get_attr.append(map_getattr)
-            #from multiprocessing import Pool
-            inputs = zip(list_map_get_attr, self.fitter, list_fit_function,
-                         list_q, list_q, list_handler, list_curr_thread,
-                         list_reset_flag)
-            result = map(map_apply, inputs)
+            if self.batch_workers > 1 and len(self.fitter) > 1:
+                result = self._parallel_fit()
+            else:
+                result = self._serial_fit()
 
             self.complete(result=result,
                           batch_inputs=self.batch_inputs,
@@ -100,7 +223,6 @@ class FitThread(CalcThread):
             if self.handler is not None:
                 self.handler.stop(msg=msg)
         except:
-            import traceback
             if self.handler is not None:
                 self.handler.error(msg=traceback.format_exc())
 
@@ -5,10 +5,10 @@
 import time
 import numpy as np
 import math
-from sas.sascalc.data_util.calcthread import CalcThread
+from sas.sascalc.data_util.calcthread import PooledCalcThread, INTERACTIVE
 from sas.sascalc.fit.MultiplicationModel import MultiplicationModel
 
-class Calc2D(CalcThread):
+class Calc2D(PooledCalcThread):
     """
     Compute 2D model
     This calculation assumes a 2-fold symmetry of the model
@@ -28,8 +28,9 @@ class Calc2D(CalcThread):
                  worktime=0.04,
                  exception_handler=None,
                  ):
-        CalcThread.__init__(self, completefn, updatefn, yieldtime, worktime,
-                            exception_handler=exception_handler)
+        PooledCalcThread.__init__(self, completefn, updatefn, yieldtime,
+                                  worktime, exception_handler=exception_handler,
+                                  priority=INTERACTIVE)
         self.qmin = qmin
         self.qmax = qmax
         self.weight = weight
@@ -116,7 +117,7 @@ class Calc2D(CalcThread):
                        source=self.source)
 
 
-class Calc1D(CalcThread):
+class Calc1D(PooledCalcThread):
     """
     Compute 1D data
     """
@@ -140,8 +141,9 @@ class Calc1D(CalcThread):
                  ):
         """
         """
-        CalcThread.__init__(self, completefn, updatefn, yieldtime, worktime,
-                            exception_handler=exception_handler)
+        PooledCalcThread.__init__(self, completefn, updatefn, yieldtime,
+                                  worktime, exception_handler=exception_handler,
+                                  priority=INTERACTIVE)
         self.fid = fid
         self.data = data
         self.qmin = qmin
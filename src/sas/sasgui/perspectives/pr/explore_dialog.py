@@ -20,7 +20,6 @@ their distribution as a function of D_max.
 import wx
 import numpy as np
 import logging
-import sys
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +33,7 @@ from sas.sasgui.plottools import Data1D as Model1D
 from sas.sasgui.guiframe.gui_style import GUIFRAME_ID
 from sas.sasgui.plottools.plottables import Graph
 
+from sas.sascalc.pr import scan
 from pr_widgets import PrTextCtrl
 
 # Default number of points on the output plot
@@ -392,34 +392,18 @@ class ExploreDialog(wx.Dialog):
         results = Results()
 
         # Loop over d_max values
-        for i in range(content.npts):
-            temp = (content.dmax - content.dmin) / (content.npts - 1.0)
-            d = content.dmin + i * temp
-
-            self.pr_state.d_max = d
-            try:
-                out, cov = self.pr_state.invert(self.nfunc)
-
-                # Store results
-                iq0 = self.pr_state.iq0(out)
-                rg = self.pr_state.rg(out)
-                pos = self.pr_state.get_positive(out)
-                pos_err = self.pr_state.get_pos_err(out, cov)
-                osc = self.pr_state.oscillations(out)
-
-                results.d_max.append(self.pr_state.d_max)
-                results.bck.append(self.pr_state.background)
-                results.chi2.append(self.pr_state.chi2)
-                results.iq0.append(iq0)
-                results.rg.append(rg)
-                results.pos.append(pos)
-                results.pos_err.append(pos_err)
-                results.osc.append(osc)
-            except:
+        temp = (content.dmax - content.dmin) / (content.npts - 1.0)
+        d_values = [content.dmin + i * temp for i in range(content.npts)]
+        points = scan.scan(scan.explore_point,
+                           [(self.pr_state, self.nfunc, d) for d in d_values])
+        for output in points:
+            if isinstance(output, basestring):
                 # This inversion failed, skip this D_max value
-                msg = "ExploreDialog: inversion failed "
-                msg += "for D_max=%s\n%s" % (str(d), sys.exc_value)
-                logger.error(msg)
+                logger.error("ExploreDialog: " + output)
+                continue
+            # Store results
+            for name, value in output.items():
+                getattr(results, name).append(value)
 
         self.results = results
 
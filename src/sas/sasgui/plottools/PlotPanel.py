@@ -33,6 +33,7 @@ import copy
 import numpy as np
 
 from sas.sasgui.guiframe.events import StatusEvent
+from sas.sascalc.data_util.cache import array_digest
 from .toolbar import NavigationToolBar, PlotPrintout, bind
 
 logger = logging.getLogger(__name__)
@@ -236,6 +237,8 @@ class PlotPanel(wx.Panel):
         #number of bins
         self.x_bins = None
         self.y_bins = None
+        # last image built from 1d data arrays, with its bins
+        self._matrix_cache = None
 
         ## default color map
         self.cmap = DEFAULT_CMAP
@@ -1547,6 +1550,13 @@ class PlotPanel(wx.Panel):
             # do we need deepcopy here?
             return copy.deepcopy(self.data)
 
+        # Only the scale or the color map changed: reuse the last image
+        key = (array_digest(self.data), array_digest(self.qx_data),
+               array_digest(self.qy_data))
+        if self._matrix_cache is not None and self._matrix_cache[0] == key:
+            _, image, self.x_bins, self.y_bins = self._matrix_cache
+            return image.copy()
+
         # maximum # of loops to fillup_pixels
         # otherwise, loop could never stop depending on data
         max_loop = 1
@@ -1590,6 +1600,8 @@ class PlotPanel(wx.Panel):
             image = self._fillup_pixels(image=image, weights=weights)
             loop += 1
 
+        # the image is modified by the log scale: cache a copy
+        self._matrix_cache = (key, image.copy(), self.x_bins, self.y_bins)
         return image
 
     def _get_bins(self):
@@ -1649,8 +1661,6 @@ class PlotPanel(wx.Panel):
 
         :return: image (2d array )
 
-        :TODO: Find better way to do for-loop below
-
         """
         # No image matrix given
         if image is None or np.ndim(image) != 2 \
@@ -1660,50 +1670,25 @@ class PlotPanel(wx.Panel):
         # Get bin size in y and x directions
         len_y = len(image)
         len_x = len(image[1])
+        # Surround the image by a frame of empty pixels so that the
+        # neighbors of all the pixels are shifted views of the same array
+        finite = np.isfinite(image)
+        values = np.zeros([len_y + 2, len_x + 2])
+        values[1:-1, 1:-1][finite] = image[finite]
+        counts = np.zeros([len_y + 2, len_x + 2])
+        counts[1:-1, 1:-1] = finite
         temp_image = np.zeros([len_y, len_x])
         weit = np.zeros([len_y, len_x])
-        # do for-loop for all pixels
-        for n_y in range(len(image)):
-            for n_x in range(len(image[1])):
-                # find only null pixels
-                if weights[n_y][n_x] > 0 or np.isfinite(image[n_y][n_x]):
-                    continue
-                else:
-                    # find 4 nearest neighbors
-                    # check where or not it is at the corner
-                    if n_y != 0 and np.isfinite(image[n_y - 1][n_x]):
-                        temp_image[n_y][n_x] += image[n_y - 1][n_x]
-                        weit[n_y][n_x] += 1
-                    if n_x != 0 and np.isfinite(image[n_y][n_x - 1]):
-                        temp_image[n_y][n_x] += image[n_y][n_x - 1]
-                        weit[n_y][n_x] += 1
-                    if n_y != len_y - 1 and np.isfinite(image[n_y + 1][n_x]):
-                        temp_image[n_y][n_x] += image[n_y + 1][n_x]
-                        weit[n_y][n_x] += 1
-                    if n_x != len_x - 1 and np.isfinite(image[n_y][n_x + 1]):
-                        temp_image[n_y][n_x] += image[n_y][n_x + 1]
-                        weit[n_y][n_x] += 1
-                    # go 4 next nearest neighbors when no non-zero
-                    # neighbor exists
-                    if n_y != 0 and n_x != 0 and \
-                            np.isfinite(image[n_y - 1][n_x - 1]):
-                        temp_image[n_y][n_x] += image[n_y - 1][n_x - 1]
-                        weit[n_y][n_x] += 1
-                    if n_y != len_y - 1 and n_x != 0 and \
-                            np.isfinite(image[n_y + 1][n_x - 1]):
-                        temp_image[n_y][n_x] += image[n_y + 1][n_x - 1]
-                        weit[n_y][n_x] += 1
-                    if n_y != len_y and n_x != len_x - 1 and \
-                            np.isfinite(image[n_y - 1][n_x + 1]):
-                        temp_image[n_y][n_x] += image[n_y - 1][n_x + 1]
-                        weit[n_y][n_x] += 1
-                    if n_y != len_y - 1 and n_x != len_x - 1 and \
-                            np.isfinite(image[n_y + 1][n_x + 1]):
-                        temp_image[n_y][n_x] += image[n_y + 1][n_x + 1]
-                        weit[n_y][n_x] += 1
-
-        # get it normalized
-        ind = (weit > 0)
+        # 4 nearest neighbors, then the 4 next nearest neighbors
+        for d_y, d_x in ((-1, 0), (0, -1), (1, 0), (0, 1),
+                         (-1, -1), (1, -1), (-1, 1), (1, 1)):
+            shifted = (slice(1 + d_y, len_y + 1 + d_y),
+                       slice(1 + d_x, len_x + 1 + d_x))
+            temp_image += values[shifted]
+            weit += counts[shifted]
+
+        # get it normalized, for the null pixels only
+        ind = (weit > 0) & (weights <= 0) & ~finite
         image[ind] = temp_image[ind] / weit[ind]
 
         return image
@@ -6,6 +6,7 @@ import unittest
 import time
 import numpy as np
 from sas.sascalc.corfunc.corfunc_calculator import CorfuncCalculator
+from sas.sascalc.corfunc.transform_thread import hilbert_transform
 from sas.sascalc.dataloader.data_info import Data1D
 
 
@@ -79,6 +80,91 @@ class TestCalculator(unittest.TestCase):
                 self.fail("{} failed ({}: {})".format(test, type(e), e))
 
 
+class TestExtrapolationGrid(unittest.TestCase):
+
+    def setUp(self):
+        self.data = load_data()
+        self.calculator = CorfuncCalculator(data=self.data, lowerq=0.013,
+            upperq=(0.15, 0.24))
+        self.transformation = None
+
+    def transform_callback(self, transform):
+        self.transformation = transform
+
+    def test_bounded_grid(self):
+        params, extrapolation = self.calculator.compute_extrapolation(
+            npts=2000, resolution=0.2)
+        # Rounded up to a fast transform length, with q_max ~ pi/resolution
+        self.assertEqual(len(extrapolation.x), 2000)
+        self.assertAlmostEqual(extrapolation.x[1], np.pi/0.2/2000)
+
+        # The tail is the fitted Porod function
+        tail = extrapolation.x > self.data.x[-1]
+        expected = self.calculator._porod(extrapolation.x[tail], params['K'],
+            params['sigma'], self.calculator.background)
+        np.testing.assert_allclose(extrapolation.y[tail], expected)
+
+        _, extrapolation = self.calculator.compute_extrapolation(npts=1001)
+        self.assertEqual(len(extrapolation.x), 1024)
+
+        # Data spacing up to q = pi/0.5
+        _, extrapolation = self.calculator.compute_extrapolation(
+            resolution=0.5)
+        self.assertEqual(len(extrapolation.x), 3200)
+
+        self.calculator.compute_transform(extrapolation, 'fourier',
+            completefn=self.transform_callback)
+        while True:
+            time.sleep(0.001)
+            if not self.calculator.transform_isrunning():
+                break
+        # The real space axis follows the spacing of the extrapolation
+        self.assertAlmostEqual(self.transformation.x[1],
+            np.pi/extrapolation.x[-1], 3)
+        params = self.calculator.extract_parameters(self.transformation)
+        self.assertLess(abs(params['max']-75), 2.5)
+
+
+class TestHilbertTransform(unittest.TestCase):
+
+    def setUp(self):
+        self.transformation = None
+
+    def transform_callback(self, transform):
+        self.transformation = transform
+
+    def test_hilbert_transform(self):
+        # 1/(1+q^2) and q/(1+q^2) are a Hilbert transform pair
+        q = 0.01*np.arange(20000)
+        h = hilbert_transform(1/(1+q**2))
+        np.testing.assert_allclose(h[:5000], (q/(1+q**2))[:5000], atol=2e-3)
+
+    def test_profile(self):
+        # Exponential volume fraction profile exp(-z/delta), for which
+        # I(q)q^2 = delta^2/(1+q^2 delta^2)
+        delta = 20.0
+        q = 0.002*np.arange(20000)
+        iq = np.zeros(len(q))
+        iq[1:] = delta**2/(1+(q[1:]*delta)**2)/q[1:]**2
+        data = Data1D(x=q, y=iq)
+        calculator = CorfuncCalculator(data=data)
+        calculator.compute_transform(data, 'hilbert', background=0,
+            completefn=self.transform_callback)
+        while True:
+            time.sleep(0.001)
+            if not calculator.transform_isrunning():
+                break
+        self.assertIsNotNone(self.transformation)
+        z = self.transformation.x
+        self.assertAlmostEqual(z[1], np.pi/q[-1], 3)
+        mask = np.logical_and(z > 2, z < 100)
+        np.testing.assert_allclose(self.transformation.y[mask],
+            np.exp(-z[mask]/delta), atol=0.02)
+        # The profile can be used like a correlation function
+        self.assertIsNotNone(calculator.extract_parameters(
+            self.transformation))
+
+
 def load_data(filename="98929.txt"):
     data = np.loadtxt(filename, dtype=np.float32)
     q = data[:,0]
@@ -1,6 +1,11 @@
 from sas.sascalc.file_converter.nxcansas_writer import NXcanSASWriter
 from sas.sascalc.dataloader.loader import Loader
+from sas.sascalc.dataloader.readers.cansas_reader_HDF5 import Reader
+from sas.sascalc.dataloader.data_info import Data2D
 
+import copy
+import h5py
+import numpy as np
 import os
 import pylint
 import unittest
@@ -17,6 +22,7 @@ class nxcansas_writer(unittest.TestCase):
         self.write_file_1d = "export1d.h5"
         self.read_file_2d = "exp18_14_igor_2dqxqy.dat"
         self.write_file_2d = "export2d.h5"
+        self.write_file_frames = "export_frames.h5"
 
         self.data_1d = self.loader.load(self.read_file_1d)[0]
 
@@ -44,6 +50,69 @@ class nxcansas_writer(unittest.TestCase):
         self.assertTrue(len(data.qy_data) == len(self.data_2d.qy_data))
         self._check_metadata(data, self.data_2d)
 
+    def _make_frames(self, data, n_frames):
+        for i in range(n_frames):
+            frame = copy.deepcopy(data)
+            if isinstance(frame, Data2D):
+                frame.data = data.data * (i + 1)
+            else:
+                frame.y = data.y * (i + 1)
+            yield frame
+
+    def test_write_frames_1d(self):
+        n_frames = self.writer.write_frames(
+            self._make_frames(self.data_1d, 5), self.write_file_frames)
+        self.assertEqual(n_frames, 5)
+        with h5py.File(self.write_file_frames, 'r') as f:
+            I = f['sasentry01/sasdata01/I']
+            self.assertEqual(I.shape, (5, len(self.data_1d.y)))
+            self.assertEqual(I.compression, 'gzip')
+            self.assertEqual(f['sasentry01/sasdata01/Q'].shape,
+                             (len(self.data_1d.x),))
+
+        data = self.loader.load(self.write_file_frames)
+        self.assertEqual(len(data), 5)
+        for i, frame in enumerate(data):
+            self.assertTrue(np.allclose(frame.y, self.data_1d.y * (i + 1)))
+            self.assertTrue(np.allclose(frame.x, self.data_1d.x))
+        self._check_metadata(data[0], self.data_1d)
+
+        frames = list(Reader().iter_frames(self.write_file_frames, [3, 1]))
+        self.assertEqual(len(frames), 2)
+        self.assertTrue(np.allclose(frames[0].y, self.data_1d.y * 4))
+        self.assertTrue(np.allclose(frames[1].y, self.data_1d.y * 2))
+        self.assertTrue(np.allclose(frames[1].dy, self.data_1d.dy))
+        self.assertTrue(np.allclose(frames[1].x, self.data_1d.x))
+        self._check_metadata(frames[1], self.data_1d)
+
+    def test_write_frames_2d(self):
+        self.writer.write_frames(self._make_frames(self.data_2d, 3),
+            self.write_file_frames, compression='lzf')
+        frames = list(Reader().iter_frames(self.write_file_frames))
+        self.assertEqual(len(frames), 3)
+        for i, frame in enumerate(frames):
+            self.assertTrue(np.allclose(frame.data, self.data_2d.data * (i + 1)))
+            self.assertTrue(len(frame.qx_data) == len(self.data_2d.qx_data))
+            # The Q axes are only read once, and shared by the frames
+            self.assertTrue(frame.qx_data is frames[0].qx_data)
+
+    def test_write_frames_float32(self):
+        # Big endian float32 frames, as memory mapped from BSL files
+        self.data_2d.data = self.data_2d.data.astype('>f4')
+        self.data_2d.err_data = self.data_2d.err_data.astype('>f4')
+        self.writer.write_frames(self._make_frames(self.data_2d, 2),
+            self.write_file_frames)
+        with h5py.File(self.write_file_frames, 'r') as f:
+            for key in ['I', 'Idev']:
+                entry = f['sasentry01/sasdata01/' + key]
+                self.assertEqual(entry.dtype, np.dtype(np.float32))
+        frames = list(Reader().iter_frames(self.write_file_frames))
+        self.assertTrue(np.allclose(frames[1].data, self.data_2d.data * 2))
+
+    def test_write_no_frames(self):
+        self.assertRaises(ValueError, self.writer.write_frames, [],
+                          self.write_file_frames)
+
     def _check_metadata(self, written, correct):
         self.assertTrue(written.title == correct.title)
         self.assertTrue(written.sample.name == correct.sample.name)
@@ -63,3 +132,5 @@ class nxcansas_writer(unittest.TestCase):
             os.remove(self.write_file_1d)
         if os.path.isfile(self.write_file_2d):
             os.remove(self.write_file_2d)
+        if os.path.isfile(self.write_file_frames):
+            os.remove(self.write_file_frames)
@@ -0,0 +1,77 @@
+"""
+    Unit tests for the memory mapped OTOKO loader
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from sas.sascalc.file_converter.otoko_loader import OTOKOLoader, \
+    OTOKOParsingError
+from sas.sascalc.file_converter.binary_frames import FrameStack, \
+    frame_dtype, memmap_frames
+
+
+class otoko_loader(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.q = np.linspace(0.01, 0.2, 7).astype(np.float32)
+        self.iq = np.arange(5 * 7, dtype=np.float32).reshape(5, 7)
+        self.q_header = self._write_axis("Q", [self.q[np.newaxis]], [False])
+        # Spread the intensity frames over two files, one of them swapped
+        self.iq_header = self._write_axis("I", [self.iq[:2], self.iq[2:]],
+                                          [False, True])
+
+    def _write_axis(self, name, blocks, swapped):
+        header_path = os.path.join(self.folder, name + "00000.OTO")
+        lines = ["header line 1\n", "header line 2\n"]
+        for i, (block, swap) in enumerate(zip(blocks, swapped)):
+            filename = "{}0000{}.OTO".format(name, i + 1)
+            block.astype(frame_dtype(swap)).tofile(
+                os.path.join(self.folder, filename))
+            last = 0 if i == len(blocks) - 1 else 1
+            lines.append("{} {} 1 {} 0 0 0 0 0 {}\n".format(
+                block.shape[1], block.shape[0], 0 if swap else 1, last))
+            lines.append(filename + "\n")
+        with open(header_path, "w") as header_file:
+            header_file.writelines(lines)
+        return header_path
+
+    def test_load(self):
+        data = OTOKOLoader(self.q_header, self.iq_header).load_otoko_data()
+        qdata = data.q_axis.data
+        iqdata = data.data_axis.data
+        self.assertEqual(len(qdata), 1)
+        self.assertTrue(np.all(qdata[0] == self.q))
+        self.assertEqual(iqdata.shape, (5, 7))
+        for i in range(5):
+            self.assertTrue(np.all(iqdata[i] == self.iq[i]))
+        self.assertTrue(np.all(iqdata[-1] == self.iq[-1]))
+        self.assertTrue(np.all(np.asarray(iqdata) == self.iq))
+        self.assertTrue(np.all(np.array(list(iqdata)) == self.iq))
+
+    def test_truncated_file(self):
+        with open(os.path.join(self.folder, "I00002.OTO"), "r+b") as f:
+            f.truncate(10)
+        loader = OTOKOLoader(self.q_header, self.iq_header)
+        self.assertRaises(OTOKOParsingError, loader.load_otoko_data)
+
+    def test_frame_stack(self):
+        path = os.path.join(self.folder, "frames.bin")
+        self.iq.reshape(5, 1, 7).astype(frame_dtype(True)).tofile(path)
+        frames = memmap_frames(path, 4, (1, 7), True, offset=1)
+        self.assertTrue(isinstance(frames, np.memmap))
+        stack = FrameStack([frames[:0], frames])
+        self.assertEqual(stack.shape, (4, 1, 7))
+        self.assertTrue(np.all(stack[0] == self.iq[1]))
+        self.assertRaises(IndexError, stack.__getitem__, 4)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
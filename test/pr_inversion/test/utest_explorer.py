@@ -6,6 +6,7 @@ import unittest, math, numpy
 from utest_invertor import load
 from sas.sascalc.pr.invertor import Invertor
 from sas.sascalc.pr.distance_explorer import DistExplorer
+from sas.sascalc.pr.num_term import NTermEstimator
         
 class TestExplorer(unittest.TestCase):
             
@@ -29,6 +30,44 @@ class TestExplorer(unittest.TestCase):
         results = self.explo(120, 200, 25)
         self.assertEqual(len(results.errors), 0)
         self.assertEqual(len(results.chi2), 25)
-        
+
+    def test_parallel_exploration(self):
+        """
+            The pool gives the same results, in the same order
+        """
+        expected = self.explo(120, 200, 9, workers=1)
+        results = self.explo(120, 200, 9, workers=3)
+        self.assertEqual(len(results.errors), 0)
+        for name in ['d_max', 'chi2', 'osc', 'pos', 'pos_err', 'rg', 'iq0',
+                     'bck']:
+            numpy.testing.assert_allclose(getattr(results, name),
+                                          getattr(expected, name))
+
+
+class TestParallelScans(unittest.TestCase):
+
+    def setUp(self):
+        self.invertor = Invertor()
+        x, y, err = load('sphere_80.txt')
+        self.invertor.d_max = 160.0
+        self.invertor.alpha = .0007
+        self.invertor.x   = x
+        self.invertor.y   = y
+        self.invertor.err = err
+
+    def test_estimate_alpha(self):
+        expected = self.invertor.estimate_alpha(10, workers=1)
+        alpha, message, _ = self.invertor.estimate_alpha(10, workers=3)
+        self.assertAlmostEqual(alpha, expected[0])
+        self.assertEqual(message, expected[1])
+
+    def test_num_terms(self):
+        estimator = NTermEstimator(self.invertor.clone(), workers=3)
+        estimator.nterm_max = 16
+        nterms, alpha, message = estimator.num_terms()
+        self.assertTrue(10 <= nterms < 16)
+        self.assertEqual(len(estimator.osc_list), len(estimator.alpha_list))
+        self.assertTrue(alpha > 0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,6 +13,7 @@ import unittest
 import math
 import numpy
 from sas.sascalc.pr.invertor import Invertor
+from sas.sascalc.pr.batch import invert_batch
 
 
 class TestFiguresOfMerit(unittest.TestCase):
@@ -564,6 +565,168 @@ class TestErrorConditions(unittest.TestCase):
         out, cov = self.invertor.lstsq(10)
     
 
+
+class TestBasisCache(unittest.TestCase):
+
+    def setUp(self):
+        self.invertor = Invertor()
+        x, y, err = load("sphere_80.txt")
+        self.invertor.d_max = 160.0
+        self.invertor.alpha = .0007
+        self.invertor.x   = x
+        self.invertor.y   = y
+        self.invertor.err = err
+        self.invertor.slit_height = 0.01
+
+    def test_columns(self):
+        """
+            The cached columns are the base functions used by lstsq
+        """
+        smeared = self.invertor.get_basis(5)
+        x = self.invertor.x
+        self.assertEqual(smeared.shape, (len(x), 5))
+        self.invertor.slit_height = 0
+        basis = self.invertor.get_basis(5)
+        for i in [0, 10, len(x)-1]:
+            self.assertAlmostEqual(basis[i, 2]/self.invertor.basefunc_ft(160.0, 3, x[i]), 1.0, 5)
+        self.assertNotEqual(smeared[0, 2], basis[0, 2])
+
+    def test_reuse(self):
+        """
+            Growing nfunc only adds columns; changing D_max recomputes
+        """
+        cache = self.invertor.basis_cache
+        out, cov = self.invertor.lstsq(10)
+        self.invertor.lstsq(8)
+        self.invertor.alpha = .005
+        self.invertor.lstsq(10)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.invertor.lstsq(12)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        self.assertEqual(len(cache), 1)
+        self.invertor.d_max = 150.0
+        self.invertor.lstsq(12)
+        self.assertEqual(len(cache), 2)
+
+        # The clones share the cache
+        clone = self.invertor.clone()
+        clone.d_max = 160.0
+        clone.alpha = .0007
+        out_clone, cov_clone = clone.lstsq(10)
+        self.assertEqual(cache.hits, 3)
+
+        # Without the cache the result is the same
+        cache.clear()
+        cache.max_size = 0
+        out_ref, cov_ref = clone.lstsq(10)
+        self.assertEqual(len(cache), 0)
+        numpy.testing.assert_array_equal(out, out_ref)
+        numpy.testing.assert_array_equal(out_clone, out_ref)
+        numpy.testing.assert_array_equal(cov_clone, cov_ref)
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.x, y, self.err = load("sphere_80.txt")
+        rand = numpy.random.RandomState(0)
+        self.y = y * rand.uniform(0.5, 2.0, size=(6, 1)) \
+            * (1.0 + 0.02 * rand.randn(6, len(y)))
+        self.errs = self.err * rand.uniform(0.8, 1.2, size=self.y.shape)
+
+    def compare(self, err, **kwargs):
+        """
+            Check the batch against one inversion per curve
+        """
+        results = invert_batch(self.x, self.y, err, 160.0, nfunc=12,
+                               alpha=.0007, **kwargs)
+        for i in range(len(self.y)):
+            invertor = Invertor()
+            invertor.x = self.x
+            invertor.y = self.y[i]
+            invertor.err = err if err.ndim == 1 else err[i]
+            invertor.d_max = 160.0
+            invertor.alpha = .0007
+            for name, value in kwargs.items():
+                setattr(invertor, name, value)
+            out, cov = invertor.invert(12)
+            out, cov = out[:12], cov[:12, :12]
+            numpy.testing.assert_allclose(results.out[i], out, rtol=1e-10, atol=1e-10*max(abs(out)))
+            numpy.testing.assert_allclose(results.cov[i], cov, rtol=1e-8, atol=1e-8*abs(cov).max())
+            self.assertAlmostEqual(results.chi2[i]/invertor.chi2, 1.0, 10)
+            self.assertAlmostEqual(results.background[i], invertor.background, 6)
+            self.assertAlmostEqual(results.rg[i], invertor.rg(out), 8)
+            self.assertAlmostEqual(results.iq0[i], invertor.iq0(out), 4)
+            self.assertAlmostEqual(results.osc[i], invertor.oscillations(out), 8)
+            self.assertEqual(results.peaks[i], invertor.get_peaks(out))
+
+    def test_shared_errors(self):
+        self.compare(self.err)
+        self.compare(self.err, q_min=0.02, q_max=0.3, background=0.2)
+
+    def test_errors(self):
+        self.compare(self.errs)
+        self.compare(self.errs, est_bck=True, slit_height=0.01)
+
+    def test_invalid(self):
+        self.assertRaises(RuntimeError, invert_batch, self.x, self.y,
+                          self.err[:-1], 160.0)
+        self.errs[2, 5] = 0.0
+        self.assertRaises(RuntimeError, invert_batch, self.x, self.y,
+                          self.errs, 160.0)
+
+
+class TestRegularizationPath(unittest.TestCase):
+
+    def setUp(self):
+        self.invertor = Invertor()
+        x, y, err = load("sphere_80.txt")
+        self.invertor.d_max = 160.0
+        self.invertor.alpha = .0007
+        self.invertor.x   = x
+        self.invertor.y   = y
+        self.invertor.err = err
+        self.alphas = [1e-9, 7e-8, .0007, .005]
+
+    def compare(self, nfunc=10):
+        """
+            Check the path against one lstsq inversion per alpha
+        """
+        path = self.invertor.regularization_path(nfunc)
+        out, cov, chi2, suggested_alpha, background = path(self.alphas)
+        for i, alpha in enumerate(self.alphas):
+            self.invertor.alpha = alpha
+            out_i, cov_i = self.invertor.invert(nfunc)
+            numpy.testing.assert_allclose(out[i], out_i, rtol=1e-8, atol=1e-8*max(abs(out_i)))
+            numpy.testing.assert_allclose(cov[i], cov_i, rtol=1e-6, atol=1e-6*abs(cov_i).max())
+            self.assertAlmostEqual(chi2[i]/self.invertor.chi2, 1.0, 8)
+            self.assertAlmostEqual(suggested_alpha[i]/self.invertor.suggested_alpha, 1.0, 6)
+            self.assertAlmostEqual(background[i], self.invertor.background, 6)
+
+    def test_path(self):
+        self.compare()
+        self.compare(15)
+
+    def test_path_bck(self):
+        self.invertor.est_bck = True
+        self.compare()
+
+    def test_path_range(self):
+        self.invertor.q_min = 0.02
+        self.invertor.q_max = 0.3
+        self.invertor.slit_height = 0.01
+        self.compare()
+
+    def test_ill_conditioned(self):
+        """
+            Too many terms for the reg term: estimate_alpha falls back on lstsq
+        """
+        self.assertRaises(numpy.linalg.LinAlgError,
+                          self.invertor.regularization_path, 40)
+        alpha, message, _ = self.invertor.estimate_alpha(40)
+        self.assertFalse(str(message).startswith("Invertor"))
+        self.assertTrue(alpha > 0)
+
         
 def pr_theory(r, R):
     """
@@ -0,0 +1,74 @@
+"""
+Timing of the sas_gen file readers on large synthetic files.
+
+Usage: python benchmark_sas_gen.py [n_atoms]
+
+Writes a PDB file with n_atoms atoms (default 1000000) and an SLD file of
+the same size to a temporary directory and reports the time to read them.
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+import numpy as np
+
+from sas.sascalc.calculator import sas_gen
+
+ELEMENTS = [" C  ", " N  ", " O  ", " H  ", " S  ", "FE  "]
+
+
+def write_pdb(path, n_atoms, seed=0):
+    """
+    Write a PDB file of n_atoms ATOM records with random positions
+    """
+    rng = np.random.RandomState(seed)
+    pos = rng.uniform(-500, 500, size=(n_atoms, 3))
+    names = rng.randint(len(ELEMENTS), size=n_atoms)
+    with open(path, 'w') as out:
+        out.write("HEADER    SYNTHETIC\n")
+        for i in range(n_atoms):
+            out.write("ATOM  %5d %s ALA A   1    %8.3f%8.3f%8.3f\n"
+                      % (i % 100000, ELEMENTS[names[i]],
+                         pos[i, 0], pos[i, 1], pos[i, 2]))
+        out.write("END\n")
+
+
+def write_sld(path, n_pixels, seed=0):
+    """
+    Write an SLD file of n_pixels pixels with random values
+    """
+    rng = np.random.RandomState(seed)
+    values = rng.uniform(-1, 1, size=(n_pixels, 8))
+    np.savetxt(path, values, fmt="%g",
+               header="X  Y  Z  SLDN SLDMx  SLDMy  SLDMz VOLUMEpix",
+               comments="")
+
+
+def time_read(reader, path):
+    start = time.time()
+    output = reader.read(path)
+    return time.time() - start, output
+
+
+def main(n_atoms=1000000):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        pdb_path = os.path.join(tmpdir, "synthetic.pdb")
+        sld_path = os.path.join(tmpdir, "synthetic.sld")
+        write_pdb(pdb_path, n_atoms)
+        write_sld(sld_path, n_atoms)
+
+        elapsed, output = time_read(sas_gen.PDBReader(), pdb_path)
+        print("PDBReader: %d atoms in %.2f s" % (len(output.pos_x), elapsed))
+        elapsed, output = time_read(sas_gen.SLDReader(), sld_path)
+        print("SLDReader: %d pixels in %.2f s" % (len(output.pos_x), elapsed))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -4,9 +4,26 @@ Unit tests for the sas_gen
 import warnings
 warnings.simplefilter("ignore")
 
+import os
+import shutil
+import tempfile
 import unittest
+import numpy as np
 from sas.sascalc.calculator import sas_gen
 
+PDB_LINES = """\
+HEADER    TEST
+ATOM      1  C   ALA A   1       0.000   0.000   0.000
+ATOM      2  N   ALA A   1       1.000   0.000   0.000
+HETATM    3 FE   HEM A   2       0.000   2.000   0.000
+ATOM      4  C   ALA A   1       0.000   0.000   3.000
+ATOM      5  Xx  UNK A   3       4.000   4.000   4.000
+CONECT    1    2    4
+CONECT    2    1
+CONECT    4    1
+END
+"""
+
 
 class sas_gen_test(unittest.TestCase):
     
@@ -47,6 +64,156 @@ class sas_gen_test(unittest.TestCase):
         self.assertEqual(output.pos_y[0], 0.0)
         self.assertEqual(output.pos_z[0], 0.0)
 
+    def test_pdbreader_elements(self):
+        """
+        Test atoms, symbols and bonds of a pdb file with several elements
+        """
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, "atoms.pdb")
+            with open(path, 'w') as out:
+                out.write(PDB_LINES)
+            f = self.pdbloader.read(path)
+        finally:
+            shutil.rmtree(tmpdir)
+        np.testing.assert_array_equal(f.pos_x, [0, 1, 0, 0, 4])
+        np.testing.assert_array_equal(f.pos_y, [0, 0, 2, 0, 4])
+        np.testing.assert_array_equal(f.pos_z, [0, 0, 0, 3, 4])
+        self.assertEqual(list(f.pix_symbol), ['C', 'N', 'Fe', 'C', 'X'])
+        for values in (f.sld_n, f.vol_pix, f.sld_mx, f.sld_my, f.sld_mz):
+            self.assertEqual(len(values), 5)
+        # The same element gets the same sld and volume
+        self.assertEqual(f.sld_n[0], f.sld_n[3])
+        self.assertEqual(f.vol_pix[0], f.vol_pix[3])
+        # Unknown elements do not contribute
+        self.assertEqual(f.sld_n[4], 0)
+        self.assertEqual(f.vol_pix[4], 0)
+        # Reverse bonds are only drawn once
+        self.assertEqual(f.line_x, [(0, 1), (0, 0)])
+        self.assertEqual(f.line_z, [(0, 0), (0, 3)])
+
+    def test_sldreader_fallback(self):
+        """
+        Test the line by line reading of .sld files numpy can't load
+        """
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, "bad.sld")
+            with open("sld_file.sld") as source:
+                content = source.read().rstrip('\n')
+            with open(path, 'w') as out:
+                out.write(content + "\nnot a data line\n")
+            f = self.sldloader.read(path)
+        finally:
+            shutil.rmtree(tmpdir)
+        ref = self.sldloader.read("sld_file.sld")
+        for name in ('pos_x', 'pos_y', 'pos_z', 'sld_n',
+                     'sld_mx', 'sld_my', 'sld_mz'):
+            np.testing.assert_array_equal(getattr(f, name), getattr(ref, name))
+
+
+class GenSASTests(unittest.TestCase):
+    """
+    Compare the chunked, threaded and numpy evaluations of GenSAS
+    """
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        n_pix = 40
+        pos_x, pos_y, pos_z = rng.uniform(-20, 20, (3, n_pix))
+        sld_n = rng.uniform(0, 1e-6, n_pix)
+        sld_mx, sld_my, sld_mz = rng.uniform(-1e-6, 1e-6, (3, n_pix))
+        # Some pixels without magnetization or without any sld
+        sld_mx[::5] = sld_my[::5] = sld_mz[::5] = 0.0
+        sld_n[::7] = 0.0
+        sld_mx[::7] = sld_my[::7] = sld_mz[::7] = 0.0
+        data = sas_gen.MagSLD(pos_x, pos_y, pos_z, sld_n,
+                              sld_mx, sld_my, sld_mz)
+        data.set_pixel_volumes(rng.uniform(1, 2, n_pix))
+        self.model = sas_gen.GenSAS()
+        self.model.set_sld_data(data)
+        self.model.params['Up_frac_in'] = 0.7
+        self.model.params['Up_frac_out'] = 0.4
+        self.model.params['Up_theta'] = 30.0
+        self.qx = rng.uniform(-0.2, 0.2, 50)
+        self.qy = rng.uniform(-0.2, 0.2, 50)
+        self.qx[:2] = 0.0
+        self.qy[0] = 0.0
+        self.q = np.linspace(0.001, 0.5, 30)
+
+    def _compare(self, evaluate):
+        self.model.set_threads(1, 1000)
+        reference = evaluate()
+        # Chunks computed in several threads
+        self.model.set_threads(3, 7)
+        np.testing.assert_array_equal(evaluate(), reference)
+        # Numpy kernels
+        self.model.use_numpy = True
+        np.testing.assert_allclose(evaluate(), reference, rtol=1e-10)
+        self.model.set_threads(1, 1000)
+        np.testing.assert_allclose(evaluate(), reference, rtol=1e-10)
+
+    def test_runxy(self):
+        """
+        Test the 2D magnetic computation
+        """
+        self._compare(lambda: self.model.runXY([self.qx, self.qy]))
+
+    def test_run(self):
+        """
+        Test the 1D orientation averaged computation
+        """
+        self.model.set_is_avg(True)
+        self._compare(lambda: self.model.run([self.q, []]))
+
+    def test_run_spherical(self):
+        """
+        Test the 1D spherical symmetric approximation, twice to check
+        that the model can be evaluated again
+        """
+        self.model.set_is_avg(None)
+        evaluate = lambda: self.model.run([self.q, []])
+        self._compare(evaluate)
+        self.model.use_numpy = False
+        np.testing.assert_array_equal(evaluate(), evaluate())
+
+    def test_histogram(self):
+        """
+        Test the pair distance histogram engine for the averaged I(q)
+        """
+        self.model.set_is_avg(True)
+        self.model.params['solvent_SLD'] = 1e-7
+        reference = self.model.run([self.q, []])
+        self.model.set_histogram(True, 0.01)
+        result = self.model.run([self.q, []])
+        self.assertTrue(np.max(np.abs(result - reference))
+                        < 1e-5 * np.max(np.abs(reference)))
+        # All pairs are in the histogram
+        r, hist = self.model.get_histogram()
+        weight = (self.model.data_sldn - 1e-7) * self.model.data_vol
+        self.assertAlmostEqual(np.sum(hist) / np.sum(weight)**2, 1.0)
+        # The histogram is only computed again when the structure changes
+        self.model.params['scale'] = 2.0
+        self.model.run([self.q[::2], []])
+        self.assertTrue(self.model.get_histogram()[1] is hist)
+        self.model.params['solvent_SLD'] = 0.0
+        self.assertFalse(self.model.get_histogram()[1] is hist)
+
+    def test_histogram_volumes(self):
+        """
+        Check changing the pixel volumes changes the histogram I(q)
+        """
+        self.model.set_is_avg(True)
+        self.model.set_histogram(True, 0.01)
+        before = self.model.run([self.q, []])
+        volumes = np.linspace(0.5, 2.0, len(self.model.data_vol))
+        self.model.set_pixel_volumes(volumes)
+        after = self.model.run([self.q, []])
+        self.assertFalse(np.allclose(after, before))
+        self.model.set_histogram(False)
+        reference = self.model.run([self.q, []])
+        self.assertTrue(np.max(np.abs(after - reference))
+                        < 1e-5 * np.max(np.abs(reference)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,82 @@
+"""
+Timing of the arithmetic of the data_info data classes.
+
+Usage: python benchmark_data_operations.py [n_points]
+
+Subtracts and scales a Data1D and a Data2D of n_points points (default
+1000000) and compares the time with the point by point propagation of the
+uncertainties that the operations used to do.
+"""
+from __future__ import print_function
+
+import sys
+import time
+
+import numpy as np
+
+from sas.sascalc.data_util.uncertainty import Uncertainty
+from sas.sascalc.dataloader.data_info import Data1D, Data2D
+
+
+def point_by_point(values, errors, other, other_errors, operation):
+    """
+    Apply operation to each point with scalar Uncertainty objects
+    """
+    y = np.zeros(len(values))
+    dy = np.zeros(len(values))
+    for i in range(len(values)):
+        a = Uncertainty(values[i], errors[i]**2)
+        if other_errors is None:
+            b = other
+        else:
+            b = Uncertainty(other[i], other_errors[i]**2)
+        output = operation(a, b)
+        y[i] = output.x
+        dy[i] = np.sqrt(np.fabs(output.variance))
+    return y, dy
+
+
+def time_it(func, *args):
+    start = time.time()
+    output = func(*args)
+    return time.time() - start, output
+
+
+def compare(name, data, other, values, errors, other_values, other_errors):
+    for label, operation, operand, reference in [
+            ("subtract", lambda a, b: a - b, other, other_values),
+            ("scale", lambda a, b: a * b, 2.5, 2.5)]:
+        elapsed, _ = time_it(operation, data, operand)
+        ref_elapsed, _ = time_it(point_by_point, values, errors, reference,
+                                 other_errors if operand is other else None,
+                                 operation)
+        print("%s %s: %.3f s (point by point %.3f s)"
+              % (name, label, elapsed, ref_elapsed))
+
+
+def main(n_points=1000000):
+    rng = np.random.RandomState(0)
+    x = np.linspace(0.001, 0.5, n_points)
+    data = Data1D(x=x, y=rng.uniform(1, 10, n_points),
+                  dy=rng.uniform(0.1, 1, n_points))
+    other = Data1D(x=x.copy(), y=rng.uniform(1, 10, n_points),
+                   dy=rng.uniform(0.1, 1, n_points))
+    compare("Data1D", data, other, data.y, data.dy, other.y, other.dy)
+
+    qx = rng.uniform(0.01, 0.5, n_points)
+    qy = rng.uniform(0.01, 0.5, n_points)
+    data = Data2D(data=rng.uniform(1, 10, n_points),
+                  err_data=rng.uniform(0.1, 1, n_points),
+                  qx_data=qx, qy_data=qy, q_data=np.sqrt(qx**2 + qy**2),
+                  mask=np.ones(n_points, dtype=bool))
+    other = Data2D(data=rng.uniform(1, 10, n_points),
+                   err_data=rng.uniform(0.1, 1, n_points),
+                   qx_data=qx.copy(), qy_data=qy.copy(),
+                   q_data=np.sqrt(qx**2 + qy**2),
+                   mask=np.ones(n_points, dtype=bool))
+    compare("Data2D", data, other, data.data, data.err_data,
+            other.data, other.err_data)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
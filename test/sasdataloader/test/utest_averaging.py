@@ -7,10 +7,11 @@ import numpy as np
 
 import sas.sascalc.dataloader.data_info as data_info
 from sas.sascalc.dataloader.loader import Loader
-from sas.sascalc.dataloader.manipulations import (Boxavg, Boxsum,
+from sas.sascalc.dataloader.manipulations import (BinCache, Boxavg, Boxsum,
                                                   CircularAverage, Ring,
                                                   SectorPhi, SectorQ, SlabX,
-                                                  SlabY, get_q,
+                                                  SlabY, average_frames,
+                                                  bin_cache, get_q,
                                                   reader2D_converter)
 
 
@@ -294,5 +295,204 @@ class DataInfoTests(unittest.TestCase):
         # print o.y.shape
 
 
+class VectorizedAveragingTests(unittest.TestCase):
+    """
+        Check that the vectorized binning gives the same results as
+        the per-pixel reference loops
+    """
+
+    def setUp(self):
+        filepath = os.path.join(os.path.dirname(
+            os.path.realpath(__file__)), 'MAR07232_rest.h5')
+        self.data = Loader().load(filepath)[0]
+        # Exercise the non-finite and zero-error code paths
+        self.data.data[::97] = np.nan
+        self.data.err_data[::13] = 0.0
+        # and the resolution averaging
+        self.data.dqx_data = np.linspace(0.001, 0.002, len(self.data.data))
+        self.data.dqy_data = np.linspace(0.002, 0.001, len(self.data.data))
+
+    def compare(self, averager, *args):
+        averager.reference_loop = True
+        expected = averager(self.data, *args)
+        averager.reference_loop = False
+        result = averager(self.data, *args)
+        np.testing.assert_allclose(result.x, expected.x, rtol=1e-12)
+        np.testing.assert_allclose(result.y, expected.y, rtol=1e-12)
+        np.testing.assert_allclose(result.dy, expected.dy, rtol=1e-12)
+        if expected.dx is None:
+            self.assertTrue(result.dx is None)
+        else:
+            np.testing.assert_allclose(result.dx, expected.dx, rtol=1e-12)
+
+    def test_circularavg(self):
+        self.compare(CircularAverage(r_min=.00, r_max=.025, bin_width=0.0003))
+        self.compare(CircularAverage(r_min=.002, r_max=.02, bin_width=0.001),
+                     True)
+
+    def test_ring(self):
+        self.compare(Ring(r_min=.005, r_max=.01, nbins=20))
+
+    def test_sectorphi(self):
+        self.compare(SectorPhi(r_min=.005, r_max=.01,
+                               phi_min=0, phi_max=math.pi / 2.0))
+        self.compare(SectorPhi(r_min=.005, r_max=.02,
+                               phi_min=0.5, phi_max=math.pi, nbins=35))
+
+    def test_sectorq(self):
+        self.compare(SectorQ(r_min=.005, r_max=.01,
+                             phi_min=0, phi_max=math.pi / 2.0))
+        self.compare(SectorQ(r_min=.005, r_max=.01,
+                             phi_min=5.5, phi_max=0.5, base=10))
+
+    def test_slab(self):
+        r = SlabX(x_min=-.01, x_max=.01, y_min=-0.0002,
+                  y_max=0.0002, bin_width=0.0004)
+        self.compare(r)
+        r.fold = True
+        self.compare(r)
+        self.compare(SlabY(x_min=.005, x_max=.01, y_min=-0.01,
+                           y_max=0.01, bin_width=0.0004))
+
+    def test_box(self):
+        r = Boxsum(x_min=.01, x_max=.015, y_min=0.01, y_max=0.015)
+        r.reference_loop = True
+        expected = r(self.data)
+        r.reference_loop = False
+        np.testing.assert_allclose(r(self.data), expected, rtol=1e-12)
+
+
+class AverageFramesTests(unittest.TestCase):
+    """
+        Test the averaging of a stack of frames with a shared geometry
+    """
+
+    def setUp(self):
+        filepath = os.path.join(os.path.dirname(
+            os.path.realpath(__file__)), 'MAR07232_rest.h5')
+        self.data = Loader().load(filepath)[0]
+        self.data.dqx_data = np.linspace(0.001, 0.002, len(self.data.data))
+        self.data.dqy_data = np.linspace(0.002, 0.001, len(self.data.data))
+        self.frames = []
+        for i in range(5):
+            frame = self.data.clone_without_data(len(self.data.data))
+            frame.data = self.data.data * (1.0 + i)
+            frame.data[i::50] = np.nan
+            frame.err_data = self.data.err_data * (1.0 + i)
+            for name in ('qx_data', 'qy_data', 'q_data', 'mask',
+                         'dqx_data', 'dqy_data'):
+                setattr(frame, name, getattr(self.data, name))
+            self.frames.append(frame)
+
+    def compare(self, averager):
+        expected = [averager(frame) for frame in self.frames]
+        result = average_frames(averager, self.data, iter(self.frames),
+                                chunk_size=2)
+        self.assertEqual(len(result), len(expected))
+        for o, answer in zip(result, expected):
+            np.testing.assert_allclose(o.x, answer.x, rtol=1e-12)
+            np.testing.assert_allclose(o.y, answer.y, rtol=1e-12)
+            np.testing.assert_allclose(o.dy, answer.dy, rtol=1e-12)
+            if answer.dx is not None:
+                np.testing.assert_allclose(o.dx, answer.dx, rtol=1e-12)
+
+        stack = np.array([frame.data for frame in self.frames])
+        err_stack = np.array([frame.err_data for frame in self.frames])
+        x, y, dy, _ = average_frames(averager, self.data, stack,
+                                     err_frames=err_stack, as_array=True)
+        self.assertEqual(y.shape[0], len(self.frames))
+        for i, answer in enumerate(expected):
+            idx = np.isfinite(y[i])
+            np.testing.assert_allclose(x[i][idx], answer.x, rtol=1e-12)
+            np.testing.assert_allclose(y[i][idx], answer.y, rtol=1e-12)
+            np.testing.assert_allclose(dy[i][idx], answer.dy, rtol=1e-12)
+
+    def test_circularavg(self):
+        self.compare(CircularAverage(r_min=.00, r_max=.025, bin_width=0.0003))
+
+    def test_ring(self):
+        self.compare(Ring(r_min=.005, r_max=.01, nbins=20))
+
+    def test_sector(self):
+        self.compare(SectorPhi(r_min=.005, r_max=.01,
+                               phi_min=0, phi_max=math.pi / 2.0))
+        self.compare(SectorQ(r_min=.005, r_max=.01,
+                             phi_min=0, phi_max=math.pi / 2.0))
+
+    def test_slab(self):
+        self.compare(SlabX(x_min=-.01, x_max=.01, y_min=-0.0002,
+                           y_max=0.0002, bin_width=0.0004))
+        self.compare(SlabY(x_min=.005, x_max=.01, y_min=-0.01,
+                           y_max=0.01, bin_width=0.0004))
+
+    def test_unsupported(self):
+        self.assertRaises(TypeError, average_frames,
+                          Boxsum(x_min=.01, x_max=.015, y_min=0.01,
+                                 y_max=0.015),
+                          self.data, self.frames)
+
+
+class BinCacheTests(unittest.TestCase):
+    """
+        Test the reuse of the pixel to bin assignments
+    """
+
+    def setUp(self):
+        filepath = os.path.join(os.path.dirname(
+            os.path.realpath(__file__)), 'MAR07232_rest.h5')
+        self.data = Loader().load(filepath)[0]
+        bin_cache.clear()
+
+    def tearDown(self):
+        bin_cache.clear()
+
+    def test_same_geometry(self):
+        """
+            A new frame with the same geometry reuses the bins
+        """
+        r = CircularAverage(r_min=.00, r_max=.025, bin_width=0.0003)
+        r(self.data)
+        self.assertEqual((bin_cache.hits, bin_cache.misses), (0, 1))
+
+        frame = self.data.clone_without_data(len(self.data.data))
+        frame.data = 2.0 * self.data.data
+        frame.err_data = self.data.err_data
+        frame.qx_data = self.data.qx_data.copy()
+        frame.qy_data = self.data.qy_data.copy()
+        frame.q_data = self.data.q_data.copy()
+        frame.mask = self.data.mask
+        o = r(frame)
+        self.assertEqual((bin_cache.hits, bin_cache.misses), (1, 1))
+
+        r.reference_loop = True
+        expected = r(frame)
+        np.testing.assert_allclose(o.y, expected.y, rtol=1e-12)
+
+    def test_new_roi(self):
+        """
+            Changing the ROI or the geometry recomputes the bins
+        """
+        r = SectorQ(r_min=.005, r_max=.01, phi_min=0, phi_max=math.pi / 2.0)
+        r(self.data)
+        r.phi_max = math.pi
+        r(self.data)
+        self.data.qx_data = self.data.qx_data * 1.01
+        r(self.data)
+        self.assertEqual((bin_cache.hits, bin_cache.misses), (0, 3))
+        self.assertEqual(len(bin_cache), 3)
+
+    def test_eviction(self):
+        """
+            The least recently used entry is dropped first
+        """
+        cache = BinCache(max_size=2)
+        compute = lambda: (np.arange(3), np.zeros(3, dtype=int))
+        for key in ['a', 'b', 'a', 'c', 'a', 'b']:
+            cache.get_bins(key, self.data, compute)
+        # 'b' was evicted when 'c' was added
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+        self.assertEqual(len(cache), 2)
+
+
 if __name__ == '__main__':
     unittest.main()
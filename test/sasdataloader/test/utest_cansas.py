@@ -9,7 +9,9 @@ from sas.sascalc.dataloader.readers.cansas_reader import Reader
 from sas.sascalc.dataloader.readers.cansas_constants import CansasConstants
 
 import os
+import re
 import sys
+import copy
 import urllib2
 import StringIO
 import pylint as pylint
@@ -207,6 +209,114 @@ class cansas_reader_xml(unittest.TestCase):
         if os.path.isfile(self.write_1_0_filename):
             os.remove(self.write_1_0_filename)
 
+    def test_iter_read(self):
+        data = Reader().read(self.isis_1_1)
+        streamed = list(Reader().iter_read(self.isis_1_1))
+        self.assertEqual(len(streamed), len(data))
+        for item, expected in zip(streamed, data):
+            self._check_data(item)
+            self._check_data_1_1(item)
+            self.assertEqual(item.errors, [])
+            np.testing.assert_array_equal(item.x, expected.x)
+            np.testing.assert_array_equal(item.y, expected.y)
+            np.testing.assert_array_equal(item.dy, expected.dy)
+            self.assertEqual(item.meta_data, expected.meta_data)
+
+    def test_iter_read_entries(self):
+        doc = etree.parse(self.isis_1_1)
+        root = doc.getroot()
+        entry = root[0]
+        for title in ["second", "third"]:
+            copy = etree.fromstring(etree.tostring(entry))
+            copy[0].text = title
+            root.append(copy)
+        filename = "isis_1_1_entries_test.xml"
+        doc.write(filename, xml_declaration=True, encoding="UTF-8")
+        try:
+            streamed = self.loader.iter_load(filename)
+            self.assertFalse(isinstance(streamed, list))
+            titles = [item.title for item in streamed]
+            self.assertEqual(titles, ["TK49 c10_SANS", "second", "third"])
+        finally:
+            os.remove(filename)
+
+    def test_iter_read_invalid(self):
+        streamed = list(Reader().iter_read(self.cansas1d_notitle))
+        self.assertEqual(len(streamed), 1)
+        self.assertEqual(streamed[0].x.size, 2)
+        self.assertEqual(len(streamed[0].errors), 1)
+        streamed = list(Reader().iter_read(self.cansas1d_notitle,
+                                           validate=False))
+        self.assertEqual(streamed[0].errors, [])
+
+    def _check_write(self, data, filename):
+        Reader().write(filename, copy.deepcopy(data))
+        try:
+            with open(filename) as written:
+                text = written.read()
+        finally:
+            os.remove(filename)
+        # The streamed file is laid out as the pretty printed document,
+        # the parser does not tell <a></a> from <a/> apart
+        parser = etree.XMLParser(remove_blank_text=True)
+        doc = etree.fromstring(text, parser)
+        expected = etree.tostring(doc.getroottree(), encoding="UTF-8",
+                                  pretty_print=True, xml_declaration=True)
+        self.assertEqual(re.sub(r"<(\w+)([^<>]*)></\1>", r"<\1\2/>", text),
+                         expected)
+        return doc
+
+    def test_write_streamed(self):
+        filename = "isis_1_1_streamed_test.xml"
+        for data in Reader().read(self.isis_1_1):
+            self._check_write(data, filename)
+        data = Data1D(x=np.linspace(0.01, 0.1, 5), y=np.arange(5.0),
+                      dx=np.ones(5), dy=[0.1, None, 0.3, 0.4, 0.5])
+        doc = self._check_write(data, filename)
+        points = doc.findall(".//{*}Idata")
+        self.assertEqual(len(points), 5)
+        self.assertEqual([item.tag.split("}")[1] for item in points[1]],
+                         ["Q", "I", "Qdev"])
+        self.assertEqual(points[4][0].text, str(data.x[4]))
+        data.isSesans = True
+        data.x = data.x[:0]
+        doc = self._check_write(data, filename)
+        self.assertEqual(doc.findall(".//{*}Idata"), [])
+        self.assertEqual(doc.find(".//{*}Sesans").text, "True")
+
+    def test_write_streamed_2d(self):
+        filename = "streamed_2d_test.xml"
+        qx, qy = np.meshgrid(np.linspace(-0.1, 0.1, 6),
+                             np.linspace(-0.1, 0.1, 5))
+        data = Data2D(data=np.arange(30.0), err_data=np.ones(30),
+                      qx_data=qx.ravel(), qy_data=qy.ravel(),
+                      q_data=np.hypot(qx, qy).ravel(),
+                      mask=np.arange(30) % 4 > 0)
+        data.x_bins = qx[0]
+        data.y_bins = qy[:, 0]
+        old_chunk_size = cansas.CHUNK_SIZE
+        cansas.CHUNK_SIZE = 7
+        try:
+            doc = self._check_write(data, filename)
+        finally:
+            cansas.CHUNK_SIZE = old_chunk_size
+        point = doc.find(".//{*}Idata")
+        self.assertEqual([item.tag.split("}")[1] for item in point],
+                         ["Qx", "Qy", "I", "Idev", "Mask"])
+        self.assertEqual(point[0].text.split(","),
+                         [str(value) for value in data.qx_data])
+        self.assertEqual(point[4].text.split(","),
+                         ["1" if value else "0" for value in data.mask])
+
+    def test_format_values(self):
+        for values in [np.array([0.1, 1e-20, -3.0, np.nan, 1e16]),
+                       np.array([1, 2], dtype=np.int32),
+                       np.array([0.1, 2.5], dtype=np.float32),
+                       np.array([True, False])]:
+            self.assertEqual(list(cansas.format_values(values)),
+                             [str(value) for value in values])
+        self.assertEqual(cansas.format_values([1.5, None]), ["1.5", None])
+
     def test_processing_instructions(self):
         reader = XMLreader(self.isis_1_1, self.schema_1_1)
         valid = reader.validate_xml()
@@ -0,0 +1,138 @@
+"""
+    Unit tests for the arithmetic of the data_info data classes
+"""
+
+import operator
+import unittest
+
+import numpy as np
+
+from sas.sascalc.data_util.uncertainty import Uncertainty
+from sas.sascalc.dataloader.data_info import Data1D, Data2D
+
+OPERATIONS = [operator.add, operator.sub, operator.mul, operator.div]
+
+
+def point_by_point(values, errors, other, other_errors, operation):
+    """
+    Apply operation to each point with scalar Uncertainty objects
+    """
+    y = np.zeros(len(values))
+    dy = np.zeros(len(values))
+    for i in range(len(values)):
+        a = Uncertainty(values[i], errors[i]**2)
+        if other_errors is None:
+            b = other
+        else:
+            b = Uncertainty(other[i], other_errors[i]**2)
+        output = operation(a, b)
+        y[i] = output.x
+        dy[i] = np.sqrt(np.fabs(output.variance))
+    return y, dy
+
+
+class Data1DOperationTests(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        x = np.linspace(0.001, 0.5, 50)
+        self.data = Data1D(x=x, y=rng.uniform(1, 10, 50),
+                           dy=rng.uniform(0.1, 1, 50),
+                           dx=rng.uniform(0, 0.01, 50))
+        self.data.dxl = rng.uniform(0, 0.01, 50)
+        self.other = Data1D(x=x.copy(), y=rng.uniform(1, 10, 50),
+                            dy=rng.uniform(0.1, 1, 50),
+                            dx=rng.uniform(0, 0.01, 50))
+        self.other.dxl = rng.uniform(0, 0.01, 50)
+
+    def test_data_operations(self):
+        for operation in OPERATIONS:
+            result = operation(self.data, self.other)
+            y, dy = point_by_point(self.data.y, self.data.dy, self.other.y,
+                                   self.other.dy, operation)
+            np.testing.assert_allclose(result.y, y, rtol=1e-14)
+            np.testing.assert_allclose(result.dy, dy, rtol=1e-14)
+            np.testing.assert_allclose(result.x, self.data.x)
+            np.testing.assert_allclose(
+                result.dx, np.sqrt((self.data.dx**2 + self.other.dx**2)/2))
+            np.testing.assert_allclose(
+                result.dxl, np.sqrt((self.data.dxl**2 + self.other.dxl**2)/2))
+
+    def test_scalar_operations(self):
+        for operation in OPERATIONS:
+            result = operation(self.data, 3)
+            y, dy = point_by_point(self.data.y, self.data.dy, 3, None,
+                                   operation)
+            np.testing.assert_allclose(result.y, y, rtol=1e-14)
+            np.testing.assert_allclose(result.dy, dy, rtol=1e-14)
+            np.testing.assert_allclose(result.dx, self.data.dx)
+        result = 2 - self.data
+        np.testing.assert_allclose(result.y, 2 - self.data.y)
+        np.testing.assert_allclose(result.dy, self.data.dy)
+
+    def test_incompatible(self):
+        self.other.x[10] *= 1.1
+        self.assertRaises(ValueError, operator.add, self.data, self.other)
+        short = Data1D(x=self.data.x[:10], y=self.data.y[:10])
+        self.assertRaises(ValueError, operator.add, self.data, short)
+
+    def test_union(self):
+        result = self.data | self.other
+        self.assertEqual(len(result.x), 100)
+        self.assertTrue(np.all(np.diff(result.x) >= 0))
+
+
+class Data2DOperationTests(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        qx = np.linspace(-0.5, 0.5, 64) + 1e-3
+        qy = np.linspace(0.5, -0.5, 64) + 1e-3
+        mask = rng.uniform(size=64) > 0.3
+        self.data = Data2D(data=rng.uniform(1, 10, 64),
+                           err_data=rng.uniform(0.1, 1, 64),
+                           qx_data=qx, qy_data=qy,
+                           q_data=np.sqrt(qx**2 + qy**2), mask=mask,
+                           dqx_data=rng.uniform(0, 0.01, 64),
+                           dqy_data=rng.uniform(0, 0.01, 64))
+        self.other = Data2D(data=rng.uniform(1, 10, 64),
+                            err_data=rng.uniform(0.1, 1, 64),
+                            qx_data=qx.copy(), qy_data=qy.copy(),
+                            q_data=np.sqrt(qx**2 + qy**2), mask=mask,
+                            dqx_data=rng.uniform(0, 0.01, 64),
+                            dqy_data=rng.uniform(0, 0.01, 64))
+
+    def test_data_operations(self):
+        for operation in OPERATIONS:
+            result = operation(self.data, self.other)
+            y, dy = point_by_point(self.data.data, self.data.err_data,
+                                   self.other.data, self.other.err_data,
+                                   operation)
+            np.testing.assert_allclose(result.data, y, rtol=1e-14)
+            np.testing.assert_allclose(result.err_data, dy, rtol=1e-14)
+            np.testing.assert_allclose(result.mask, self.data.mask)
+            np.testing.assert_allclose(
+                result.dqx_data,
+                np.sqrt((self.data.dqx_data**2 + self.other.dqx_data**2)/2))
+
+    def test_scalar_operations(self):
+        self.data.err_data = None
+        for operation in OPERATIONS:
+            result = operation(self.data, 2.5)
+            y, dy = point_by_point(self.data.data, np.zeros(64), 2.5, None,
+                                   operation)
+            np.testing.assert_allclose(result.data, y, rtol=1e-14)
+            np.testing.assert_allclose(result.err_data, dy, rtol=1e-14)
+
+    def test_incompatible(self):
+        self.other.qy_data[5] *= 1.1
+        try:
+            self.data + self.other
+        except ValueError as exc:
+            self.assertTrue("qy-values" in str(exc))
+        else:
+            self.fail("incompatible qy-values were accepted")
+
+
+if __name__ == '__main__':
+    unittest.main()
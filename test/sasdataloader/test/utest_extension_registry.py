@@ -9,6 +9,7 @@ import shutil
 import numpy as np
 
 from sas.sascalc.dataloader.loader import Registry as Loader
+from sas.sascalc.dataloader.loader import sniff_file_type
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +72,33 @@ class ExtensionRegistryTests(unittest.TestCase):
         err_msg = data.errors[0]
         self.assertTrue("does not fully meet the CanSAS v1.x specification" in err_msg)
 
+    def test_sniff_file_type(self):
+        """
+        Check the file type is told from the start of the file contents
+        """
+        self.assertEqual(sniff_file_type(self.valid_file), "xml")
+        self.assertEqual(sniff_file_type(self.valid_file_wrong_unknown_ext),
+                         "xml")
+        self.assertEqual(sniff_file_type("simpleexamplefile.h5"), "hdf5")
+        self.assertEqual(sniff_file_type("ascii_test_1.txt"), "ascii")
+        self.assertEqual(sniff_file_type("empty.txt"), None)
+        self.assertEqual(sniff_file_type("not_a_file.txt"), None)
+
+    def test_sniffed_dispatch(self):
+        """
+        Check a CanSAS XML file with a wrong extension is only given to the
+        CanSAS XML reader, and the time spent in each step is recorded
+        """
+        self.loader.load(self.valid_file_wrong_known_ext)
+        steps = [step for step, _ in self.loader.dispatch_timings]
+        self.assertEqual(steps, ["sniff", "xml"])
+        self.assertTrue(all(t >= 0 for _, t in self.loader.dispatch_timings))
+
+        self.loader.load(self.valid_file_wrong_unknown_ext)
+        steps = [step for step, _ in self.loader.dispatch_timings]
+        self.assertEqual(steps, ["sniff", "associated", "xml"])
+        self.assertEqual(self.loader._dispatch_cache[(".xyz", "xml")], "xml")
+
     def tearDown(self):
         if os.path.isfile(self.valid_file_wrong_known_ext):
             os.remove(self.valid_file_wrong_known_ext)
@@ -0,0 +1,81 @@
+"""
+Throughput of model evaluations run by the calculation threads.
+
+Usage: python benchmark_calcthread.py [n_evaluations] [n_points]
+
+Evaluates a sphere form factor n_evaluations times (default 200) on
+n_points q-values (default 100000) in calculation threads, first with a
+CalcThread per evaluation and the default yieldtime/worktime of the
+model threads, then with PooledCalcThread objects sharing a WorkPool.
+"""
+from __future__ import print_function
+
+import sys
+import time
+import threading
+
+import numpy as np
+
+from sas.sascalc.data_util.calcthread import (CalcThread, PooledCalcThread,
+                                              WorkPool, get_workers)
+
+CHUNK_SIZE = 10000
+
+
+def sphere(q, radius=60.0, contrast=1e-6):
+    """
+    Form factor of a sphere
+    """
+    qr = q * radius
+    volume = 4.0 / 3.0 * np.pi * radius**3
+    amplitude = 3.0 * (np.sin(qr) - qr * np.cos(qr)) / qr**3
+    return 1e8 * contrast**2 * volume * amplitude**2
+
+
+def make_model_calc(base):
+    class ModelCalc(base):
+        """Evaluation of the model in chunks, checking for interrupts"""
+        def compute(self, q, done):
+            output = np.empty_like(q)
+            for start in range(0, len(q), CHUNK_SIZE):
+                self.isquit()
+                chunk = slice(start, start + CHUNK_SIZE)
+                output[chunk] = sphere(q[chunk])
+                self.update(output=output)
+            self.complete(output=output)
+            done.release()
+    return ModelCalc
+
+
+def run(calcs, q):
+    """
+    Queue one evaluation on each calculation and wait for all of them
+    """
+    done = threading.Semaphore(0)
+    start = time.time()
+    for calc in calcs:
+        calc.queue(q, done)
+    for _ in calcs:
+        done.acquire()
+    return time.time() - start
+
+
+def main(n_evaluations=200, n_points=100000):
+    q = np.linspace(0.001, 0.5, n_points)
+    calc = make_model_calc(CalcThread)
+    elapsed = run([calc(yieldtime=0.01, worktime=0.01)
+                   for _ in range(n_evaluations)], q)
+    print("CalcThread: %d evaluations in %.2f s, %.1f evaluations/s"
+          % (n_evaluations, elapsed, n_evaluations / elapsed))
+
+    pool = WorkPool()
+    calc = make_model_calc(PooledCalcThread)
+    elapsed = run([calc(yieldtime=0.01, worktime=0.01, pool=pool)
+                   for _ in range(n_evaluations)], q)
+    print("PooledCalcThread (%d workers): %d evaluations in %.2f s, "
+          "%.1f evaluations/s" % (get_workers(), n_evaluations, elapsed,
+                                  n_evaluations / elapsed))
+
+
+if __name__ == "__main__":
+    main(*[int(value) for value in sys.argv[1:3]])
@@ -0,0 +1,59 @@
+"""
+    Unit tests for the cache helpers of data_util
+"""
+
+import unittest
+
+import numpy as np
+
+from sas.sascalc.data_util.cache import array_digest, LRUCache
+
+
+class ArrayDigestTests(unittest.TestCase):
+
+    def test_array_digest(self):
+        array = np.linspace(0.0, 1.0, 12)
+        digest = array_digest(array)
+        self.assertEqual(digest, array_digest(array.copy()))
+        self.assertEqual(digest, array_digest(list(array)))
+        # Non contiguous views have the digest of their values
+        self.assertEqual(array_digest(array[::2]),
+                         array_digest(array[::2].copy()))
+        changed = array.copy()
+        changed[5] += 1e-12
+        self.assertNotEqual(array_digest(changed), digest)
+        self.assertNotEqual(array_digest(array.reshape(3, 4)), digest)
+        self.assertNotEqual(array_digest(array.astype(np.float32)), digest)
+        self.assertTrue(array_digest(None) is None)
+
+
+class LRUCacheTests(unittest.TestCase):
+
+    def test_lru(self):
+        cache = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        # "a" becomes the most recently used entry, so "b" is dropped
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(cache.get("b") is None)
+        self.assertEqual(cache.get("b", 0), 0)
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+        # Replacing an entry does not drop another one
+        cache.put("c", 4)
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 4))
+        cache.hits = 3
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+
+    def test_disabled(self):
+        cache = LRUCache(max_size=0)
+        cache.put("a", 1)
+        self.assertEqual(len(cache), 0)
+        self.assertTrue(cache.get("a") is None)
+
+
+if __name__ == '__main__':
+    unittest.main()
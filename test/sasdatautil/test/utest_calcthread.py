@@ -0,0 +1,136 @@
+"""
+    Unit tests for the work pool of the calculation threads
+"""
+
+import time
+import threading
+import unittest
+
+from sas.sascalc.data_util.calcthread import (PooledCalcThread, WorkPool,
+                                              INTERACTIVE, BACKGROUND)
+
+
+class Record(PooledCalcThread):
+    """Calculation recording its work units in a shared list"""
+    def __init__(self, log, gate=None, **kwargs):
+        PooledCalcThread.__init__(self, **kwargs)
+        self.log = log
+        self.gate = gate
+        self.started = threading.Event()
+
+    def compute(self, name):
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait()
+        self.log.append(name)
+        self.complete(name=name)
+
+
+class Spin(PooledCalcThread):
+    """Calculation running until it is interrupted"""
+    def __init__(self, **kwargs):
+        PooledCalcThread.__init__(self, **kwargs)
+        self.started = threading.Event()
+
+    def compute(self):
+        self.started.set()
+        while True:
+            self.isquit()
+
+
+def wait_for(calc, timeout=5.0):
+    start = time.time()
+    while calc.isrunning() and time.time() - start < timeout:
+        time.sleep(0.001)
+    return not calc.isrunning()
+
+
+class WorkPoolTests(unittest.TestCase):
+
+    def test_queue(self):
+        log = []
+        completed = []
+        calc = Record(log, pool=WorkPool(2),
+                      completefn=lambda name: completed.append(name))
+        for name in ["a", "b", "c"]:
+            calc.queue(name)
+        self.assertTrue(wait_for(calc))
+        self.assertEqual(log, ["a", "b", "c"])
+        self.assertEqual(completed, ["a", "b", "c"])
+        calc.queue("d")
+        self.assertTrue(wait_for(calc))
+        self.assertEqual(log, ["a", "b", "c", "d"])
+
+    def test_priority(self):
+        pool = WorkPool(1)
+        log = []
+        gate = threading.Event()
+        blocker = Record(log, gate, pool=pool, priority=INTERACTIVE)
+        blocker.queue("blocker")
+        blocker.started.wait(5.0)
+        background = Record(log, pool=pool, priority=BACKGROUND)
+        interactive = Record(log, pool=pool, priority=INTERACTIVE)
+        background.queue("background")
+        interactive.queue("interactive")
+        gate.set()
+        for calc in [blocker, background, interactive]:
+            self.assertTrue(wait_for(calc))
+        self.assertEqual(log, ["blocker", "interactive", "background"])
+
+    def test_background_limit(self):
+        pool = WorkPool(2)
+        log = []
+        gate = threading.Event()
+        blocker = Record(log, gate, pool=pool, priority=BACKGROUND)
+        blocker.queue("blocker")
+        blocker.started.wait(5.0)
+        background = Record(log, pool=pool, priority=BACKGROUND)
+        background.queue("background")
+        interactive = Record(log, pool=pool, priority=INTERACTIVE)
+        interactive.queue("interactive")
+        # A worker is kept for the interactive work
+        self.assertTrue(wait_for(interactive))
+        self.assertEqual(log, ["interactive"])
+        gate.set()
+        self.assertTrue(wait_for(blocker))
+        self.assertTrue(wait_for(background))
+        self.assertEqual(log, ["interactive", "blocker", "background"])
+
+    def test_single_worker(self):
+        pool = WorkPool(1)
+        log = []
+        gate = threading.Event()
+        blocker = Record(log, gate, pool=pool, priority=BACKGROUND)
+        blocker.queue("blocker")
+        blocker.started.wait(5.0)
+        background = Record(log, pool=pool, priority=BACKGROUND)
+        background.queue("background")
+        interactive = Record(log, pool=pool, priority=INTERACTIVE)
+        interactive.queue("interactive")
+        # The interactive work does not wait for the background work
+        self.assertTrue(wait_for(interactive))
+        self.assertEqual(log, ["interactive"])
+        gate.set()
+        self.assertTrue(wait_for(blocker))
+        self.assertTrue(wait_for(background))
+        self.assertEqual(log, ["interactive", "blocker", "background"])
+
+    def test_stop(self):
+        calc = Spin(pool=WorkPool(1))
+        calc.queue()
+        calc.queue()
+        calc.started.wait(5.0)
+        calc.stop()
+        self.assertTrue(wait_for(calc))
+
+    def test_starved(self):
+        pool = WorkPool(1, starve_time=0.05)
+        self.assertFalse(pool.starved())
+        pool.heartbeat()
+        self.assertFalse(pool.starved())
+        time.sleep(0.1)
+        self.assertTrue(pool.starved())
+
+
+if __name__ == '__main__':
+    unittest.main()
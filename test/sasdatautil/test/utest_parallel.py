@@ -0,0 +1,44 @@
+"""
+    Unit tests for the worker pool settings
+"""
+
+import os
+import unittest
+import multiprocessing
+
+from sas.sascalc.data_util.parallel import get_workers
+
+ENV_NAME = 'SAS_TEST_WORKERS'
+
+
+class GetWorkersTests(unittest.TestCase):
+
+    def tearDown(self):
+        os.environ.pop(ENV_NAME, None)
+
+    def test_default(self):
+        self.assertEqual(get_workers(ENV_NAME), 1)
+        self.assertEqual(get_workers(ENV_NAME, 3), 3)
+        self.assertEqual(get_workers(ENV_NAME, 0),
+                         multiprocessing.cpu_count())
+
+    def test_environment(self):
+        os.environ[ENV_NAME] = '2'
+        self.assertEqual(get_workers(ENV_NAME, 1), 2)
+        os.environ[ENV_NAME] = '-1'
+        self.assertEqual(get_workers(ENV_NAME, 1),
+                         multiprocessing.cpu_count())
+        # A bad value falls back to the default
+        os.environ[ENV_NAME] = 'many'
+        self.assertEqual(get_workers(ENV_NAME, 1), 1)
+        self.assertEqual(get_workers(ENV_NAME, 4), 4)
+
+    def test_requested(self):
+        os.environ[ENV_NAME] = '2'
+        self.assertEqual(get_workers(ENV_NAME, 1, workers=5), 5)
+        self.assertEqual(get_workers(ENV_NAME, 1, workers=0),
+                         multiprocessing.cpu_count())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+    Unit tests for the headless batch fit runner
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+
+import numpy as np
+
+from sas.sascalc.fit.batch_fit import parse_parameter, parse_constraint, \
+    qualify_constraint, find_files, get_writer, run_batch, BatchFitJob, \
+    CSVResultWriter, JSONLinesResultWriter
+
+
+class ParseTests(unittest.TestCase):
+
+    def test_parse_parameter(self):
+        self.assertEqual(parse_parameter("radius"), ("radius", None, None))
+        self.assertEqual(parse_parameter(" radius =60"),
+                         ("radius", 60.0, None))
+        self.assertEqual(parse_parameter("radius=60:10:200"),
+                         ("radius", 60.0, (10.0, 200.0)))
+        self.assertEqual(parse_parameter("radius=60::200"),
+                         ("radius", 60.0, (-np.inf, 200.0)))
+        self.assertEqual(parse_parameter("radius=60:10:"),
+                         ("radius", 60.0, (10.0, np.inf)))
+
+    def test_parse_bad_parameter(self):
+        self.assertRaises(ValueError, parse_parameter, "=60")
+        self.assertRaises(ValueError, parse_parameter, "radius=60:10")
+        self.assertRaises(ValueError, parse_parameter, "radius=big")
+        self.assertRaises(ValueError, parse_parameter, "radius=60:a:200")
+
+    def test_parse_constraint(self):
+        self.assertEqual(parse_constraint("radius_pd = 0.1*radius"),
+                         ("radius_pd", "0.1*radius"))
+        self.assertRaises(ValueError, parse_constraint, "radius_pd=")
+        self.assertRaises(ValueError, parse_constraint, "=0.1*radius")
+        self.assertRaises(ValueError, parse_constraint, "radius_pd")
+
+    def test_qualify_constraint(self):
+        names = ["radius", "radius.width", "scale"]
+        self.assertEqual(
+            qualify_constraint("0.1*radius + radius.width*sqrt(scale)",
+                               "sphere", names),
+            "0.1*sphere.radius + sphere.radius.width*sqrt(sphere.scale)")
+        # Unknown and already qualified names are left alone
+        self.assertEqual(
+            qualify_constraint("sphere.radius + radius2 + 1e-3",
+                               "sphere", names),
+            "sphere.radius + radius2 + 1e-3")
+
+
+class FindFilesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        for name in ["b.txt", "a.txt", "c.xml"]:
+            open(os.path.join(self.tmpdir, name), "w").close()
+        os.mkdir(os.path.join(self.tmpdir, "d.txt"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_find_files(self):
+        join = lambda name: os.path.join(self.tmpdir, name)
+        files = find_files([join("*.txt"), join("a.*"), join("*.none")])
+        self.assertEqual(files, [join("a.txt"), join("b.txt")])
+        self.assertEqual(find_files([join("*.none")]), [])
+
+
+class WriterTests(unittest.TestCase):
+
+    columns = ["file", "success", "Chi2"]
+    row = {"file": "a.txt", "success": True, "Chi2": None}
+
+    def test_csv(self):
+        stream = StringIO()
+        writer = get_writer(stream, self.columns, fmt="csv")
+        self.assertTrue(isinstance(writer, CSVResultWriter))
+        writer.write(self.row)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines, ["file,success,Chi2", "a.txt,True,"])
+
+    def test_json_lines(self):
+        stream = StringIO()
+        writer = get_writer(stream, self.columns, path="results.jsonl")
+        self.assertTrue(isinstance(writer, JSONLinesResultWriter))
+        writer.write(self.row)
+        writer.write(dict(self.row, file="b.txt"))
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0]), self.row)
+        self.assertEqual(json.loads(lines[1])["file"], "b.txt")
+
+    def test_format(self):
+        self.assertTrue(isinstance(get_writer(StringIO(), self.columns),
+                                   CSVResultWriter))
+        self.assertRaises(ValueError, get_writer, StringIO(), self.columns,
+                          fmt="xls")
+
+
+class RunBatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.data_file = os.path.abspath("line_data.txt")
+        self.tmpdir = tempfile.mkdtemp()
+        self.bad_file = os.path.join(self.tmpdir, "bad.xyz")
+        with open(self.bad_file, "w") as bad:
+            bad.write("not data\x00\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_run_batch(self):
+        """
+        Fit a line to a data file, with a row for a file that fails to load
+        """
+        job = BatchFitJob("line", [("intercept", 1.0, None),
+                                   ("slope", 1.0, (0.0, 10.0))])
+        rows = list(run_batch(job, [self.data_file, self.bad_file],
+                              workers=1))
+        self.assertEqual(len(rows), 2)
+        good, bad = rows
+        self.assertEqual(set(good.keys()), set(job.columns()))
+        self.assertEqual(good["file"], self.data_file)
+        self.assertTrue(good["success"])
+        self.assertEqual(good["npts"], 10)
+        self.assertAlmostEqual(good["intercept"], 2.0, 3)
+        self.assertAlmostEqual(good["slope"], 3.0, 3)
+        self.assertEqual(bad["file"], self.bad_file)
+        self.assertFalse(bad["success"])
+        self.assertTrue(bad["error"])
+
+    def test_constraint(self):
+        """
+        Check the constrained parameter follows the fitted one
+        """
+        job = BatchFitJob("line", [("slope", 1.0, None)],
+                          fixed=[("intercept", 0.0)],
+                          constraints=[("intercept", "slope - 1")])
+        self.assertEqual(job.param_names, ["slope", "intercept"])
+        row = job(self.data_file)[0]
+        self.assertTrue(row["success"])
+        self.assertAlmostEqual(row["slope"], 3.0, 3)
+        self.assertAlmostEqual(row["intercept"], row["slope"] - 1, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
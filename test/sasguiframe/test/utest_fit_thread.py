@@ -0,0 +1,68 @@
+"""
+    Unit tests for the batch fit worker of the fit thread
+"""
+
+import cPickle
+import unittest
+
+import numpy as np
+
+from sasmodels.sasview_model import load_standard_models
+
+from sas.sascalc.dataloader.data_info import Data1D
+from sas.sascalc.fit.BumpsFitting import BumpsFit
+from sas.sasgui.perspectives.fitting.fit_thread import fit_worker, \
+    fit_failure
+
+
+def make_fitter():
+    """
+    Fitter of a line to exact data with intercept 2 and slope 3
+    """
+    model = [m for m in load_standard_models() if m.name == "line"][0]()
+    model.setParam("intercept", 1.0)
+    model.setParam("slope", 1.0)
+    x = np.linspace(0.01, 0.2, 20)
+    data = Data1D(x=x, y=2.0 + 3.0 * x, dy=0.01 * np.ones_like(x))
+    fitter = BumpsFit()
+    fitter.set_model(model, 0, ["intercept", "slope"], data=data)
+    fitter.set_data(data=data, id=0)
+    fitter.select_problem_for_fit(id=0, value=1)
+    return fitter
+
+
+class FitWorkerTests(unittest.TestCase):
+
+    def test_fit_worker(self):
+        """
+        Send a pickled fitter to the worker and check the fitted values
+        """
+        payload = cPickle.dumps(make_fitter(), cPickle.HIGHEST_PROTOCOL)
+        results = fit_worker(payload)
+        self.assertEqual(len(results), 1)
+        result = results[0]
+        self.assertTrue(result.success)
+        self.assertEqual(result.param_list, ["intercept", "slope"])
+        self.assertAlmostEqual(result.pvec[0], 2.0, 3)
+        self.assertAlmostEqual(result.pvec[1], 3.0, 3)
+        # The results must be sent back to the FitThread
+        cPickle.loads(cPickle.dumps(results, cPickle.HIGHEST_PROTOCOL))
+
+    def test_fit_failure(self):
+        """
+        Check a fit which raised an exception gives a failed result
+        """
+        fitter = make_fitter()
+        results = fit_failure(fitter, "fit failed")
+        self.assertEqual(len(results), 1)
+        result = results[0]
+        self.assertFalse(result.success)
+        self.assertEqual(result.mesg, "fit failed")
+        self.assertEqual(len(result.pvec), 2)
+        self.assertTrue(np.all(np.isnan(result.pvec)))
+        self.assertEqual(len(result.index), 20)
+        self.assertEqual(len(result.theory), np.sum(result.index))
+
+
+if __name__ == '__main__':
+    unittest.main()
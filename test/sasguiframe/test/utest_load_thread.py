@@ -0,0 +1,157 @@
+"""
+    Unit tests for the data loader thread
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from sas.sascalc.dataloader.loader import Loader
+from sas.sasgui.guiframe.data_manager import DataManager
+from sas.sasgui.guiframe.local_perspectives.data_loader.load_thread \
+    import DataReader
+from sas.sasgui.guiframe.local_perspectives.data_loader.data_loader \
+    import Plugin
+
+
+class GuiFrame(object):
+    """
+    Stand-in for the gui manager receiving the data of the data loader
+    """
+    def __init__(self):
+        self.data_manager = DataManager()
+        self.data_list = []
+
+    def create_gui_data(self, data, path=None):
+        return self.data_manager.create_gui_data(data, path)
+
+    def add_data(self, data_list):
+        self.data_list.append(data_list)
+
+
+class DataReaderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.paths = [os.path.abspath("cansas1d.xml")]
+        for i in range(5):
+            path = os.path.join(self.tmpdir, "curve_%d.txt" % i)
+            x = np.linspace(0.01, 0.1, 10 + i)
+            np.savetxt(path, np.column_stack([x, x**-2, 0.1 * x**-2]))
+            self.paths.append(path)
+        path = os.path.join(self.tmpdir, "unknown.xyz")
+        with open(path, 'w') as unknown:
+            unknown.write("not data\x00\n")
+        self.paths.insert(3, path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def load(self, **kwargs):
+        messages = []
+        batches = []
+        completed = {}
+
+        def update(output, message):
+            messages.append(message)
+
+        def complete(**kwargs):
+            completed.update(kwargs)
+
+        reader = DataReader(self.paths, Loader(),
+                            transform_data=lambda data, path: (path, data),
+                            updatefn=update, completefn=complete,
+                            batchfn=lambda output: batches.append(output),
+                            **kwargs)
+        reader.compute()
+        return messages, batches, completed
+
+    def test_sequential(self):
+        messages, batches, completed = self.load(batch_size=2)
+        self.assertEqual([path for path, _ in completed["output"]],
+                         self.paths[:3] + self.paths[4:])
+        self.assertEqual(len(messages), len(self.paths))
+        self.assertTrue(messages[3].startswith("Error while loading: "
+                                               + self.paths[3]))
+        self.assertTrue(completed["error_message"].startswith(
+            "Error while loading: " + self.paths[3]))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 2])
+        self.assertEqual(sum(batches, []), completed["output"])
+
+    def test_concurrent(self):
+        expected = self.load()
+        for max_in_flight in [1, 3, None]:
+            messages, batches, completed = self.load(
+                workers=2, max_in_flight=max_in_flight)
+            self.assertEqual(messages, expected[0])
+            self.assertEqual(len(batches), 1)
+            self.assertEqual(completed["error_message"],
+                             expected[2]["error_message"])
+            output = completed["output"]
+            self.assertEqual(len(output), len(expected[2]["output"]))
+            for (path, data), (ref_path, ref_data) in \
+                    zip(output, expected[2]["output"]):
+                self.assertEqual(path, ref_path)
+                np.testing.assert_array_equal(data.x, ref_data.x)
+                np.testing.assert_array_equal(data.y, ref_data.y)
+
+
+class GetDataTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(4):
+            path = os.path.join(self.tmpdir, "curve_%d.txt" % i)
+            x = np.linspace(0.01, 0.1, 10 + i)
+            np.savetxt(path, np.column_stack([x, x**-2, 0.1 * x**-2]))
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def get_data(self, paths, workers):
+        """
+        Load the files as the Load Data Folder menu does
+        """
+        plugin = Plugin()
+        plugin.parent = GuiFrame()
+        plugin.load_workers = workers
+        updates = []
+        completed = []
+        plugin.load_update = lambda **kwargs: updates.append(kwargs)
+        plugin.load_complete = lambda **kwargs: completed.append(kwargs)
+        plugin.get_data(paths)
+        self.assertEqual(len(completed), 1)
+        return plugin.parent, updates, completed[0]
+
+    def test_get_data(self):
+        for workers in [1, 2]:
+            parent, updates, completed = self.get_data(self.paths, workers)
+            self.assertEqual(completed["info"], "info")
+            output = completed["output"]
+            self.assertEqual(len(output), len(self.paths))
+            names = sorted(data.name for data in output.values())
+            self.assertEqual(names, sorted(os.path.basename(path)
+                                           for path in self.paths))
+            for data in output.values():
+                self.assertEqual(len(data.x), 10 + int(data.name[6]))
+            loaded = [update["message"] for update in updates
+                      if update["message"].startswith("Loaded")]
+            self.assertEqual(loaded, ["Loaded {}\n".format(path)
+                                      for path in self.paths])
+
+    def test_get_data_error(self):
+        path = os.path.join(self.tmpdir, "unknown.xyz")
+        with open(path, 'w') as unknown:
+            unknown.write("not data\x00\n")
+        parent, updates, completed = self.get_data(self.paths + [path], 2)
+        self.assertEqual(completed["info"], "error")
+        self.assertTrue(completed["output"] is None)
+
+
+if __name__ == '__main__':
+    unittest.main()
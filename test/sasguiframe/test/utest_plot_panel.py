@@ -0,0 +1,108 @@
+"""
+    Unit tests for the 2D image of the plot panel
+"""
+
+import unittest
+
+import numpy as np
+
+from sas.sasgui.plottools.PlotPanel import PlotPanel
+
+
+class ImagePanel(object):
+    """
+    The image building methods of PlotPanel, without the wx panel
+    """
+    _build_matrix = PlotPanel._build_matrix.im_func
+    _get_bins = PlotPanel._get_bins.im_func
+    _fillup_pixels = PlotPanel._fillup_pixels.im_func
+
+    def __init__(self, data, qx_data, qy_data):
+        self.data = data
+        self.qx_data = qx_data
+        self.qy_data = qy_data
+        self.x_bins = None
+        self.y_bins = None
+        self._matrix_cache = None
+
+
+def fillup_pixels_loop(image, weights):
+    """
+    Pixel by pixel filling of the empty pixels, as done before the
+    vectorized PlotPanel._fillup_pixels.  The loop used to wrap around
+    to the last row for the upper right neighbor of the first row: the
+    check is fixed here.
+    """
+    len_y = len(image)
+    len_x = len(image[1])
+    temp_image = np.zeros([len_y, len_x])
+    weit = np.zeros([len_y, len_x])
+    neighbors = [(-1, 0), (0, -1), (1, 0), (0, 1),
+                 (-1, -1), (1, -1), (-1, 1), (1, 1)]
+    for n_y in range(len_y):
+        for n_x in range(len_x):
+            if weights[n_y][n_x] > 0 or np.isfinite(image[n_y][n_x]):
+                continue
+            for d_y, d_x in neighbors:
+                y, x = n_y + d_y, n_x + d_x
+                if 0 <= y < len_y and 0 <= x < len_x \
+                        and np.isfinite(image[y][x]):
+                    temp_image[n_y][n_x] += image[y][x]
+                    weit[n_y][n_x] += 1
+    ind = (weit > 0)
+    image[ind] = temp_image[ind] / weit[ind]
+    return image
+
+
+class PlotPanelImageTests(unittest.TestCase):
+
+    def test_fillup_pixels(self):
+        """
+        Compare the vectorized filling with the pixel by pixel loop
+        """
+        rng = np.random.RandomState(1)
+        image = rng.uniform(1.0, 2.0, (6, 7))
+        # Masked pixels on the edges, in the corners and in a block
+        # without any filled neighbor
+        mask = rng.uniform(size=image.shape) < 0.3
+        mask[0, 0] = mask[0, -1] = mask[-1, 0] = mask[-1, -1] = True
+        mask[2:5, 2:5] = True
+        mask[1, 1] = False
+        image[mask] = np.nan
+        weights = (~mask).astype(float)
+        expected = fillup_pixels_loop(image.copy(), weights)
+        result = PlotPanel._fillup_pixels.im_func(None, image.copy(),
+                                                  weights)
+        np.testing.assert_array_equal(result, expected)
+        # The center of the block has no filled neighbor
+        self.assertTrue(np.isnan(result[3, 3]))
+        self.assertTrue(np.isfinite(result[0, 0]))
+
+    def test_matrix_cache(self):
+        """
+        Check the image is only built again when the data change
+        """
+        qx, qy = np.meshgrid(np.linspace(-0.1, 0.1, 10),
+                             np.linspace(-0.1, 0.1, 10))
+        keep = np.ones(qx.shape, dtype=bool)
+        keep[3:6, 4:7] = False
+        data = np.arange(qx.size, dtype=float)[keep.ravel()]
+        panel = ImagePanel(data, qx[keep], qy[keep])
+        image = panel._build_matrix()
+        cached = panel._matrix_cache
+        # The returned image may be modified by the log scale
+        image[...] = -1.0
+        again = panel._build_matrix()
+        self.assertTrue(panel._matrix_cache is cached)
+        np.testing.assert_array_equal(again, cached[1])
+        self.assertFalse((again == -1.0).any())
+        # Changing the data in place builds a new image
+        panel.data[:] *= 2.0
+        changed = panel._build_matrix()
+        self.assertFalse(panel._matrix_cache is cached)
+        finite = np.isfinite(cached[1])
+        np.testing.assert_allclose(changed[finite], 2.0 * cached[1][finite])
+
+
+if __name__ == '__main__':
+    unittest.main()
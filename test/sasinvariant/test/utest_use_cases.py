@@ -4,6 +4,7 @@
 """
 #TODO: there's no test for smeared extrapolation
 import unittest
+import numpy
 from sas.sascalc.dataloader.loader import  Loader
 from sas.sascalc.invariant import invariant
 
@@ -369,6 +370,140 @@ class TestInvPinholeSmear(unittest.TestCase):
         # Test results
         self.assertAlmostEquals(qstar, 0.00460319,3)
       
+
+class TestExtrapolationCache(unittest.TestCase):
+    """
+        Test the reuse of the Q* computations
+    """
+    def setUp(self):
+        self.data = Loader().load("PolySpheres.txt")[0]
+
+    def test_unchanged(self):
+        """
+            Repeated calls give the same results and reuse the fits
+        """
+        inv = invariant.InvariantCalculator(data=self.data)
+        inv.set_extrapolation(range='low', npts=10, function='guinier')
+        inv.set_extrapolation(range='high', npts=10, function='power_law')
+        qstar = inv.get_qstar(extrapolation='both')
+        radius = inv._low_extrapolation_function.radius
+        power = inv.get_extrapolation_power(range='high')
+        entries = dict(inv._cache)
+        self.assertEqual(sorted(entries.keys()), ['data', 'high', 'low'])
+
+        # Scramble the fitted parameters: they are restored from the cache
+        inv._low_extrapolation_function.radius = 1.0
+        inv._high_extrapolation_function.power = 1.0
+        self.assertEqual(inv.get_qstar(extrapolation='both'), qstar)
+        self.assertEqual(inv._low_extrapolation_function.radius, radius)
+        self.assertEqual(inv.get_extrapolation_power(range='high'), power)
+        for name, entry in entries.items():
+            self.assertTrue(inv._cache[name] is entry)
+
+    def test_invalidation(self):
+        """
+            Changing the extrapolation settings or the data recomputes Q*
+        """
+        inv = invariant.InvariantCalculator(data=self.data)
+        inv.set_extrapolation(range='low', npts=10, function='guinier')
+        inv.set_extrapolation(range='high', npts=10, function='power_law')
+        inv.get_qstar(extrapolation='both')
+
+        inv.set_extrapolation(range='high', npts=20, function='power_law')
+        qstar = inv.get_qstar(extrapolation='both')
+        fresh = invariant.InvariantCalculator(data=self.data)
+        fresh.set_extrapolation(range='low', npts=10, function='guinier')
+        fresh.set_extrapolation(range='high', npts=20, function='power_law')
+        self.assertEqual(qstar, fresh.get_qstar(extrapolation='both'))
+
+        inv.set_extrapolation(range='low', npts=10, function='power_law',
+                              power=4)
+        low = inv._cache['low']
+        inv.get_qstar(extrapolation='low')
+        self.assertFalse(inv._cache['low'] is low)
+
+        data = inv.get_data()
+        data.y[0] *= 2
+        entry = inv._cache['data']
+        inv.get_qstar()
+        self.assertFalse(inv._cache['data'] is entry)
+
+    def test_vectorized_sums(self):
+        """
+            The Q* sums match the explicit loops they replace
+        """
+        inv = invariant.InvariantCalculator(data=self.data)
+        x, y, dy = self.data.x, self.data.y, self.data.dy
+        n = len(x)
+        qstar = x[0] * x[0] * y[0] * (x[1] - x[0]) / 2
+        qstar += x[n - 1] * x[n - 1] * y[n - 1] * (x[n - 1] - x[n - 2]) / 2
+        err = (x[0] * x[0] * dy[0] * (x[1] - x[0]) / 2) ** 2
+        err += (x[n - 1] * x[n - 1] * dy[n - 1] * (x[n - 1] - x[n - 2]) / 2) ** 2
+        # Same interior range as the original loop
+        for i in xrange(1, n - 2):
+            dxi = (x[i + 1] - x[i - 1]) / 2.0
+            qstar += x[i] * x[i] * y[i] * dxi
+            err += (x[i] * x[i] * dy[i] * dxi) ** 2
+        self.assertAlmostEqual(inv._get_qstar(inv.get_data()) / qstar, 1.0, 12)
+        self.assertAlmostEqual(
+            inv._get_qstar_uncertainty(inv.get_data()) / err ** 0.5, 1.0, 12)
+
+
+class TestBatchInvariant(unittest.TestCase):
+    """
+        Test the invariant of a series of curves against the
+        single curve calculator
+    """
+    def setUp(self):
+        data = Loader().load("PolySpheres.txt")[0]
+        self.curves = []
+        for i in range(5):
+            curve = invariant.LoaderData1D(
+                x=data.x.copy(), y=data.y * numpy.exp(-0.2 * i * data.x ** 2),
+                dy=data.dy * (1 + 0.1 * i))
+            self.curves.append(curve)
+
+    def check(self, low, high, extrapolation, power=None):
+        batch = invariant.BatchInvariantCalculator(self.curves, background=1e-3,
+                                                   scale=2, chunk_size=2)
+        batch.set_extrapolation(range='low', npts=10, function=low, power=power)
+        batch.set_extrapolation(range='high', npts=10, function='power_law',
+                                power=high)
+        qstar, dqstar = batch.get_qstar_with_error(extrapolation)
+        v, dv = batch.get_volume_fraction_with_error(2.6e-6, extrapolation)
+        s, ds = batch.get_surface_with_error(2.6e-6, 2, extrapolation)
+        for i, curve in enumerate(self.curves):
+            inv = invariant.InvariantCalculator(curve, background=1e-3, scale=2)
+            inv.set_extrapolation(range='low', npts=10, function=low,
+                                  power=power)
+            inv.set_extrapolation(range='high', npts=10, function='power_law',
+                                  power=high)
+            expected = inv.get_qstar_with_error(extrapolation)
+            expected += inv.get_volume_fraction_with_error(2.6e-6, extrapolation)
+            expected += inv.get_surface_with_error(2.6e-6, 2, extrapolation)
+            numpy.testing.assert_allclose([qstar[i], dqstar[i], v[i], dv[i],
+                                           s[i], ds[i]], expected, rtol=1e-10)
+            if extrapolation in ('high', 'both'):
+                numpy.testing.assert_allclose(
+                    batch.get_extrapolation_power('high')[i],
+                    inv.get_extrapolation_power('high'), rtol=1e-10)
+
+    def test_no_extrapolation(self):
+        self.check('guinier', None, None)
+
+    def test_guinier_power_law(self):
+        self.check('guinier', None, 'both')
+
+    def test_fixed_powers(self):
+        self.check('power_law', 4, 'both', power=4)
+
+    def test_incompatible_data(self):
+        curve = invariant.LoaderData1D(x=self.curves[0].x * 2,
+                                       y=self.curves[0].y)
+        self.assertRaises(ValueError, invariant.BatchInvariantCalculator,
+                          self.curves + [curve])
+        self.assertRaises(ValueError, invariant.BatchInvariantCalculator, [])
+
   
 if __name__ == '__main__':
     unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))